@@ -0,0 +1,26 @@
+-- Migration 001, reversed
+USE event_ticketing;
+
+-- MySQL drops the implicit foreign key index once another index can
+-- serve the key, so put single-column ones back in the same statement
+
+ALTER TABLE EVENT
+    ADD INDEX idx_event_organizer_email (organizer_email),
+    ADD INDEX idx_event_venue (venue_id),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE EVENT
+    DROP INDEX idx_event_date,
+    DROP INDEX idx_event_status_date,
+    DROP INDEX idx_event_venue_date,
+    DROP INDEX idx_event_organizer_date,
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE VENUE DROP INDEX idx_venue_city, ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE PURCHASE
+    ADD INDEX idx_purchase_customer (customer_id),
+    DROP INDEX idx_purchase_customer_date,
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+DELETE FROM SCHEMA_MIGRATIONS WHERE version = 1;
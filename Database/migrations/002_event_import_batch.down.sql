@@ -0,0 +1,12 @@
+-- Migration 002, reversed
+USE event_ticketing;
+
+ALTER TABLE EVENT
+    DROP INDEX idx_event_import_batch,
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE EVENT
+    DROP COLUMN import_batch,
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+DELETE FROM SCHEMA_MIGRATIONS WHERE version = 2;
@@ -0,0 +1,18 @@
+-- Migration 002: batch key for the bulk event import
+-- Apply after 001:   mysql event_ticketing < Database/migrations/002_event_import_batch.sql
+-- Undo:              mysql event_ticketing < Database/migrations/002_event_import_batch.down.sql
+--
+-- MySQL has no INSERT ... RETURNING, so the import stamps each chunk's
+-- rows with a key and reads their ids back through this index.
+-- Adding a nullable column is an instant change in MySQL 8.
+USE event_ticketing;
+
+ALTER TABLE EVENT
+    ADD COLUMN import_batch CHAR(32) NULL,
+    ALGORITHM=INSTANT;
+
+ALTER TABLE EVENT
+    ADD INDEX idx_event_import_batch (import_batch),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+INSERT INTO SCHEMA_MIGRATIONS (version, description) VALUES (2, 'event import batch');
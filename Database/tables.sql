@@ -34,7 +34,8 @@ CREATE TABLE EVENT (
     status ENUM('Upcoming', 'Ongoing', 'Completed', 'Cancelled') DEFAULT 'Upcoming',
     FOREIGN KEY (category_id) REFERENCES CATEGORY(category_id) ON DELETE RESTRICT,
     FOREIGN KEY (venue_id) REFERENCES VENUE(venue_id) ON DELETE RESTRICT,
-    CHECK (tickets_sold <= total_tickets)
+    CHECK (tickets_sold <= total_tickets),
+    INDEX idx_event_organizer_email (organizer_email)
 );
 
 
@@ -82,3 +83,65 @@ CREATE TABLE PURCHASE_TICKET (
 ALTER TABLE CUSTOMER
 ADD COLUMN password_hash VARCHAR(255) NOT NULL AFTER email,
 ADD COLUMN role VARCHAR(20) NOT NULL DEFAULT 'user' AFTER password_hash;
+
+
+-- sales rollups for the admin dashboard (kept current by the purchase /
+-- refund write path; rebuild with `flask rebuild-sales-rollups`)
+CREATE TABLE EVENT_SALES (
+    event_id INT PRIMARY KEY,
+    tickets_sold INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    purchases INT NOT NULL DEFAULT 0,
+    tickets_refunded INT NOT NULL DEFAULT 0,
+    refunded_amount DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    FOREIGN KEY (event_id) REFERENCES EVENT(event_id) ON DELETE CASCADE
+);
+
+
+CREATE TABLE TICKET_SALES (
+    ticket_id INT PRIMARY KEY,
+    event_id INT NOT NULL,
+    tickets_sold INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    tickets_refunded INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (ticket_id) REFERENCES TICKET(ticket_id) ON DELETE CASCADE,
+    INDEX idx_ticket_sales_event (event_id)
+);
+
+
+CREATE TABLE EVENT_SALES_HOURLY (
+    event_id INT NOT NULL,
+    hour DATETIME NOT NULL,
+    tickets_sold INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (event_id, hour),
+    FOREIGN KEY (event_id) REFERENCES EVENT(event_id) ON DELETE CASCADE
+);
+
+
+-- seat holds (cart reservations): a hold's seats are already taken out
+-- of TICKET.quantity_available; checkout claims them, and expired holds
+-- are put back on sale by `flask expire-holds` / the hold and purchase
+-- write paths
+CREATE TABLE SEAT_HOLD (
+    customer_id INT NOT NULL,
+    ticket_id INT NOT NULL,
+    quantity INT NOT NULL CHECK (quantity > 0),
+    expires_at DATETIME NOT NULL,
+    PRIMARY KEY (customer_id, ticket_id),
+    FOREIGN KEY (customer_id) REFERENCES CUSTOMER(customer_id) ON DELETE CASCADE,
+    FOREIGN KEY (ticket_id) REFERENCES TICKET(ticket_id) ON DELETE CASCADE,
+    INDEX idx_seat_hold_expires (expires_at)
+);
+
+
+-- catalog edits, appended by every writer in the edit's own transaction;
+-- each app process polls it to keep its search index / suggester current
+-- (services/catalog_changes.py); writers prune rows older than an hour
+CREATE TABLE CATALOG_CHANGE (
+    change_id INT PRIMARY KEY AUTO_INCREMENT,
+    event_id INT,
+    venue_id INT,
+    changed_at DATETIME NOT NULL,
+    INDEX idx_catalog_change_time (changed_at)
+);
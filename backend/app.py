@@ -2,6 +2,8 @@ from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 
+from backend.commands import register_commands
+from backend.config import Config
 from backend.db import init_db
 
 # ROUTE BLUEPRINTS
@@ -15,14 +17,43 @@ from backend.routes.purchases import purchases_bp
 from backend.routes.event_details import event_details_bp
 from backend.routes.event_tickets import event_tickets_bp
 from backend.routes.admin_events import admin_bp
-
-
-def create_app():
+from backend.routes.holds import holds_bp
+from backend.routes.metrics import metrics_bp
+from backend.routes.exports import exports_bp
+from backend.services.hashing import init_hasher
+from backend.services.holds import init_holds
+from backend.services.identity import init_identity
+from backend.services.reference_data import init_reference_data
+from backend.services.search_index import init_search_index
+from backend.services.suggest import init_suggest
+from backend.utils.conditional import init_conditional
+from backend.utils.json_provider import init_json
+from backend.utils.latency import init_latency
+from backend.utils.sql_metrics import init_sql_metrics
+
+
+def create_app(test_config=None):
     app = Flask(__name__)
+    app.config.from_object(Config)
 
-    CORS(app)
+    # allow tests / scripts to point the app at another database
+    if test_config:
+        app.config.from_mapping(test_config)
 
+    # let the browser read the paging headers of the list endpoints
+    CORS(app, expose_headers=["X-Next-Cursor", "Link"])
+
+    init_json(app)
     init_db(app)
+    init_sql_metrics(app)
+    init_latency(app)
+    init_hasher(app)
+    init_holds(app)
+    init_identity(app)
+    init_reference_data(app)
+    init_search_index(app)
+    init_suggest(app)
+    init_conditional(app)
 
     app.config["JWT_SECRET_KEY"] = "jwt_secret_key"
     JWTManager(app)
@@ -54,9 +85,21 @@ def create_app():
     # PURCHASES
     app.register_blueprint(purchases_bp, url_prefix="/api/purchases")
 
+    # SEAT HOLDS (cart reservations)
+    app.register_blueprint(holds_bp, url_prefix="/api/holds")
+
+    # ADMIN METRICS
+    app.register_blueprint(metrics_bp, url_prefix="/api/admin/metrics")
+
+    # ADMIN EXPORTS
+    app.register_blueprint(exports_bp, url_prefix="/api/admin/exports")
+
     # ADMIN CRUD
     app.register_blueprint(admin_bp, url_prefix="/api/admin")
 
+    # CLI: flask export-purchases ...
+    register_commands(app)
+
     @app.route("/")
     def home():
         return "API is running"
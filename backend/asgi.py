@@ -0,0 +1,112 @@
+# backend/asgi.py
+"""
+ASGI entry point: the read-only catalog on asyncio, everything else on
+the Flask app, in one process.
+
+    uvicorn --factory backend.asgi:create_asgi_app --workers 4
+
+GET / HEAD requests for the catalog (backend/routes/catalog_async.py) run
+as coroutines on an async SQLAlchemy engine, so a slow query parks a
+coroutine instead of a worker thread. Every other request -- auth,
+purchases, holds, admin -- falls through to the create_app() Flask app,
+mounted as WSGI and run in a threadpool, exactly as before.
+
+Both sides share the process and its in-memory state, kept current by
+the signals Flask's writes send. With several workers (--workers N) each
+has its own copy, and edits made in another worker arrive:
+
+    seat holds                rows in SEAT_HOLD, so right away
+    search index, suggester   from the CATALOG_CHANGE log, within
+                              CATALOG_POLL_SECONDS (services/catalog_changes.py)
+    categories / venues       when the cached copy expires
+                              (REFERENCE_CACHE_TTL, default 300 s)
+    ETags                     per process, so a worker may answer 304 for
+                              up to ETAG_WINDOW_SECONDS (default 60 s) after
+                              an edit made elsewhere
+
+The async engines come from the same settings as the sync ones
+(backend/config.py): SQLALCHEMY_DATABASE_URI with its driver swapped for
+an asyncio one (ASYNC_DRIVERS; or set ASYNC_DATABASE_URI), the DB_POOL_*
+options, and SQLALCHEMY_REPLICA_URIS -- catalog reads prefer a replica
+unless the client carries the sticky-after-write cookie (backend/db.py).
+
+Extra dependencies: starlette, uvicorn, greenlet and an asyncio driver
+(aiomysql; aiosqlite for SQLite).
+"""
+import contextlib
+import random
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.wsgi import WSGIMiddleware
+from starlette.routing import Mount
+
+from backend.app import create_app
+from backend.db import engine_options, pinned_to_primary
+from backend.routes.catalog_async import build_search_index, catalog_routes
+
+# sync driver -> asyncio driver for the same database
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+class CatalogEngines:
+    """The async primary + replica engines the catalog routes read from."""
+
+    def __init__(self, primary, replicas=()):
+        self.primary = primary
+        self.replicas = list(replicas)
+
+    def for_request(self, request):
+        if self.replicas and not pinned_to_primary(request.cookies):
+            return random.choice(self.replicas)
+        return self.primary
+
+    async def dispose(self):
+        for engine in [self.primary, *self.replicas]:
+            await engine.dispose()
+
+
+def async_uri(uri):
+    url = make_url(uri)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        raise ValueError(f"No asyncio driver known for {url.drivername!r}; set ASYNC_DATABASE_URI")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_engines(config):
+    def engine(uri):
+        return create_async_engine(uri, **engine_options(uri, config))
+
+    primary = config.get("ASYNC_DATABASE_URI") or async_uri(config["SQLALCHEMY_DATABASE_URI"])
+    replicas = [async_uri(uri) for uri in config.get("SQLALCHEMY_REPLICA_URIS") or []]
+    return CatalogEngines(engine(primary), [engine(uri) for uri in replicas])
+
+
+def create_asgi_app(test_config=None, flask_app=None):
+    flask_app = flask_app or create_app(test_config)
+    engines = create_async_engines(flask_app.config)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        # build the search index before the first search needs it
+        await run_in_threadpool(build_search_index, flask_app)
+        yield
+        await engines.dispose()
+
+    app = Starlette(
+        routes=[*catalog_routes(), Mount("/", app=WSGIMiddleware(flask_app))],
+        lifespan=lifespan,
+    )
+    app.state.flask_app = flask_app
+    app.state.db = engines
+    return app
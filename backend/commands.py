@@ -0,0 +1,181 @@
+# backend/commands.py
+"""
+Flask CLI commands (run with FLASK_APP=backend.app:create_app):
+
+    flask export-purchases backend/exports/purchases_export.csv [--gzip] [--full]
+    flask expire-holds
+    flask rebuild-sales-rollups
+    flask reconcile-inventory [--repair] [--checkpoint FILE] [--pause 0.1]
+    flask generate-data --scale medium [--seed 42] [--out DIR]
+    flask index-advisor [--path /api/events/?limit=50 ...] [--all] [--json]
+"""
+import json
+from datetime import datetime
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from backend.services.holds import EXPIRE_BATCH_SIZE, get_holds
+from backend.services.index_advisor import format_report, replay_and_advise
+from backend.services.purchase_export import export_purchases
+from backend.services.reconcile import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PAUSE_SECONDS,
+    reconcile_inventory,
+)
+from backend.services.sales_rollups import rebuild_rollups
+from backend.services.synthetic_data import (
+    AS_OF,
+    DEFAULT_CHUNK_SIZE as GENERATE_CHUNK_SIZE,
+    SCALES,
+    CsvSink,
+    GenerationError,
+    InsertSink,
+    generate,
+)
+
+
+def register_commands(app):
+    app.cli.add_command(export_purchases_command)
+    app.cli.add_command(expire_holds_command)
+    app.cli.add_command(rebuild_sales_rollups_command)
+    app.cli.add_command(reconcile_inventory_command)
+    app.cli.add_command(generate_data_command)
+    app.cli.add_command(index_advisor_command)
+
+
+@click.command("export-purchases")
+@click.argument("output", type=click.Path(dir_okay=False))
+@click.option("--gzip", "compress", is_flag=True, help="Write gzip-compressed CSV.")
+@click.option("--full", is_flag=True, help="Ignore the watermark and export everything again.")
+@with_appcontext
+def export_purchases_command(output, compress, full):
+    """
+    Append purchases made since the last run to OUTPUT (CSV).
+
+    Purchases younger than EXPORT_COMMIT_LAG_SECONDS (60) wait for the
+    next run. A run that dies is undone and redone by the next one.
+    """
+    result = export_purchases(output, compress=compress, full=full)
+    click.echo(
+        f"exported {result['rows']} rows (purchases {result['from_purchase_id'] + 1}"
+        f"..{result['last_purchase_id']}) to {result['output']}"
+    )
+
+
+@click.command("expire-holds")
+@with_appcontext
+def expire_holds_command():
+    """
+    Put the seats of expired seat holds back on sale.
+
+    Run it every minute or so: the hold and purchase endpoints only sweep
+    when someone holds or buys. Safe to run alongside the app.
+    """
+    holds = get_holds()
+    expired = 0
+    while True:
+        batch = holds.expire()
+        expired += batch
+        if batch < EXPIRE_BATCH_SIZE:
+            break
+    click.echo(f"expired {expired} holds")
+
+
+@click.command("rebuild-sales-rollups")
+@with_appcontext
+def rebuild_sales_rollups_command():
+    """
+    Recompute the admin dashboard sales rollups from PURCHASE_TICKET.
+
+    Locks every ticket tier (SELECT ... FOR UPDATE; SQLite's write lock)
+    until it commits, so purchases and refunds wait rather than being lost.
+    On a database with neither, pause writes while it runs.
+    """
+    rows = rebuild_rollups()
+    click.echo(f"rebuilt sales rollups from {rows} purchase lines")
+
+
+@click.command("reconcile-inventory")
+@click.option("--repair", is_flag=True, help="Fix EVENT.tickets_sold drift (default: report only).")
+@click.option("--chunk-size", default=DEFAULT_CHUNK_SIZE, show_default=True,
+              help="Events checked per transaction.")
+@click.option("--pause", default=DEFAULT_PAUSE_SECONDS, show_default=True,
+              help="Seconds to sleep between chunks.")
+@click.option("--checkpoint", type=click.Path(dir_okay=False),
+              help="Progress file; an interrupted run resumes from it.")
+@with_appcontext
+def reconcile_inventory_command(repair, chunk_size, pause, checkpoint):
+    """Compare inventory counters with PURCHASE_TICKET, event by event."""
+    def report(drift):
+        action = " -> repaired" if drift.repaired else ""
+        click.echo(f"event {drift.event_id}: {drift.kind} is {drift.stored}, "
+                   f"expected {drift.expected}{action}")
+
+    result = reconcile_inventory(chunk_size=chunk_size, pause=pause, repair=repair,
+                                 checkpoint=checkpoint, on_drift=report)
+    click.echo(f"checked {result['events']} events after event {result['resumed_from']}: "
+               f"{len(result['drift'])} problems, {result['repaired']} repaired")
+
+
+@click.command("generate-data")
+@click.option("--scale", type=click.Choice(list(SCALES)), default="small", show_default=True,
+              help="Preset row counts; --events / --customers / --purchases override it.")
+@click.option("--events", type=int)
+@click.option("--customers", type=int)
+@click.option("--purchases", type=int)
+@click.option("--seed", default=42, show_default=True, help="Same seed, same rows.")
+@click.option("--as-of", type=click.DateTime(["%Y-%m-%d"]), default=AS_OF.strftime("%Y-%m-%d"),
+              show_default=True, help='The "today" event dates and sales are spread around.')
+@click.option("--out", "out_dir", type=click.Path(file_okay=False),
+              help="Write CSV files + load.sql (MySQL LOAD DATA) here instead of inserting.")
+@click.option("--chunk-size", default=GENERATE_CHUNK_SIZE, show_default=True,
+              help="Rows per INSERT batch / commit.")
+@with_appcontext
+def generate_data_command(scale, events, customers, purchases, seed, as_of, out_dir, chunk_size):
+    """Fill an empty database with realistic synthetic data."""
+    counts = dict(SCALES[scale])
+    for name, value in (("events", events), ("customers", customers), ("purchases", purchases)):
+        if value is not None:
+            counts[name] = value
+
+    sink = CsvSink(out_dir) if out_dir else InsertSink(chunk_size)
+    started = datetime.now()
+    try:
+        if not out_dir:
+            sink.check_empty()
+        summary = generate(sink, seed=seed, as_of=as_of, progress=click.echo, **counts)
+    except GenerationError as e:
+        raise click.ClickException(str(e))
+
+    if out_dir:
+        click.echo(f"wrote CSV files and load.sql to {out_dir}; "
+                   f"after loading, run `flask rebuild-sales-rollups`")
+    else:
+        click.echo(f"rebuilt sales rollups from {rebuild_rollups()} purchase lines")
+    click.echo(", ".join(f"{k} {v}" for k, v in summary.items())
+               + f" ({(datetime.now() - started).total_seconds():.0f}s)")
+
+
+@click.command("index-advisor")
+@click.option("--path", "paths", multiple=True,
+              help="GET path to replay (repeatable); default: the hot catalog / admin reads.")
+@click.option("--all", "show_all", is_flag=True, help="Also list shapes whose plans look fine.")
+@click.option("--json", "as_json", is_flag=True, help="Print the full report as JSON.")
+@with_appcontext
+def index_advisor_command(paths, show_all, as_json):
+    """Replay hot reads, EXPLAIN their queries, report scans and missing indexes.
+
+    Exits 1 when it suggests an index.
+    """
+    if "sql_metrics" not in current_app.extensions:
+        raise click.ClickException("needs SQL_METRICS_ENABLED (it captures the query shapes)")
+    report = replay_and_advise(list(paths) or None)
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2, default=str))
+    else:
+        click.echo(format_report(report, show_all) or "no full scans or temp sorts")
+    if any(s.startswith("CREATE INDEX") for entry in report for s in entry["suggestions"]):
+        raise SystemExit(1)
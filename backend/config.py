@@ -3,8 +3,35 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_bool(name, default):
+    value = os.getenv(name)
+    return value.lower() in ("1", "true", "yes", "on") if value not in (None, "") else default
+
+
+# loaded by create_app() before any test / script overrides
 class Config:
     SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASS')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = os.getenv("SECRET_KEY", "secret-key")
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt-secret-key")
+
+    # read replicas for the catalog endpoints (comma-separated URIs)
+    SQLALCHEMY_REPLICA_URIS = [u.strip() for u in os.getenv("DB_REPLICA_URIS", "").split(",") if u.strip()]
+    DB_REPLICA_STICKY_SECONDS = _env_int("DB_REPLICA_STICKY_SECONDS", 5)
+
+    # connection pool (see backend/db.py)
+    DB_POOL_SIZE = _env_int("DB_POOL_SIZE", 10)
+    DB_MAX_OVERFLOW = _env_int("DB_MAX_OVERFLOW", 20)
+    DB_POOL_TIMEOUT = _env_int("DB_POOL_TIMEOUT", 30)
+    DB_POOL_RECYCLE = _env_int("DB_POOL_RECYCLE", 1800)
+    DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+    DB_CONNECT_TIMEOUT = _env_int("DB_CONNECT_TIMEOUT", 10)
+
+    # jsonify() / row encoder backend: auto (orjson if installed) | orjson | stdlib
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto")
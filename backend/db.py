@@ -1,22 +1,131 @@
-import os
+"""
+Database setup: the shared `db` object, connection pooling and
+read-replica routing.
+
+Settings come from backend/config.py (environment variables):
+
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING, DB_CONNECT_TIMEOUT      -> pool / driver options
+    DB_REPLICA_URIS                            -> comma-separated replicas
+
+Replicas are registered as extra binds ("replica_0", "replica_1", ...).
+During a GET / HEAD request to one of the read-only catalog blueprints
+(REPLICA_BLUEPRINTS), plain SELECTs go to one replica picked for that
+request. Everything else uses the primary:
+
+* any write (flush, INSERT / UPDATE / DELETE) and SELECT ... FOR UPDATE
+* every statement after the first write in the same session
+* requests from a client that wrote something in the last
+  DB_REPLICA_STICKY_SECONDS seconds (a cookie set on its write
+  response), so users read their own writes despite replica lag
+"""
+import random
+import time
+
+from flask import current_app, g, has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
-from dotenv import load_dotenv
+from flask_sqlalchemy.session import Session
 
-load_dotenv()
+# catalog blueprints whose GETs may read from a replica
+REPLICA_BLUEPRINTS = {
+    "events", "event_details", "event_tickets", "categories", "venues", "tickets", "search",
+}
 
-db = SQLAlchemy()
+STICKY_COOKIE = "db_primary_until"
 
-def init_db(app):
-    user = os.getenv("DB_USER")
-    password = os.getenv("DB_PASS")
-    host = os.getenv("DB_HOST")
-    name = os.getenv("DB_NAME")
-
-    # Build SQLAlchemy connection string
-    app.config["SQLALCHEMY_DATABASE_URI"] = (
-        f"mysql+pymysql://{user}:{password}@{host}/{name}"
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or not _is_plain_select(clause):
+                self.info["wrote"] = True
+                if has_request_context():
+                    g.db_wrote = True
+            elif not self.info.get("wrote"):
+                replica = _request_replica(self._db)
+                if replica is not None:
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _is_plain_select(clause):
+    return (
+        clause is not None
+        and getattr(clause, "is_select", False)
+        and getattr(clause, "_for_update_arg", None) is None
     )
 
+
+def _request_replica(db):
+    if not has_request_context():
+        return None
+    key = g.get("db_replica")
+    return db.engines[key] if key else None
+
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+
+
+def init_db(app):
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+    uri = app.config["SQLALCHEMY_DATABASE_URI"]
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(uri, app.config))
+
+    replicas = app.config.get("SQLALCHEMY_REPLICA_URIS") or []
+    binds = app.config.setdefault("SQLALCHEMY_BINDS", {})
+    for i, replica_uri in enumerate(replicas):
+        binds[f"replica_{i}"] = {"url": replica_uri, **engine_options(replica_uri, app.config)}
+    app.extensions["db_replicas"] = [f"replica_{i}" for i in range(len(replicas))]
+
     db.init_app(app)
+    # init_app registers a (process-wide) MetaData per bind key; replicas
+    # mirror the primary's tables, so create_all/drop_all must not visit them
+    for key in app.extensions["db_replicas"]:
+        db.metadatas.pop(key, None)
+
+    if replicas:
+        app.before_request(_choose_replica)
+        app.after_request(_stick_to_primary_after_write)
+
+
+def engine_options(uri, config):
+    """Pool / driver options for one database URI."""
+    options = {
+        "pool_pre_ping": config.get("DB_POOL_PRE_PING", True),
+        "pool_recycle": config.get("DB_POOL_RECYCLE", 1800),
+    }
+    if uri.startswith("sqlite"):
+        return options  # file / memory databases: no server connections to size
+
+    options.update(
+        pool_size=config.get("DB_POOL_SIZE", 10),
+        max_overflow=config.get("DB_MAX_OVERFLOW", 20),
+        pool_timeout=config.get("DB_POOL_TIMEOUT", 30),
+    )
+    if config.get("DB_CONNECT_TIMEOUT") and uri.startswith("mysql"):
+        options["connect_args"] = {"connect_timeout": config["DB_CONNECT_TIMEOUT"]}
+    return options
+
+
+def _choose_replica():
+    g.db_replica = None
+    if request.method not in ("GET", "HEAD") or request.blueprint not in REPLICA_BLUEPRINTS:
+        return
+    if pinned_to_primary(request.cookies):
+        return
+    g.db_replica = random.choice(current_app.extensions["db_replicas"])
+
+
+def pinned_to_primary(cookies):
+    """Did this client write recently enough that it must read the primary?"""
+    sticky_until = cookies.get(STICKY_COOKIE, "")
+    return sticky_until.isdigit() and int(sticky_until) > time.time()
+
+
+def _stick_to_primary_after_write(response):
+    if g.get("db_wrote") and request.method not in ("GET", "HEAD"):
+        seconds = current_app.config.get("DB_REPLICA_STICKY_SECONDS", 5)
+        response.set_cookie(STICKY_COOKIE, str(int(time.time() + seconds)),
+                            max_age=seconds, httponly=True, samesite="Lax")
+    return response
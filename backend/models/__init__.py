@@ -5,5 +5,12 @@ from .customer import (
     Event,
     Purchase,
     PurchaseTicket,
+    SeatHold,
     Ticket
 )
+from .sales import (
+    EventSales,
+    TicketSales,
+    HourlySales
+)
+from .changes import CatalogChange
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from backend.db import db
+
+
+# Catalog edits, logged by the writers in the same transaction as the edit
+# so that every worker process can bring its in-memory read models (search
+# index, suggester) up to date -- see services/catalog_changes.py.
+
+class CatalogChange(db.Model):
+    __tablename__ = "CATALOG_CHANGE"
+
+    change_id = db.Column(db.Integer, primary_key=True)
+    # no foreign keys: deletions are logged too
+    event_id = db.Column(db.Integer)
+    venue_id = db.Column(db.Integer)
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
+
+    __table_args__ = (
+        # writers prune by age
+        db.Index("idx_catalog_change_time", "changed_at"),
+    )
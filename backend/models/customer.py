@@ -1,6 +1,6 @@
 from backend.db import db
 from datetime import datetime
-from passlib.hash import pbkdf2_sha256
+from backend.services.hashing import get_hasher
 
 
 class Customer(db.Model):
@@ -15,11 +15,13 @@ class Customer(db.Model):
     phone = db.Column(db.String(20))
     registration_date = db.Column(db.Date, nullable=False, default=datetime.now)
 
+    # hashing runs on the app's PasswordHasher pool (services/hashing.py);
+    # both may raise HasherBusy when it's saturated
     def set_password(self, password):
-        self.password_hash = pbkdf2_sha256.hash(password)
+        self.password_hash = get_hasher().hash(password)
 
     def check_password(self, password):
-        return pbkdf2_sha256.verify(password, self.password_hash)
+        return get_hasher().verify(password, self.password_hash)
 
     @property
     def full_name(self):
@@ -44,6 +46,10 @@ class Venue(db.Model):
     capacity = db.Column(db.Integer, nullable=False)
     phone = db.Column(db.String(15))
 
+    __table_args__ = (
+        db.Index("idx_venue_city", "city"),
+    )
+
 
 class Event(db.Model):
     __tablename__ = "event"
@@ -70,6 +76,23 @@ class Event(db.Model):
         default="Upcoming",
     )
 
+    # set by the bulk import (services/event_import.py) to find the ids
+    # of the rows one INSERT created
+    import_batch = db.Column(db.String(32))
+
+    # same indexes as Database/migrations/001_hot_query_indexes.sql
+    # and 002_event_import_batch.sql
+    __table_args__ = (
+        # catalog pages in (event_date, event_id) order, date range filters
+        db.Index("idx_event_date", "event_date"),
+        db.Index("idx_event_status_date", "status", "event_date"),
+        # location filter: city -> venue ids (reference data cache) -> venue_id IN
+        db.Index("idx_event_venue_date", "venue_id", "event_date"),
+        # login's "does this customer organize anything?" check, and the
+        # organizer's dashboard listing in date order
+        db.Index("idx_event_organizer_date", "organizer_email", "event_date"),
+        db.Index("idx_event_import_batch", "import_batch"),
+    )
 
 
 class Ticket(db.Model):
@@ -87,6 +110,11 @@ class Ticket(db.Model):
 
     purchase_tickets = db.relationship("PurchaseTicket", back_populates="ticket")
 
+    __table_args__ = (
+        # tiers of an event (MySQL creates this one for the foreign key)
+        db.Index("idx_ticket_event", "event_id"),
+    )
+
 
 class Purchase(db.Model):
     __tablename__ = "PURCHASE"
@@ -94,7 +122,7 @@ class Purchase(db.Model):
     purchase_id = db.Column(db.Integer, primary_key=True)
     customer_id = db.Column(
         db.Integer,
-        db.ForeignKey("CUSTOMER.customer_id", ondelete="CASCADE"),
+        db.ForeignKey("customer.customer_id", ondelete="CASCADE"),
         nullable=False,
     )
     purchase_date = db.Column(db.DateTime, nullable=False, default=datetime.now)
@@ -110,6 +138,11 @@ class Purchase(db.Model):
         default="Pending",
     )
 
+    __table_args__ = (
+        # a customer's purchase history, newest first
+        db.Index("idx_purchase_customer_date", "customer_id", "purchase_date"),
+    )
+
     # ✅ Relationship added
     purchase_tickets = db.relationship(
         "PurchaseTicket",
@@ -143,3 +176,26 @@ class PurchaseTicket(db.Model):
     # ✅ Relationships back
     purchase = db.relationship("Purchase", back_populates="purchase_tickets")
     ticket = db.relationship("Ticket", back_populates="purchase_tickets")
+
+
+class SeatHold(db.Model):
+    """A customer's cart reservation on one ticket tier (services/holds.py)."""
+    __tablename__ = "SEAT_HOLD"
+
+    customer_id = db.Column(
+        db.Integer,
+        db.ForeignKey("customer.customer_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    ticket_id = db.Column(
+        db.Integer,
+        db.ForeignKey("TICKET.ticket_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    quantity = db.Column(db.Integer, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        # the expiry sweep reads holds in expiry order
+        db.Index("idx_seat_hold_expires", "expires_at"),
+    )
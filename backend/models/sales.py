@@ -0,0 +1,50 @@
+from backend.db import db
+
+
+# Sales rollups for the admin dashboard. They're kept up to date by
+# services/sales_rollups.py inside the same transaction as every purchase
+# and refund; `flask rebuild-sales-rollups` recomputes them from
+# PURCHASE_TICKET. "sold" counts exclude refunded purchases.
+
+class EventSales(db.Model):
+    __tablename__ = "EVENT_SALES"
+
+    event_id = db.Column(
+        db.Integer,
+        db.ForeignKey("event.event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tickets_sold = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    purchases = db.Column(db.Integer, nullable=False, default=0)
+    tickets_refunded = db.Column(db.Integer, nullable=False, default=0)
+    refunded_amount = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+
+
+class TicketSales(db.Model):
+    __tablename__ = "TICKET_SALES"
+
+    ticket_id = db.Column(
+        db.Integer,
+        db.ForeignKey("TICKET.ticket_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    event_id = db.Column(db.Integer, nullable=False, index=True)
+    tickets_sold = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    tickets_refunded = db.Column(db.Integer, nullable=False, default=0)
+
+
+class HourlySales(db.Model):
+    __tablename__ = "EVENT_SALES_HOURLY"
+
+    event_id = db.Column(
+        db.Integer,
+        db.ForeignKey("event.event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # purchase time truncated to the hour (refunds count against the
+    # hour the tickets were bought in)
+    hour = db.Column(db.DateTime, primary_key=True)
+    tickets_sold = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Numeric(12, 2), nullable=False, default=0)
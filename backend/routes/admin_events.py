@@ -1,38 +1,30 @@
 # this is for CRUD applications for admins of event organizers
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask import Blueprint, request, jsonify, current_app
 from backend.db import db
-from backend.models.customer import Customer, Event
-from datetime import datetime
+from backend.models.customer import Event
+from backend.services.catalog_changes import record_changes
+from backend.services.event_import import (
+    DEFAULT_CHUNK_SIZE,
+    UploadError,
+    import_events,
+    read_rows,
+    upload_format,
+)
+from backend.services.sales_rollups import organizer_stats
+from backend.signals import customer_changed, event_changed
+from backend.utils.roles import admin_required, current_customer
+from datetime import datetime, timedelta
 
 #admin blueprint
 admin_bp = Blueprint("admin_events", __name__, url_prefix="/api/admin")
 
-#verifying admin role through email of admins on database
-def require_admin():
-    email = get_jwt_identity()
-    user = Customer.query.filter_by(email=email).first()
-
-    if not user or user.role != "admin":
-        return None
-    return user
-
 # -------------------------
 # ADMIN: GET EVENTS THEY OWN
 # -------------------------
 @admin_bp.route("/events", methods=["GET"])
-@jwt_required()
+@admin_required
 def get_admin_events():
-    claims = get_jwt()
-    if claims.get("role") != "admin":
-        return jsonify({"error": "Admin access required"}), 403
-
-    identity = get_jwt_identity()  
-    customer = Customer.query.filter_by(email=identity).first()
-
-    if not customer:
-        return jsonify({"error": "User not found"}), 404
-
+    customer = current_customer()
     events = Event.query.filter_by(organizer_email=customer.email).all()
 
     result = [
@@ -57,13 +49,27 @@ def get_admin_events():
 
 
 
+# -------------------------
+# ADMIN: SALES STATS FOR THEIR EVENTS  /api/admin/stats?hours=168
+# (revenue / sell-through per event and tier, plus hourly sales for the
+#  last `hours` hours -- read from the sales rollups, not PURCHASE_TICKET)
+# -------------------------
+@admin_bp.route("/stats", methods=["GET"])
+@admin_required
+def get_admin_stats():
+    hours = request.args.get("hours", "168")
+    if not hours.isdigit() or not 0 < int(hours) <= 24 * 366:
+        return jsonify({"error": "hours must be between 1 and 8784"}), 400
+
+    since = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=int(hours) - 1)
+    return jsonify(organizer_stats(current_customer().email, since)), 200
+
+
 #create event
 @admin_bp.route("/events", methods=["POST"])
-@jwt_required()
+@admin_required
 def create_event():
-    admin = require_admin()
-    if not admin:
-        return jsonify({"error": "Unauthorized"}), 403
+    admin = current_customer()
 
     data = request.get_json()
 
@@ -82,22 +88,53 @@ def create_event():
         )
 
         db.session.add(new_event)
+        db.session.flush()
+        # other workers' search index / suggester follow this log
+        record_changes([new_event.event_id])
         db.session.commit()
 
+        app = current_app._get_current_object()
+        event_changed.send(app, event_id=new_event.event_id)
+        # ownership decides the effective role (services/identity.py)
+        customer_changed.send(app, email=admin.email)
+
         return jsonify({"message": "Event created successfully"}), 201
 
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 
+# -------------------------
+# BULK IMPORT: events + ticket tiers from CSV / NDJSON
+# (Content-Type text/csv or application/x-ndjson, or ?format=csv|ndjson;
+#  ?dry_run=1 only validates). See services/event_import.py for the columns.
+# -------------------------
+@admin_bp.route("/events/bulk", methods=["POST"])
+@admin_required
+def bulk_import_events():
+    fmt = upload_format(request.args.get("format"), request.mimetype)
+    if not fmt:
+        return jsonify({"error": "Send CSV (text/csv) or NDJSON (application/x-ndjson)"}), 415
+
+    try:
+        report = import_events(
+            read_rows(request.stream, fmt),
+            current_customer(),
+            chunk_size=current_app.config.get("BULK_IMPORT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE),
+            dry_run=request.args.get("dry_run") in ("1", "true"),
+        )
+    except UploadError as e:
+        return jsonify({"error": str(e)}), 400
+
+    status = 200 if report.imported or not report.failed else 400
+    return jsonify(report.to_json()), status
+
+
 #for updating events
 @admin_bp.route("/events/<int:event_id>", methods=["PUT"])
-@jwt_required()
+@admin_required
 def update_event(event_id):
-    admin = require_admin()
-
-    if not admin:
-        return jsonify({"error": "Unauthorized"}), 403
+    admin = current_customer()
 
     #checking if admin maatches admin email to avoid admins updating other admins;s events
     event = Event.query.get(event_id)
@@ -115,7 +152,10 @@ def update_event(event_id):
         event.total_tickets = data["total_tickets"]
         event.status = data.get("status", event.status)
 
+        record_changes([event_id])
         db.session.commit()
+
+        event_changed.send(current_app._get_current_object(), event_id=event_id)
         return jsonify({"message": "Event updated successfully"}), 200
 
     except Exception as e:
@@ -124,11 +164,9 @@ def update_event(event_id):
 
 #deleting events 
 @admin_bp.route("/events/<int:event_id>", methods=["DELETE"])
-@jwt_required()
+@admin_required
 def delete_event(event_id):
-    admin = require_admin()
-    if not admin:
-        return jsonify({"error": "Unauthorized"}), 403
+    admin = current_customer()
 
     #same thing as funciton above, admins cannot delete other admins events
     event = Event.query.get(event_id)
@@ -137,7 +175,12 @@ def delete_event(event_id):
 
     try:
         db.session.delete(event)
+        record_changes([event_id])
         db.session.commit()
+
+        app = current_app._get_current_object()
+        event_changed.send(app, event_id=event_id, deleted=True)
+        customer_changed.send(app, email=admin.email)
         return jsonify({"message": "Event deleted"}), 200
 
     except Exception as e:
@@ -1,12 +1,11 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from backend.db import db
-from backend.models.customer import Event, Customer
-from flask_jwt_extended import (
-    create_access_token,
-    jwt_required,
-    get_jwt_identity,
-    get_jwt,
-)
+from backend.models.customer import Customer
+from backend.services.hashing import HasherBusy, get_hasher
+from backend.services.identity import effective_role, owns_events
+from backend.signals import customer_changed
+from backend.utils.roles import current_customer, login_required
+from flask_jwt_extended import create_access_token, get_jwt
 from datetime import datetime
 
 auth_bp = Blueprint("auth", __name__)
@@ -36,9 +35,12 @@ def register():
 
         db.session.add(customer)
         db.session.commit()
+        customer_changed.send(current_app._get_current_object(), email=email)
 
         return jsonify({"message": "User registered"}), 201
 
+    except HasherBusy:
+        raise  # 503 + Retry-After (see services/hashing.py)
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
@@ -56,35 +58,38 @@ def login():
     if not email or not password:
         return jsonify({"error": "Email and password are required"}), 400
 
-    customer = Customer.query.filter_by(email=email).first()
+    # one indexed read: the account plus whether they organize any event
+    # (organizers count as admins; nothing is written back)
+    row = (
+        db.session.query(Customer, owns_events())
+        .filter(Customer.email == email)
+        .first()
+    )
+    customer, owns = row if row else (None, False)
 
     if not customer or not customer.check_password(password):
         return jsonify({"error": "Invalid credentials"}), 401
 
-    # Auto-promote to admin if they own events
-    try:
-        if customer.role != "admin":
-            owns_events = (
-                db.session.query(Event)
-                .filter(Event.organizer_email == customer.email)
-                .count() > 0
-            )
-            if owns_events:
-                customer.role = "admin"
-                db.session.commit()
-    except Exception:
-        db.session.rollback()
+    # upgrade hashes made with older PBKDF2_ROUNDS while we have the password
+    if get_hasher().needs_rehash(customer.password_hash):
+        try:
+            customer.set_password(password)
+            db.session.commit()
+        except HasherBusy:
+            db.session.rollback()  # try again on a later login
+
+    role = effective_role(customer.role, owns)
 
     # JWT identity is NOW THE EMAIL
     token = create_access_token(
         identity=customer.email,
-        additional_claims={"role": customer.role},
+        additional_claims={"role": role},
     )
 
     return jsonify(
         {
             "token": token,
-            "role": customer.role,
+            "role": role,
             "email": customer.email,
             "first_name": customer.first_name,
             "last_name": customer.last_name,
@@ -96,14 +101,10 @@ def login():
 # CURRENT USER INFO
 # -------------------------
 @auth_bp.route("/me", methods=["GET"])
-@jwt_required()
+@login_required
 def me():
-    identity = get_jwt_identity()  # this is the email now
     claims = get_jwt()
-
-    customer = Customer.query.filter_by(email=identity).first()
-    if not customer:
-        return jsonify({"error": "User not found"}), 404
+    customer = current_customer()
 
     return jsonify(
         {
@@ -0,0 +1,404 @@
+# backend/routes/catalog_async.py
+"""
+The read-only catalog endpoints as asyncio coroutines (Starlette), served
+by backend/asgi.py in front of the Flask app.
+
+Same URLs, bodies and headers as their Flask counterparts -- they share
+the field maps, statements and JSON builders with them -- but queries run
+on an async engine, so a request waiting on the database holds a
+coroutine, not a thread:
+
+    GET /api/events/                 routes/events.py  get_events
+    GET /api/events/search                             search_events
+    GET /api/events/filter                             filter_events
+    GET /api/events/cards                              get_event_cards
+    GET /api/events/suggest                            suggest
+    GET /api/events/<id>             routes/event_details.py
+    GET /api/event-tickets/<id>      routes/event_tickets.py
+    GET /api/categories/             routes/categories.py
+    GET /api/venues/                 routes/venues.py
+
+In-memory state (reference data cache, search index, suggester, catalog
+versions for the ETags) is the Flask app's own, found through
+request.app.state.flask_app; building or catching up the search index
+and suggester runs sync queries, so that goes to the threadpool.
+"""
+from functools import wraps
+
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.routing import Route
+from werkzeug.http import http_date, parse_date, parse_etags, quote_etag
+
+from backend.models.customer import Event, Ticket
+from backend.routes.categories import CATEGORY_FIELDS
+from backend.routes.event_details import event_json
+from backend.routes.events import (
+    CARD_COLUMNS,
+    EVENT_CARDS_MAX,
+    EVENT_FIELDS,
+    FILTER_COLUMNS,
+    IN_CHUNK_SIZE,
+    apply_filters,
+    card_json,
+    cards_args,
+    cards_page,
+    cards_page_statement,
+    filter_json,
+    group_tickets,
+    in_rank_order,
+    search_filters,
+    suggestion_json,
+    ticket_json,
+    tickets_statement,
+)
+from backend.routes.venues import VENUE_FIELDS
+from backend.services.reference_data import (
+    CATEGORIES_QUERY,
+    VENUES_QUERY,
+    categories_from_rows,
+    category_id_by_name,
+    venue_ids_in_city,
+    venues_from_rows,
+)
+from backend.services.search_index import get_search_index
+from backend.services.suggest import MAX_SUGGESTIONS, get_suggester
+from backend.utils.conditional import DEFAULT_WINDOW_SECONDS
+from backend.utils.pagination import (
+    PaginationError,
+    cached_page_json,
+    decode_cursor,
+    next_page_link,
+    page_json,
+    page_size,
+    page_statement,
+    requested_fields,
+)
+from backend.utils.row_encoders import rows_json
+
+_REFERENCE = {
+    "categories": (CATEGORIES_QUERY, categories_from_rows),
+    "venues": (VENUES_QUERY, venues_from_rows),
+}
+
+
+def catalog_routes():
+    # GET routes answer HEAD too; other methods fall through to Flask
+    return [
+        Route("/api/events/", get_events, methods=["GET"]),
+        Route("/api/events/search", search_events, methods=["GET"]),
+        Route("/api/events/filter", filter_events, methods=["GET"]),
+        Route("/api/events/cards", get_event_cards, methods=["GET"]),
+        Route("/api/events/suggest", suggest, methods=["GET"]),
+        Route("/api/events/{event_id:int}", get_event_by_id, methods=["GET"]),
+        Route("/api/event-tickets/{event_id:int}", get_tickets_by_event, methods=["GET"]),
+        Route("/api/categories/", get_categories, methods=["GET"]),
+        Route("/api/venues/", get_venues, methods=["GET"]),
+    ]
+
+
+# ------------------------------------------------------------
+# helpers
+# ------------------------------------------------------------
+def _flask_app(request):
+    return request.app.state.flask_app
+
+
+def _json(request, data, status_code=200):
+    # the Flask app's JSON provider, dumped the way jsonify() does, so
+    # bodies match the Flask endpoints' byte for byte
+    return _json_text(_flask_app(request).json.dumps(data, separators=(",", ":")), status_code)
+
+
+def _json_text(body, status_code=200):
+    # JSON already encoded by backend/utils/row_encoders.py
+    return Response(body + "\n", status_code=status_code, media_type="application/json")
+
+
+def _connect(request):
+    return request.app.state.db.for_request(request).connect()
+
+
+async def _reference(request, kind):
+    """Categories / venues from the shared reference cache, loaded async on a miss."""
+    cache = _flask_app(request).extensions["reference_cache"]
+    value = cache.get(kind)
+    if value is None:
+        query, from_rows = _REFERENCE[kind]
+        async with _connect(request) as conn:
+            value = from_rows(await conn.execute(query))
+        cache.set(kind, value)
+    return value
+
+
+async def _search_ids(request, q, **filters):
+    if not q.strip():
+        return None
+    flask_app = _flask_app(request)
+    index = flask_app.extensions["event_search_index"]
+    if not index.built or flask_app.extensions["event_search_changes"].due(flask_app.config):
+        index = await run_in_threadpool(build_search_index, flask_app)
+    return index.search(q, **filters)
+
+
+def build_search_index(flask_app):
+    """Building / catching up runs sync queries: run it off the event loop."""
+    with flask_app.app_context():
+        return get_search_index()
+
+
+def _current_suggester(flask_app):
+    with flask_app.app_context():
+        return get_suggester()
+
+
+async def _tickets_by_event(conn, event_ids):
+    grouped = {}
+    for start in range(0, len(event_ids), IN_CHUNK_SIZE):
+        chunk = event_ids[start:start + IN_CHUNK_SIZE]
+        group_tickets(grouped, await conn.execute(tickets_statement(chunk)))
+    return grouped
+
+
+def _page_response(request, body, last_key):
+    return _with_next_page(request, _json_text(body), last_key)
+
+
+def _with_next_page(request, response, last_key):
+    if last_key is not None:
+        base_url = str(request.url.replace(query=""))
+        token, link = next_page_link(last_key, base_url, request.query_params)
+        response.headers["X-Next-Cursor"] = token
+        response.headers["Link"] = link
+    return response
+
+
+def conditional(*names, cache_control):
+    """Async twin of backend.utils.conditional.conditional (same ETags)."""
+    def decorator(endpoint):
+        @wraps(endpoint)
+        async def wrapper(request):
+            flask_app = _flask_app(request)
+            window = flask_app.config.get("ETAG_WINDOW_SECONDS", DEFAULT_WINDOW_SECONDS)
+            etag, last_modified = flask_app.extensions["catalog_versions"].etag_and_last_modified(
+                [name.format(**request.path_params) for name in names],
+                window,
+                request.scope["query_string"],
+            )
+
+            if _not_modified(request, etag, last_modified):
+                response = Response(status_code=304)
+            else:
+                response = await endpoint(request)
+                if response.status_code != 200:
+                    return response
+
+            response.headers["ETag"] = quote_etag(etag, weak=True)
+            response.headers["Last-Modified"] = http_date(last_modified)
+            response.headers["Cache-Control"] = cache_control
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return parse_etags(if_none_match).contains_weak(etag)
+    if_modified_since = parse_date(request.headers.get("if-modified-since"))
+    if if_modified_since:
+        return last_modified <= if_modified_since
+    return False
+
+
+# ------------------------------------------------------------
+# GET ALL EVENTS  /api/events/?limit=&cursor=&fields=
+# ------------------------------------------------------------
+@conditional("events", cache_control="public, max-age=30")
+async def get_events(request):
+    fields, key = EVENT_FIELDS, ("event_date", "event_id")
+    args = request.query_params
+    try:
+        limit = page_size(args)
+        names = requested_fields(fields, args)
+        after = decode_cursor(args.get("cursor"), [fields[k][0] for k in key])
+    except PaginationError as e:
+        return _json(request, {"error": str(e)}, 400)
+
+    async with _connect(request) as conn:
+        result = await conn.execute(page_statement(fields, key, names, after, limit))
+        rows = result.all()
+
+    body, last_key = page_json(rows, fields, key, names, limit, app=_flask_app(request))
+    return _page_response(request, body, last_key)
+
+
+# ------------------------------------------------------------
+# SEARCH  /api/events/search?q=
+# ------------------------------------------------------------
+async def search_events(request):
+    ids = await _search_ids(request, request.query_params.get("q", ""))
+
+    stmt = select(Event.event_id, Event.event_name, Event.event_date)
+    if ids is not None:
+        stmt = stmt.where(Event.event_id.in_(ids))
+    async with _connect(request) as conn:
+        rows = (await conn.execute(stmt)).all()
+
+    return _json(request, [
+        {
+            "event_id": e.event_id,
+            "event_name": e.event_name,
+            "event_date": str(e.event_date),
+        }
+        for e in in_rank_order(rows, ids)
+    ])
+
+
+# ------------------------------------------------------------
+# TYPE-AHEAD  /api/events/suggest?prefix=roc&limit=5
+# ------------------------------------------------------------
+async def suggest(request):
+    args = request.query_params
+    try:
+        limit = int(args.get("limit", MAX_SUGGESTIONS))
+    except ValueError:
+        return _json(request, {"error": "limit must be an integer"}, 400)
+
+    flask_app = _flask_app(request)
+    state = flask_app.extensions["event_suggest"]
+    suggester = state.suggester
+    if suggester is None or state.stale or state.changes.due(flask_app.config):
+        suggester = await run_in_threadpool(_current_suggester, flask_app)
+
+    return _json(request, [
+        suggestion_json(s) for s in suggester.suggest(args.get("prefix", ""), max(limit, 1))
+    ])
+
+
+# ------------------------------------------------------------
+# FILTER  /api/events/filter?q=&location=&date=
+# ------------------------------------------------------------
+async def filter_events(request):
+    args = request.query_params
+    location = args.get("location", "")
+    date_range = args.get("date", "")
+
+    venues = await _reference(request, "venues")
+    categories = await _reference(request, "categories")
+    venue_ids = venue_ids_in_city(location, venues) if location else None
+    ids = await _search_ids(request, args.get("q", ""), **search_filters(venue_ids, date_range))
+
+    async with _connect(request) as conn:
+        stmt = apply_filters(select(*FILTER_COLUMNS), ids, venue_ids, date_range)
+        rows = in_rank_order((await conn.execute(stmt)).all(), ids)
+        tickets = await _tickets_by_event(conn, [row.event_id for row in rows])
+
+    return _json(request, [filter_json(row, tickets, venues, categories) for row in rows])
+
+
+# ------------------------------------------------------------
+# BATCH EVENT CARDS
+# /api/events/cards?ids=1,2,3
+# /api/events/cards?q=&location=&date=&category=&limit=&cursor=
+# ------------------------------------------------------------
+async def get_event_cards(request):
+    args = request.query_params
+    max_cards = _flask_app(request).config.get("EVENT_CARDS_MAX", EVENT_CARDS_MAX)
+    try:
+        ids, limit, after = cards_args(args, max_cards)
+    except PaginationError as e:
+        return _json(request, {"error": str(e)}, 400)
+
+    venues = await _reference(request, "venues")
+    categories = await _reference(request, "categories")
+    if ids:
+        stmt = select(*CARD_COLUMNS).where(Event.event_id.in_(ids))
+    else:
+        location = args.get("location", "")
+        date_range = args.get("date", "")
+        category = args.get("category", "")
+        venue_ids = venue_ids_in_city(location, venues) if location else None
+        category_ids = {category_id_by_name(category, categories)} if category else None
+        search_ids = await _search_ids(
+            request, args.get("q", ""), **search_filters(venue_ids, date_range, category_ids)
+        )
+        stmt = cards_page_statement(search_ids, venue_ids, date_range, category_ids, after, limit)
+
+    async with _connect(request) as conn:
+        rows, last_key = cards_page((await conn.execute(stmt)).all(), ids, limit)
+        tickets = await _tickets_by_event(conn, [row.event_id for row in rows])
+
+    response = _json(request, [card_json(row, tickets, venues, categories) for row in rows])
+    return _with_next_page(request, response, last_key)
+
+
+# ------------------------------------------------------------
+# EVENT DETAILS  /api/events/<id>
+# ------------------------------------------------------------
+@conditional("events:{event_id}", "categories", "venues", cache_control="public, max-age=30")
+async def get_event_by_id(request):
+    event_id = request.path_params["event_id"]
+    async with _connect(request) as conn:
+        event = (await conn.execute(
+            select(
+                Event.event_id, Event.event_name, Event.event_date, Event.description,
+                Event.organizer_name, Event.status, Event.category_id, Event.venue_id,
+            ).where(Event.event_id == event_id)
+        )).first()
+    if event is None:
+        return _json(request, {"error": "Event not found"}, 404)
+
+    categories = await _reference(request, "categories")
+    venues = await _reference(request, "venues")
+    return _json(request, event_json(
+        event, categories.get(event.category_id), venues.get(event.venue_id)
+    ))
+
+
+# ------------------------------------------------------------
+# TICKET TIERS  /api/event-tickets/<id>
+# ------------------------------------------------------------
+@conditional("tickets:{event_id}", cache_control="no-cache")
+async def get_tickets_by_event(request):
+    async with _connect(request) as conn:
+        tickets = (await conn.execute(
+            select(Ticket.ticket_id, Ticket.ticket_type, Ticket.price, Ticket.quantity_available)
+            .where(Ticket.event_id == request.path_params["event_id"])
+            .order_by(Ticket.ticket_id)
+        )).all()
+
+    return _json(request, [ticket_json(t) for t in tickets])
+
+
+# ------------------------------------------------------------
+# REFERENCE DATA  /api/categories/  /api/venues/
+# ------------------------------------------------------------
+@conditional("categories", cache_control="public, max-age=300")
+async def get_categories(request):
+    categories = await _reference(request, "categories")
+    return _json_text(rows_json(
+        CATEGORY_FIELDS, list(CATEGORY_FIELDS), categories.values(),
+        mapping=True, app=_flask_app(request),
+    ))
+
+
+@conditional("venues", cache_control="public, max-age=300")
+async def get_venues(request):
+    fields, key = VENUE_FIELDS, ("venue_id",)
+    args = request.query_params
+    try:
+        limit = page_size(args)
+        names = requested_fields(fields, args)
+        after = decode_cursor(args.get("cursor"), [fields[k][0] for k in key])
+    except PaginationError as e:
+        return _json(request, {"error": str(e)}, 400)
+
+    venues = await _reference(request, "venues")
+    body, last_key = cached_page_json(
+        venues.values(), fields, key, names, after, limit, app=_flask_app(request)
+    )
+    return _page_response(request, body, last_key)
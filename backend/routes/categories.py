@@ -1,17 +1,20 @@
-from flask import Blueprint, jsonify
-from backend.db import db
+from flask import Blueprint
 from backend.models.customer import Category
+from backend.services import reference_data
+from backend.utils.conditional import conditional
+from backend.utils.row_encoders import json_response, rows_json
 
 categories_bp = Blueprint("categories", __name__, url_prefix="/categories")
 
+CATEGORY_FIELDS = {
+    "category_id": (Category.category_id, None),
+    "category_name": (Category.category_name, None),
+    "description": (Category.description, None),
+}
+
+# served from the reference data cache (see services/reference_data.py)
 @categories_bp.route("/", methods=["GET"])
+@conditional("categories", cache_control="public, max-age=300")
 def get_categories():
-    categories = Category.query.all()
-    result = []
-    for cat in categories:
-        result.append({
-            "category_id": cat.category_id,
-            "category_name": cat.category_name,
-            "description": cat.description
-        })
-    return jsonify(result)
+    categories = reference_data.get_categories().values()
+    return json_response(rows_json(CATEGORY_FIELDS, list(CATEGORY_FIELDS), categories, mapping=True))
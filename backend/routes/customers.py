@@ -1,19 +1,25 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint
 from backend.models.customer import Customer
+from backend.utils.pagination import paginated_list
+from backend.utils.streaming import stream_format, streamed_list
 
 customers_bp = Blueprint("customers", __name__, url_prefix="/customers")
 
+# password_hash / role are deliberately not selectable
+CUSTOMER_FIELDS = {
+    "customer_id": (Customer.customer_id, None),
+    "first_name": (Customer.first_name, None),
+    "last_name": (Customer.last_name, None),
+    "email": (Customer.email, None),
+    "phone": (Customer.phone, None),
+    "registration_date": (Customer.registration_date, str),
+}
+
+# /api/customers/?limit=&cursor=&fields=
+# add format=ndjson|csv (or the matching Accept header) to stream everything
 @customers_bp.route("/", methods=["GET"])
 def get_customers():
-    customers = Customer.query.all()
-    return jsonify([
-        {
-            "customer_id": c.customer_id,
-            "first_name": c.first_name,
-            "last_name": c.last_name,
-            "email": c.email,
-            "phone": c.phone,
-            "registration_date": str(c.registration_date)
-        }
-        for c in customers
-    ])
+    fmt = stream_format()
+    if fmt:
+        return streamed_list(CUSTOMER_FIELDS, key=("customer_id",), fmt=fmt)
+    return paginated_list(CUSTOMER_FIELDS, key=("customer_id",))
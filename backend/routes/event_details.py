@@ -1,38 +1,50 @@
 from flask import Blueprint, jsonify
+from werkzeug.http import http_date
+from backend.db import db
 from backend.models.customer import Event
+from backend.services.reference_data import get_category, get_venue
+from backend.utils.conditional import conditional
 
 # IMPORTANT → give the blueprint a real prefix
 event_details_bp = Blueprint("event_details", __name__, url_prefix="/events")
 
 @event_details_bp.route("/<int:event_id>", methods=["GET"])
+@conditional("events:{event_id}", "categories", "venues", cache_control="public, max-age=30")
 def get_event_by_id(event_id):
-    event = Event.query.get(event_id)
+    event = db.session.get(Event, event_id)
 
     if not event:
         return jsonify({"error": "Event not found"}), 404
 
-    return jsonify({
-    "event_id": event.event_id,
-    "event_name": event.event_name,
-    "event_date": event.event_date,
-    "description": event.description,
-    "organizer_name": event.organizer_name,
-    "status": event.status,
-
-    # ADD THESE TWO
-    "category_id": event.category_id,
-    "venue_id": event.venue_id,
-
-    "category": {
-        "category_id": event.category.category_id,
-        "category_name": event.category.category_name
-    } if event.category else None,
-
-    "venue": {
-        "venue_id": event.venue.venue_id,
-        "venue_name": event.venue.venue_name,
-        "city": event.venue.city,
-        "address": event.venue.address
-    } if event.venue else None
-})
-
+    # category / venue come from the reference data cache, not lazy loads
+    return jsonify(event_json(event, get_category(event.category_id), get_venue(event.venue_id)))
+
+
+def event_json(event, category, venue):
+    """Event details body (also used by backend/routes/catalog_async.py)."""
+    return {
+        "event_id": event.event_id,
+        "event_name": event.event_name,
+        # RFC 822, as this endpoint has always sent it (the list endpoints
+        # send str(); the details page parses either)
+        "event_date": http_date(event.event_date),
+        "description": event.description,
+        "organizer_name": event.organizer_name,
+        "status": event.status,
+
+        # ADD THESE TWO
+        "category_id": event.category_id,
+        "venue_id": event.venue_id,
+
+        "category": {
+            "category_id": category["category_id"],
+            "category_name": category["category_name"]
+        } if category else None,
+
+        "venue": {
+            "venue_id": venue["venue_id"],
+            "venue_name": venue["venue_name"],
+            "city": venue["city"],
+            "address": venue["address"]
+        } if venue else None
+    }
@@ -1,18 +1,14 @@
 from flask import Blueprint, jsonify
 from backend.models.customer import Ticket
+from backend.routes.events import ticket_json
+from backend.utils.conditional import conditional
 
 event_tickets_bp = Blueprint("event_tickets", __name__)
 
+# stock moves with every purchase and hold: always revalidate
 @event_tickets_bp.route("/event-tickets/<int:event_id>", methods=["GET"])
+@conditional("tickets:{event_id}", cache_control="no-cache")
 def get_tickets_by_event(event_id):
     tickets = Ticket.query.filter_by(event_id=event_id).all()
 
-    return jsonify([
-        {
-            "ticket_id": t.ticket_id,
-            "ticket_type": t.ticket_type,
-            "price": float(t.price),
-            "quantity_available": t.quantity_available
-        }
-        for t in tickets
-    ])
+    return jsonify([ticket_json(t) for t in tickets])
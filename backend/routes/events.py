@@ -1,45 +1,77 @@
 # backend/routes/events.py
-from flask import Blueprint, request, jsonify
+from datetime import datetime, timedelta
+
+from flask import Blueprint, request, jsonify, current_app
+from sqlalchemy import select
+
+from backend.db import db
+from backend.utils.conditional import conditional
+from backend.utils.pagination import (
+    PaginationError,
+    decode_cursor,
+    next_page_link,
+    paginated_list,
+    seek_past,
+)
 from backend.models.customer import Event
 from backend.models.customer import Ticket
-from backend.models.customer import Venue
-from backend.models.customer import Category
+from backend.services.reference_data import (
+    category_id_by_name,
+    get_categories,
+    get_venues,
+    venue_ids_in_city,
+)
+from backend.services.search_index import search_event_ids
+from backend.services.suggest import MAX_SUGGESTIONS, get_suggester
 
 events_bp = Blueprint("events", __name__)
 
+# keep IN (...) lists well under the driver's bind parameter limits
+IN_CHUNK_SIZE = 500
+
+# default cap on how many cards one /cards request may return
+# (override with app.config["EVENT_CARDS_MAX"])
+EVENT_CARDS_MAX = 100
+
+# fields the list endpoint can return -> (column, json conversion)
+EVENT_FIELDS = {
+    "event_id": (Event.event_id, None),
+    "event_name": (Event.event_name, None),
+    "event_date": (Event.event_date, str),
+    "description": (Event.description, None),
+    "organizer_name": (Event.organizer_name, None),
+    "organizer_email": (Event.organizer_email, None),
+    "category_id": (Event.category_id, None),
+    "venue_id": (Event.venue_id, None),
+    "total_tickets": (Event.total_tickets, None),
+    "tickets_sold": (Event.tickets_sold, None),
+    "status": (Event.status, None),
+}
+
 # ------------------------------------------------------------
-# GET ALL EVENTS
+# GET ALL EVENTS  /api/events/?limit=&cursor=&fields=
+# (paged by date, then id; 304 on a matching If-None-Match)
 # ------------------------------------------------------------
 @events_bp.route("/", methods=["GET"])
+@conditional("events", cache_control="public, max-age=30")
 def get_events():
-    events = Event.query.all()
-
-    output = []
-    for e in events:
-        output.append({
-            "event_id": e.event_id,
-            "event_name": e.event_name,
-            "event_date": str(e.event_date),
-            "description": e.description,
-            "organizer_name": e.organizer_name,
-            "organizer_email": e.organizer_email,
-            "category_id": e.category_id,
-            "venue_id": e.venue_id,
-            "total_tickets": e.total_tickets,
-            "tickets_sold": e.tickets_sold,
-            "status": e.status
-        })
-    return jsonify(output)
+    return paginated_list(EVENT_FIELDS, key=("event_date", "event_id"))
 
 
 # ------------------------------------------------------------
 # SEARCH ENDPOINT  /api/events/search
+# (ranked by the in-memory search index, best match first)
 # ------------------------------------------------------------
 @events_bp.route("/search", methods=["GET"])
 def search_events():
     q = request.args.get("q", "")
 
-    results = Event.query.filter(Event.event_name.like(f"%{q}%")).all()
+    ids = _search_ids(q)
+
+    query = db.session.query(Event.event_id, Event.event_name, Event.event_date)
+    if ids is not None:
+        query = query.filter(Event.event_id.in_(ids))
+    results = in_rank_order(query.all(), ids)
 
     return jsonify([
         {
@@ -51,6 +83,21 @@ def search_events():
     ])
 
 
+# ------------------------------------------------------------
+# TYPE-AHEAD  /api/events/suggest?prefix=roc&limit=5
+# event names, venue names and cities, served from memory
+# ------------------------------------------------------------
+@events_bp.route("/suggest", methods=["GET"])
+def suggest():
+    prefix = request.args.get("prefix", "")
+    try:
+        limit = int(request.args.get("limit", MAX_SUGGESTIONS))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    return jsonify([suggestion_json(s) for s in get_suggester().suggest(prefix, max(limit, 1))])
+
+
 # ------------------------------------------------------------
 # *** MAIN FILTER ENDPOINT ***
 # /api/events/filter?q=&location=&date=
@@ -61,68 +108,283 @@ def filter_events():
     location = request.args.get("location", "")
     date_range = request.args.get("date", "")
 
-    query = Event.query
+    # one query for the events; venue + category come from the
+    # reference data cache (no joins, no lazy loads per row)
+    venues = get_venues()
+    categories = get_categories()
+    venue_ids = venue_ids_in_city(location, venues) if location else None
+    ids = _search_ids(q, venue_ids, date_range)
+    stmt = apply_filters(select(*FILTER_COLUMNS), ids, venue_ids, date_range)
+    rows = in_rank_order(db.session.execute(stmt).all(), ids)
+
+    # one batched IN query for all the tickets, grouped in memory
+    tickets = _tickets_by_event([row.event_id for row in rows])
+
+    return jsonify([filter_json(row, tickets, venues, categories) for row in rows])
+
+
+# ------------------------------------------------------------
+# BATCH EVENT CARDS
+# /api/events/cards?ids=1,2,3
+# /api/events/cards?q=&location=&date=&category=&limit=&cursor=
+#
+# Everything the home / category pages need to draw a card
+# (event, venue, category, ticket tiers, min price, seats left)
+# in one response, instead of 2 extra calls per event.
+# Filtered cards are paged by date, then id: the next page is in
+# the X-Next-Cursor / Link headers, as on /api/events/.
+# ------------------------------------------------------------
+@events_bp.route("/cards", methods=["GET"])
+def get_event_cards():
+    max_cards = current_app.config.get("EVENT_CARDS_MAX", EVENT_CARDS_MAX)
+    try:
+        ids, limit, after = cards_args(request.args, max_cards)
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    venues = get_venues()
+    categories = get_categories()
+    if ids:
+        stmt = select(*CARD_COLUMNS).where(Event.event_id.in_(ids))
+    else:
+        location = request.args.get("location", "")
+        date_range = request.args.get("date", "")
+        category = request.args.get("category", "")
+        venue_ids = venue_ids_in_city(location, venues) if location else None
+        category_ids = {category_id_by_name(category, categories)} if category else None
+        search_ids = _search_ids(request.args.get("q", ""), venue_ids, date_range, category_ids)
+        stmt = cards_page_statement(search_ids, venue_ids, date_range, category_ids, after, limit)
+
+    rows, last_key = cards_page(db.session.execute(stmt).all(), ids, limit)
+    tickets = _tickets_by_event([row.event_id for row in rows])
+
+    response = jsonify([card_json(row, tickets, venues, categories) for row in rows])
+    if last_key is not None:
+        token, link = next_page_link(last_key, request.base_url, request.args.to_dict())
+        response.headers["X-Next-Cursor"] = token
+        response.headers["Link"] = link
+    return response
+
+
+# ------------------------------------------------------------
+# HELPERS (shared with the async catalog, routes/catalog_async.py)
+# ------------------------------------------------------------
+FILTER_COLUMNS = (
+    Event.event_id,
+    Event.event_name,
+    Event.event_date,
+    Event.category_id,
+    Event.venue_id,
+)
+
+CARD_COLUMNS = (
+    Event.event_id,
+    Event.event_name,
+    Event.event_date,
+    Event.description,
+    Event.organizer_name,
+    Event.category_id,
+    Event.venue_id,
+    Event.total_tickets,
+    Event.tickets_sold,
+    Event.status,
+)
+
+CARD_KEY = ("event_date", "event_id")
 
-    # TEXT SEARCH
-    if q:
-        query = query.filter(Event.event_name.like(f"%{q}%"))
 
-    # LOCATION FILTER
-    if location:
-        query = query.join(Venue).filter(Venue.city == location)
+def cards_args(args, max_cards):
+    """(ids, limit, cursor key) of a /cards request; PaginationError -> 400."""
+    try:
+        limit = int(args.get("limit", max_cards))
+        ids = [int(i) for i in args.get("ids", "").split(",") if i.strip()]
+    except ValueError:
+        raise PaginationError("ids and limit must be integers")
+
+    if limit < 1:
+        raise PaginationError("limit must be at least 1")
+    if len(ids) > max_cards:
+        raise PaginationError(f"At most {max_cards} ids per request")
+
+    after = decode_cursor(args.get("cursor"), [EVENT_FIELDS[k][0] for k in CARD_KEY])
+    return ids, min(limit, max_cards), after
+
+
+def cards_page_statement(search_ids, venue_ids, date_range, category_ids, after, limit):
+    """One page of filtered cards in date order, plus one row to tell if there's more."""
+    stmt = apply_filters(select(*CARD_COLUMNS), search_ids, venue_ids, date_range)
+    if category_ids is not None:
+        stmt = stmt.where(Event.category_id.in_(category_ids))
+    if after is not None:
+        stmt = stmt.where(seek_past(EVENT_FIELDS, CARD_KEY, after))
+    return stmt.order_by(Event.event_date, Event.event_id).limit(limit + 1)
+
+
+def cards_page(rows, ids, limit):
+    """(rows to show, cursor key of the next page or None)"""
+    if ids:
+        # answer in the order the ids were asked for
+        position = {event_id: i for i, event_id in reversed(list(enumerate(ids)))}
+        rows.sort(key=lambda row: position[row.event_id])
+        return rows, None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, [rows[-1].event_date, rows[-1].event_id]
+    return rows, None
+
+
+def _search_ids(q, venue_ids=None, date_range="", category_ids=None):
+    """
+    Ranked ids from the search index, or None when there's no text query.
+    The location / date / category filters are applied in the index too,
+    before its MAX_RESULTS cut, so no match that passes them is dropped.
+    """
+    if not q.strip():
+        return None
+    return search_event_ids(q, **search_filters(venue_ids, date_range, category_ids))
+
+
+def search_filters(venue_ids, date_range, category_ids=None):
+    """Keyword arguments for EventSearchIndex.search()."""
+    return {
+        "venue_ids": set(venue_ids) if venue_ids is not None else None,
+        "category_ids": category_ids,
+        "dates": _date_bounds(date_range),
+    }
+
+
+def apply_filters(stmt, ids, venue_ids, date_range):
+    # TEXT SEARCH (ids come from the search index -- no LIKE scan)
+    if ids is not None:
+        stmt = stmt.where(Event.event_id.in_(ids))
+
+    # LOCATION FILTER (city -> venue ids from the reference data cache)
+    if venue_ids is not None:
+        stmt = stmt.where(Event.venue_id.in_(venue_ids))
 
     # DATE RANGE FILTER
-    from datetime import datetime, timedelta
+    bounds = _date_bounds(date_range)
+    if bounds is not None:
+        start, end = bounds
+        if start is not None:
+            stmt = stmt.where(Event.event_date >= start)
+        stmt = stmt.where(Event.event_date <= end)
+
+    return stmt
+
 
+def _date_bounds(date_range):
+    """(start or None, end) for ?date=today|week|month|year, else None."""
     now = datetime.now()
 
     if date_range == "today":
-        query = query.filter(
-            Event.event_date >= now.replace(hour=0, minute=0),
-            Event.event_date <= now.replace(hour=23, minute=59)
-        )
+        return now.replace(hour=0, minute=0), now.replace(hour=23, minute=59)
+    if date_range == "week":
+        return None, now + timedelta(days=7)
+    if date_range == "month":
+        return None, now + timedelta(days=30)
+    if date_range == "year":
+        return None, now + timedelta(days=365)
+    return None
 
-    elif date_range == "week":
-        future = now + timedelta(days=7)
-        query = query.filter(Event.event_date <= future)
 
-    elif date_range == "month":
-        future = now + timedelta(days=30)
-        query = query.filter(Event.event_date <= future)
+def in_rank_order(rows, ranked_ids):
+    if ranked_ids is None:
+        return rows
+    position = {event_id: i for i, event_id in enumerate(ranked_ids)}
+    return sorted(rows, key=lambda row: position[row.event_id])
 
-    elif date_range == "year":
-        future = now + timedelta(days=365)
-        query = query.filter(Event.event_date <= future)
 
-    events = query.all()
+def ticket_json(t):
+    return {
+        "ticket_id": t.ticket_id,
+        "ticket_type": t.ticket_type,
+        "price": float(t.price),
+        # seats on hold in someone's cart are already taken out of this
+        "quantity_available": t.quantity_available
+    }
 
-    # Attach category, venue, tickets
-    output = []
-    for e in events:
-        venue = e.venue
-        category = e.category
-        tickets = Ticket.query.filter_by(event_id=e.event_id).all()
 
-        output.append({
-            "event_id": e.event_id,
-            "event_name": e.event_name,
-            "event_date": str(e.event_date),
-            "venue": {
-                "venue_name": venue.venue_name,
-                "city": venue.city
-            } if venue else None,
-            "category": {
-                "category_name": category.category_name
-            } if category else None,
-            "tickets": [
-                {
-                    "ticket_id": t.ticket_id,
-                    "ticket_type": t.ticket_type,
-                    "price": float(t.price),
-                    "quantity_available": t.quantity_available
-                }
-                for t in tickets
-            ]
-        })
-
-    return jsonify(output)
+def filter_json(row, tickets, venues, categories):
+    venue = venues.get(row.venue_id)
+    category = categories.get(row.category_id)
+    return {
+        "event_id": row.event_id,
+        "event_name": row.event_name,
+        "event_date": str(row.event_date),
+        "venue": {
+            "venue_name": venue["venue_name"],
+            "city": venue["city"]
+        } if venue else None,
+        "category": {
+            "category_name": category["category_name"]
+        } if category else None,
+        "tickets": [
+            ticket_json(t) for t in tickets.get(row.event_id, [])
+        ]
+    }
+
+
+def card_json(row, tickets, venues, categories):
+    tiers = [ticket_json(t) for t in tickets.get(row.event_id, [])]
+    venue = venues.get(row.venue_id)
+    category = categories.get(row.category_id)
+    return {
+        "event_id": row.event_id,
+        "event_name": row.event_name,
+        "event_date": str(row.event_date),
+        "description": row.description,
+        "organizer_name": row.organizer_name,
+        "status": row.status,
+        "category_id": row.category_id,
+        "venue_id": row.venue_id,
+        "total_tickets": row.total_tickets,
+        "tickets_sold": row.tickets_sold,
+        "category": {
+            "category_id": row.category_id,
+            "category_name": category["category_name"]
+        } if category else None,
+        "venue": {
+            "venue_id": row.venue_id,
+            "venue_name": venue["venue_name"],
+            "city": venue["city"],
+            "address": venue["address"]
+        } if venue else None,
+        "tickets": tiers,
+        "min_price": min(t["price"] for t in tiers) if tiers else None,
+        "remaining_seats": sum(t["quantity_available"] for t in tiers),
+    }
+
+
+def suggestion_json(s):
+    return {"text": s.text, "type": s.type, "id": s.id}
+
+
+def tickets_statement(event_ids):
+    """The ticket tiers of many events, for group_tickets()."""
+    return (
+        select(
+            Ticket.ticket_id,
+            Ticket.event_id,
+            Ticket.ticket_type,
+            Ticket.price,
+            Ticket.quantity_available,
+        )
+        .where(Ticket.event_id.in_(event_ids))
+        .order_by(Ticket.event_id, Ticket.ticket_id)
+    )
+
+
+def group_tickets(grouped, rows):
+    for t in rows:
+        grouped.setdefault(t.event_id, []).append(t)
+    return grouped
+
+
+def _tickets_by_event(event_ids):
+    """Load the ticket tiers for many events at once -> {event_id: [rows]}."""
+    grouped = {}
+    for start in range(0, len(event_ids), IN_CHUNK_SIZE):
+        chunk = event_ids[start:start + IN_CHUNK_SIZE]
+        group_tickets(grouped, db.session.execute(tickets_statement(chunk)))
+    return grouped
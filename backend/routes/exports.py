@@ -0,0 +1,33 @@
+# backend/routes/exports.py
+# admin data exports, streamed (see services/purchase_export.py)
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from backend.services.purchase_export import csv_chunks, export_cutoff, gzip_chunks
+from backend.utils.roles import admin_required
+
+exports_bp = Blueprint("exports", __name__)
+
+
+# -------------------------
+# PURCHASES CSV  /api/admin/exports/purchases?after=<purchase_id>&gzip=1
+# (after = the last purchase_id you already have; 0 / missing = everything;
+#  purchases from the last EXPORT_COMMIT_LAG_SECONDS are left for next time)
+# -------------------------
+@exports_bp.route("/purchases", methods=["GET"])
+@admin_required
+def export_purchases():
+    after = request.args.get("after", "0")
+    if not after.isdigit():
+        return jsonify({"error": "after must be a purchase_id"}), 400
+
+    chunks = csv_chunks(int(after), up_to_id=export_cutoff())
+    if request.args.get("gzip") in ("1", "true"):
+        return Response(
+            stream_with_context(gzip_chunks(chunks)),
+            mimetype="application/gzip",
+            headers={"Content-Disposition": "attachment; filename=purchases_export.csv.gz"},
+        )
+    return Response(
+        stream_with_context(chunks),
+        mimetype="text/csv",
+        headers={"Content-Disposition": "attachment; filename=purchases_export.csv"},
+    )
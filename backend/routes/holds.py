@@ -0,0 +1,97 @@
+# backend/routes/holds.py
+# cart reservations: hold seats for a few minutes while paying
+from flask import Blueprint, jsonify, request
+from backend.services.holds import HoldError, get_holds
+from backend.services.purchasing import PurchaseError, create_purchase
+from backend.utils.roles import current_customer, login_required
+
+holds_bp = Blueprint("holds", __name__)
+
+
+def _hold_json(holds, h):
+    return {
+        "ticket_id": h.ticket_id,
+        "quantity": h.quantity,
+        "expires_in": round(holds.expires_in(h)),
+    }
+
+
+# -------------------------
+# MY ACTIVE HOLDS
+# -------------------------
+@holds_bp.route("/", methods=["GET"])
+@login_required
+def get_my_holds():
+    customer = current_customer()
+
+    holds = get_holds()
+    return jsonify([_hold_json(holds, h) for h in holds.holds_for(customer.customer_id)])
+
+
+# -------------------------
+# HOLD SEATS  {"ticket_id": 1, "quantity": 2}
+# (holding the same tier again replaces the hold and restarts the timer)
+# -------------------------
+@holds_bp.route("/", methods=["POST"])
+@login_required
+def create_hold():
+    customer = current_customer()
+
+    data = request.get_json(silent=True) or {}
+    ticket_id = data.get("ticket_id")
+    quantity = data.get("quantity", 1)
+    if not isinstance(ticket_id, int) or not isinstance(quantity, int):
+        return jsonify({"error": "ticket_id and quantity must be integers"}), 400
+
+    holds = get_holds()
+    try:
+        hold = holds.hold(customer.customer_id, ticket_id, quantity)
+    except HoldError as e:
+        return jsonify({"error": str(e)}), e.status_code
+
+    return jsonify(_hold_json(holds, hold)), 201
+
+
+# -------------------------
+# RELEASE A HOLD
+# -------------------------
+@holds_bp.route("/<int:ticket_id>", methods=["DELETE"])
+@login_required
+def release_hold(ticket_id):
+    customer = current_customer()
+
+    if not get_holds().release(customer.customer_id, ticket_id):
+        return jsonify({"error": "No active hold for that ticket"}), 404
+    return jsonify({"message": "Hold released"}), 200
+
+
+# -------------------------
+# CHECKOUT: turn every active hold into one purchase
+# {"payment_method": "Credit Card"}
+# -------------------------
+@holds_bp.route("/checkout", methods=["POST"])
+@login_required
+def checkout():
+    customer = current_customer()
+
+    holds = get_holds()
+    mine = holds.holds_for(customer.customer_id)
+    if not mine:
+        return jsonify({"error": "No active holds (they may have expired)"}), 404
+
+    data = request.get_json(silent=True) or {}
+    try:
+        purchase = create_purchase(
+            customer.customer_id,
+            [(h.ticket_id, h.quantity) for h in mine],
+            data.get("payment_method", "Credit Card"),
+            holds=holds,
+        )
+    except PurchaseError as e:
+        return jsonify({"error": str(e)}), e.status_code
+
+    return jsonify({
+        "purchase_id": purchase.purchase_id,
+        "total_amount": float(purchase.total_amount),
+        "payment_status": purchase.payment_status,
+    }), 201
@@ -0,0 +1,65 @@
+# backend/routes/metrics.py
+# runtime counters for admins / monitoring
+from flask import Blueprint, current_app, jsonify
+from backend.services.hashing import get_hasher
+from backend.services.index_advisor import advise
+from backend.utils.roles import admin_required
+from backend.utils.latency import get_latencies
+from backend.utils.sql_metrics import get_slow_queries, get_sql_metrics
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+# -------------------------
+# PASSWORD HASHER: queue depth, rejections, timings
+# -------------------------
+@metrics_bp.route("/hashing", methods=["GET"])
+@admin_required
+def hashing_metrics():
+    return jsonify(get_hasher().stats()), 200
+
+
+# -------------------------
+# SQL PER ROUTE: statements, db time, N+1 shapes (rolling window)
+# -------------------------
+@metrics_bp.route("/sql", methods=["GET"])
+@admin_required
+def sql_metrics():
+    return jsonify(get_sql_metrics().stats()), 200
+
+
+# -------------------------
+# SLOW QUERIES: SQL, redacted params, duration, EXPLAIN plan
+# -------------------------
+@metrics_bp.route("/slow-queries", methods=["GET"])
+@admin_required
+def slow_queries():
+    log = get_slow_queries()
+    if log is None:
+        return jsonify({"threshold_ms": None, "queries": []}), 200
+    return jsonify({"threshold_ms": log.threshold_ms, "queries": log.entries()}), 200
+
+
+# -------------------------
+# LATENCY PER ROUTE: percentiles (JSON) / histograms (Prometheus)
+# -------------------------
+@metrics_bp.route("/latency", methods=["GET"])
+@admin_required
+def latency():
+    return jsonify(get_latencies().summary(current_app.url_map)), 200
+
+
+@metrics_bp.route("/prometheus", methods=["GET"])
+@admin_required
+def prometheus():
+    body = get_latencies().prometheus(current_app.url_map)
+    return body, 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+
+# -------------------------
+# INDEX ADVICE: EXPLAIN every query shape served so far
+# -------------------------
+@metrics_bp.route("/index-advice", methods=["GET"])
+@admin_required
+def index_advice():
+    return jsonify(advise()), 200
@@ -1,20 +1,93 @@
-from flask import Blueprint, jsonify
-from backend.db import db
-from backend.models.customer import Purchase, PurchaseTicket
+from flask import Blueprint, jsonify, request
+from backend.models.customer import Purchase
+from backend.services.holds import get_holds
+from backend.services.purchasing import PurchaseError, create_purchase, refund_purchase
+from backend.utils.pagination import paginated_list
+from backend.utils.roles import current_customer, login_required
+from backend.utils.streaming import stream_format, streamed_list
 
 purchases_bp = Blueprint("purchases", __name__, url_prefix="/purchases")
 
+PURCHASE_FIELDS = {
+    "purchase_id": (Purchase.purchase_id, None),
+    "customer_id": (Purchase.customer_id, None),
+    "purchase_date": (Purchase.purchase_date, None),
+    "total_amount": (Purchase.total_amount, float),
+    "payment_method": (Purchase.payment_method, None),
+    "payment_status": (Purchase.payment_status, None),
+}
+
+# /api/purchases/?limit=&cursor=&fields=
+# add format=ndjson|csv (or the matching Accept header) to stream everything
 @purchases_bp.route("/", methods=["GET"])
 def get_purchases():
-    purchases = Purchase.query.all()
-    result = []
-    for p in purchases:
-        result.append({
-            "purchase_id": p.purchase_id,
-            "customer_id": p.customer_id,
-            "purchase_date": p.purchase_date,
-            "total_amount": float(p.total_amount),
-            "payment_method": p.payment_method,
-            "payment_status": p.payment_status
-        })
-    return jsonify(result)
+    fmt = stream_format()
+    if fmt:
+        return streamed_list(PURCHASE_FIELDS, key=("purchase_id",), fmt=fmt)
+    return paginated_list(PURCHASE_FIELDS, key=("purchase_id",))
+
+
+# -------------------------
+# BUY TICKETS
+# body: {"payment_method": "Credit Card",
+#        "tickets": [{"ticket_id": 1, "quantity": 2}, ...]}
+# -------------------------
+@purchases_bp.route("/", methods=["POST"])
+@login_required
+def buy_tickets():
+    customer = current_customer()
+
+    data = request.get_json(silent=True) or {}
+    items = [
+        (t.get("ticket_id"), t.get("quantity", 1))
+        for t in data.get("tickets") or []
+        if isinstance(t, dict)
+    ]
+
+    try:
+        purchase = create_purchase(
+            customer.customer_id,
+            items,
+            data.get("payment_method", "Credit Card"),
+            holds=get_holds(),
+        )
+    except PurchaseError as e:
+        return jsonify({"error": str(e)}), e.status_code
+
+    return jsonify({
+        "purchase_id": purchase.purchase_id,
+        "total_amount": float(purchase.total_amount),
+        "payment_status": purchase.payment_status,
+        "tickets": [
+            {
+                "ticket_id": line.ticket_id,
+                "quantity": line.quantity,
+                "subtotal": float(line.subtotal),
+            }
+            for line in purchase.purchase_tickets
+        ],
+    }), 201
+
+
+# -------------------------
+# REFUND A PURCHASE (your own, until REFUND_CUTOFF_HOURS before the
+# event; admins also those for their own events, at any time)
+# -------------------------
+@purchases_bp.route("/<int:purchase_id>/refund", methods=["POST"])
+@login_required
+def refund(purchase_id):
+    customer = current_customer()
+    # every organizer is an admin: scope admins to the events they organize
+    organizer = customer.email if customer.role == "admin" else None
+
+    try:
+        purchase = refund_purchase(purchase_id, customer_id=customer.customer_id,
+                                   organizer_email=organizer)
+    except PurchaseError as e:
+        return jsonify({"error": str(e)}), e.status_code
+
+    return jsonify({
+        "purchase_id": purchase.purchase_id,
+        "total_amount": float(purchase.total_amount),
+        "payment_status": purchase.payment_status,
+    }), 200
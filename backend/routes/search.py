@@ -1,7 +1,8 @@
 from flask import Blueprint, jsonify, request
 from backend.models.customer import Event, Venue, Category, Ticket
 from backend.db import db
-from sqlalchemy import and_, or_
+from backend.services.reference_data import venue_ids_in_city
+from backend.services.search_index import search_event_ids
 from datetime import datetime, timedelta
 
 search_bp = Blueprint("search", __name__, url_prefix="/events")
@@ -16,48 +17,58 @@ def filter_events():
     # Base query
     query = db.session.query(Event, Venue, Category).join(Venue).join(Category)
 
-    # Keyword search
-    if keyword:
-        query = query.filter(
-            or_(
-                Event.event_name.ilike(f"%{keyword}%"),
-                Event.description.ilike(f"%{keyword}%")
-            )
-        )
-
-    # Location filter
-    if city:
-        query = query.filter(Venue.city == city)
-
     # Date filter
     now = datetime.now()
+    start = end = None
 
     if date_filter == "today":
         start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         end = start + timedelta(days=1)
-        query = query.filter(Event.event_date.between(start, end))
 
     elif date_filter == "week":
         end = now + timedelta(days=7)
-        query = query.filter(Event.event_date <= end)
 
     elif date_filter == "month":
         end = now + timedelta(days=30)
-        query = query.filter(Event.event_date <= end)
 
     elif date_filter == "year":
         end = now + timedelta(days=365)
+
+    # Keyword search (search index instead of ILIKE scans); the location and
+    # dates are filtered in the index too, before it caps the result count
+    ranked_ids = search_event_ids(
+        keyword,
+        venue_ids=set(venue_ids_in_city(city)) if city else None,
+        dates=(start, end) if end else None,
+    ) if keyword else None
+    if ranked_ids is not None:
+        query = query.filter(Event.event_id.in_(ranked_ids))
+
+    # Location filter
+    if city:
+        query = query.filter(Venue.city == city)
+
+    if start:
+        query = query.filter(Event.event_date >= start)
+    if end:
         query = query.filter(Event.event_date <= end)
 
     events = query.all()
+    if ranked_ids is not None:
+        position = {event_id: i for i, event_id in enumerate(ranked_ids)}
+        events.sort(key=lambda row: position[row[0].event_id])
+
+    # Min ticket price for every event in one grouped query
+    min_prices = dict(
+        db.session.query(Ticket.event_id, db.func.min(Ticket.price))
+        .filter(Ticket.event_id.in_([event.event_id for event, _, _ in events]))
+        .group_by(Ticket.event_id)
+        .all()
+    ) if events else {}
 
     results = []
     for event, venue, category in events:
-
-        # Get min ticket price
-        min_price = db.session.query(db.func.min(Ticket.price)).filter(
-            Ticket.event_id == event.event_id
-        ).scalar()
+        min_price = min_prices.get(event.event_id)
 
         results.append({
             "event_id": event.event_id,
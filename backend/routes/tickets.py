@@ -1,23 +1,21 @@
 # backend/routes/tickets.py
 
-from flask import Blueprint, jsonify
+from flask import Blueprint
 from backend.models.customer import Ticket
+from backend.utils.pagination import paginated_list
 
 tickets_bp = Blueprint("tickets", __name__, url_prefix="/tickets")
 
+TICKET_FIELDS = {
+    "ticket_id": (Ticket.ticket_id, None),
+    "event_id": (Ticket.event_id, None),
+    "ticket_type": (Ticket.ticket_type, None),
+    "price": (Ticket.price, float),
+    "quantity_available": (Ticket.quantity_available, None),
+}
 
+
+# /api/tickets/?limit=&cursor=&fields=
 @tickets_bp.route("/", methods=["GET"])
 def get_tickets():
-    tickets = Ticket.query.all()
-
-    result = []
-    for t in tickets:
-        result.append({
-            "ticket_id": t.ticket_id,
-            "event_id": t.event_id,
-            "ticket_type": t.ticket_type,
-            "price": float(t.price),
-            "quantity_available": t.quantity_available,
-        })
-
-    return jsonify(result)
+    return paginated_list(TICKET_FIELDS, key=("ticket_id",))
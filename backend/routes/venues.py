@@ -1,19 +1,23 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint
 from backend.models.customer import Venue
+from backend.services.reference_data import get_venues as cached_venues
+from backend.utils.conditional import conditional
+from backend.utils.pagination import paginated_cached_list
 
 venues_bp = Blueprint("venues", __name__, url_prefix="/venues")
 
+VENUE_FIELDS = {
+    "venue_id": (Venue.venue_id, None),
+    "venue_name": (Venue.venue_name, None),
+    "address": (Venue.address, None),
+    "city": (Venue.city, None),
+    "capacity": (Venue.capacity, None),
+    "phone": (Venue.phone, None),
+}
+
+# /api/venues/?limit=&cursor=&fields=
+# (paged out of the reference data cache, see services/reference_data.py)
 @venues_bp.route("/", methods=["GET"])
+@conditional("venues", cache_control="public, max-age=300")
 def get_venues():
-    venues = Venue.query.all()
-    return jsonify([
-        {
-            "venue_id": v.venue_id,
-            "venue_name": v.venue_name,
-            "address": v.address,
-            "city": v.city,
-            "capacity": v.capacity,
-            "phone": v.phone
-        }
-        for v in venues
-    ])
+    return paginated_cached_list(cached_venues().values(), VENUE_FIELDS, key=("venue_id",))
@@ -0,0 +1,127 @@
+# backend/services/catalog_changes.py
+"""
+Catalog edits made by other worker processes.
+
+The in-memory read models (search_index.py, suggest.py) follow edits made
+in their own process through the signals in backend/signals.py, but a
+signal never leaves the process that sent it. So writers also log every
+edit to CATALOG_CHANGE inside the edit's own transaction (record_changes),
+and each process follows that log: at most every CATALOG_POLL_SECONDS
+(default 2) one primary-key range read fetches the rows past the last one
+it applied.
+
+Change ids are handed out at INSERT but become visible at COMMIT, so a
+lower id can show up after a higher one was read. A follower only moves
+its watermark past changes older than CATALOG_COMMIT_LAG_SECONDS (default
+10); younger ones it has handed out are remembered by id, so each change
+is handed out once, and one that commits late is still found.
+
+Writers delete rows older than RETAIN_SECONDS. A follower that hasn't
+polled for about that long, or that is handed more than MAX_BATCH
+changes at once (a large import), rebuilds instead.
+"""
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, insert, select
+
+from backend.db import db
+from backend.models.changes import CatalogChange
+
+DEFAULT_POLL_SECONDS = 2
+DEFAULT_COMMIT_LAG_SECONDS = 10
+RETAIN_SECONDS = 3600
+MAX_BATCH = 10000
+
+# what a follower has to apply; rebuild=True means start over instead
+Changes = namedtuple("Changes", "event_ids venue_ids rebuild")
+
+
+def record_changes(event_ids=(), venue_ids=()):
+    """Log catalog edits in the writer's transaction (the caller commits)."""
+    now = datetime.now()
+    rows = [{"event_id": event_id, "changed_at": now} for event_id in event_ids]
+    rows += [{"venue_id": venue_id, "changed_at": now} for venue_id in venue_ids]
+    if not rows:
+        return
+    db.session.execute(insert(CatalogChange), rows)
+    db.session.execute(
+        delete(CatalogChange)
+        .where(CatalogChange.changed_at < now - timedelta(seconds=RETAIN_SECONDS))
+    )
+
+
+class ChangeFollower:
+    """How far one in-memory read model has got through CATALOG_CHANGE."""
+
+    def __init__(self):
+        self.watermark = None      # every change up to this one is applied
+        self._handed_out = set()   # ids past the watermark applied already
+        self._polled_at = 0.0
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Call right before a full build; changes from then on come out of poll()."""
+        self.watermark = db.session.scalar(
+            select(CatalogChange.change_id)
+            .where(CatalogChange.changed_at <= _cutoff())
+            .order_by(CatalogChange.change_id.desc())
+            .limit(1)
+        ) or 0
+        self._handed_out = set()
+        self._polled_at = time.monotonic()
+
+    def due(self, config):
+        interval = config.get("CATALOG_POLL_SECONDS", DEFAULT_POLL_SECONDS)
+        return self.watermark is not None and time.monotonic() - self._polled_at >= interval
+
+    def poll(self):
+        """
+        The changes to apply, or None: not due yet, another thread is
+        polling, or nothing changed.
+        """
+        if not self.due(current_app.config) or not self._lock.acquire(blocking=False):
+            return None
+        try:
+            now = time.monotonic()
+            idle, self._polled_at = now - self._polled_at, now
+            rows = db.session.execute(
+                select(CatalogChange.change_id, CatalogChange.event_id,
+                       CatalogChange.venue_id, CatalogChange.changed_at)
+                .where(CatalogChange.change_id > self.watermark)
+                .order_by(CatalogChange.change_id)
+                .limit(MAX_BATCH + 1)
+            ).all()
+            # rows we still needed may have been pruned meanwhile
+            if idle > RETAIN_SECONDS - _commit_lag() or len(rows) > MAX_BATCH:
+                return Changes((), (), rebuild=True)
+            new = [row for row in rows if row.change_id not in self._handed_out]
+            self._handed_out.update(row.change_id for row in new)
+
+            cutoff = _cutoff()
+            for row in rows:
+                if row.changed_at > cutoff:
+                    break
+                self.watermark = row.change_id
+            self._handed_out = {i for i in self._handed_out if i > self.watermark}
+
+            if not new:
+                return None
+            return Changes(
+                sorted({row.event_id for row in new if row.event_id is not None}),
+                sorted({row.venue_id for row in new if row.venue_id is not None}),
+                rebuild=False,
+            )
+        finally:
+            self._lock.release()
+
+
+def _commit_lag():
+    return current_app.config.get("CATALOG_COMMIT_LAG_SECONDS", DEFAULT_COMMIT_LAG_SECONDS)
+
+
+def _cutoff():
+    return datetime.now() - timedelta(seconds=_commit_lag())
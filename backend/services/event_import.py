@@ -0,0 +1,322 @@
+# backend/services/event_import.py
+"""
+Bulk import of events with their ticket tiers (POST /api/admin/events/bulk).
+
+The upload is CSV (header row) or NDJSON, one event per row:
+
+    event_name,event_date,category_id,venue_id,total_tickets,description,status,tiers
+    Jazz Night,2030-03-01T19:30:00,1,2,400,,Upcoming,General Admission:45.00:350|VIP:90.00:50
+
+    {"event_name": "Jazz Night", "event_date": "2030-03-01T19:30:00", ...,
+     "tiers": [{"ticket_type": "VIP", "price": "90.00", "quantity": 50}]}
+
+Rows are parsed and validated one at a time as the body streams in
+(category / venue ids against the reference data cache, no queries), and
+valid rows are written BULK_IMPORT_CHUNK_SIZE (default 1000) at a time: one executemany INSERT for
+the events (with RETURNING where the driver supports it; elsewhere, e.g.
+MySQL, the rows are stamped with a batch key and their ids read back by
+it), one for all their tiers, one commit. A chunk the database rejects is rolled back and retried row by
+row, so one bad row only costs itself.
+
+Every invalid or rejected row ends up in the report with its row number
+(1 = first data row); the rest are imported.
+"""
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from flask import current_app
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.db import db
+from backend.models.customer import Event, Ticket
+from backend.services.catalog_changes import record_changes
+from backend.services.reference_data import get_categories, get_venues
+from backend.signals import customer_changed, events_imported
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# the report lists at most this many failed rows (all are counted)
+MAX_REPORTED_ERRORS = 1000
+
+FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+STATUSES = ("Upcoming", "Ongoing", "Completed", "Cancelled")
+
+
+class UploadError(Exception):
+    """The upload as a whole can't be read (bad format, not UTF-8...)."""
+
+
+class ImportReport:
+    def __init__(self):
+        self.imported = 0
+        self.tiers = 0
+        self.failed = 0
+        self.errors = []
+        self.event_ids = []
+
+    def fail(self, row, messages):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "errors": messages})
+
+    def to_json(self):
+        return {
+            "imported": self.imported,
+            "tiers": self.tiers,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def upload_format(fmt, mimetype):
+    """'csv' / 'ndjson' from ?format= or the Content-Type, else None."""
+    if fmt:
+        return fmt.lower() if fmt.lower() in FORMATS else None
+    for name, known in FORMATS.items():
+        if mimetype == known:
+            return name
+    return None
+
+
+def read_rows(stream, fmt):
+    """Yield (row number, dict) from a binary stream, or (row number, error)."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            for number, row in enumerate(reader, 1):
+                yield number, row
+            return
+
+        number = 0
+        for line in text:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield number, "not valid JSON"
+                continue
+            yield number, row if isinstance(row, dict) else "not a JSON object"
+    except UnicodeDecodeError as e:
+        raise UploadError("Upload is not valid UTF-8") from e
+    except csv.Error as e:
+        raise UploadError(f"Malformed CSV: {e}") from e
+    finally:
+        text.detach()
+
+
+def import_events(rows, organizer, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """Validate and insert `rows` from read_rows(); returns an ImportReport."""
+    report = ImportReport()
+    categories = get_categories()
+    venues = get_venues()
+    organizer_name = f"{organizer.first_name} {organizer.last_name}"
+
+    chunk = []
+    for number, row in rows:
+        if isinstance(row, str):
+            report.fail(number, [row])
+            continue
+        try:
+            values, tiers = _validate(row, categories, venues)
+        except _RowInvalid as e:
+            report.fail(number, e.messages)
+            continue
+
+        values["organizer_name"] = organizer_name
+        values["organizer_email"] = organizer.email
+        chunk.append((number, values, tiers))
+        if len(chunk) >= chunk_size:
+            _write(chunk, report, dry_run)
+            chunk = []
+    if chunk:
+        _write(chunk, report, dry_run)
+
+    if report.event_ids:
+        app = current_app._get_current_object()
+        events_imported.send(app, event_ids=report.event_ids)
+        # ownership decides the effective role (services/identity.py)
+        customer_changed.send(app, email=organizer.email)
+    return report
+
+
+# ------------------------------------------------------------
+# validation
+# ------------------------------------------------------------
+class _RowInvalid(Exception):
+    def __init__(self, messages):
+        super().__init__("; ".join(messages))
+        self.messages = messages
+
+
+def _validate(row, categories, venues):
+    errors = []
+
+    def text(name, max_length, required=True):
+        value = row.get(name)
+        value = value.strip() if isinstance(value, str) else value
+        if value in (None, ""):
+            if required:
+                errors.append(f"{name} is required")
+            return None
+        if not isinstance(value, str) or len(value) > max_length:
+            errors.append(f"{name} must be text of at most {max_length} characters")
+            return None
+        return value
+
+    def integer(name, minimum):
+        value = row.get(name)
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            errors.append(f"{name} must be an integer")
+            return None
+        if value < minimum:
+            errors.append(f"{name} must be at least {minimum}")
+            return None
+        return value
+
+    event_name = text("event_name", 150)
+    description = text("description", 65535, required=False)
+
+    event_date = None
+    try:
+        event_date = datetime.fromisoformat(str(row.get("event_date") or "").strip())
+    except ValueError:
+        errors.append("event_date must be an ISO date/time")
+
+    category_id = integer("category_id", 1)
+    if category_id is not None and category_id not in categories:
+        errors.append(f"category_id {category_id} does not exist")
+    venue_id = integer("venue_id", 1)
+    if venue_id is not None and venue_id not in venues:
+        errors.append(f"venue_id {venue_id} does not exist")
+    total_tickets = integer("total_tickets", 1)
+
+    status = row.get("status") or "Upcoming"
+    if status not in STATUSES:
+        errors.append(f"status must be one of {', '.join(STATUSES)}")
+
+    tiers = _tiers(row.get("tiers"), errors)
+    seats = sum(t["quantity_available"] for t in tiers)
+    if total_tickets is not None and seats > total_tickets:
+        errors.append(f"tiers offer {seats} seats but total_tickets is {total_tickets}")
+
+    if errors:
+        raise _RowInvalid(errors)
+
+    values = {
+        "event_name": event_name,
+        "event_date": event_date,
+        "description": description or "",
+        "category_id": category_id,
+        "venue_id": venue_id,
+        "total_tickets": total_tickets,
+        "tickets_sold": 0,
+        "status": status,
+    }
+    return values, tiers
+
+
+def _tiers(value, errors):
+    """Tiers as a list of dicts, or CSV-style 'type:price:quantity|...'."""
+    if value in (None, ""):
+        return []
+    if isinstance(value, str):
+        value = [
+            dict(zip(("ticket_type", "price", "quantity"), part.rsplit(":", 2)))
+            for part in value.split("|") if part.strip()
+        ]
+    if not isinstance(value, list):
+        errors.append("tiers must be a list")
+        return []
+
+    tiers = []
+    for i, tier in enumerate(value, 1):
+        if not isinstance(tier, dict):
+            errors.append(f"tier {i} must be an object")
+            continue
+        ticket_type = str(tier.get("ticket_type") or "").strip()
+        try:
+            price = Decimal(str(tier.get("price"))).quantize(Decimal("0.01"))
+            quantity = int(tier.get("quantity"))
+        except (InvalidOperation, TypeError, ValueError):
+            errors.append(f"tier {i} needs ticket_type, price and quantity")
+            continue
+        if not ticket_type or len(ticket_type) > 50:
+            errors.append(f"tier {i} ticket_type must be 1-50 characters")
+        elif price < 0 or quantity < 0:
+            errors.append(f"tier {i} price and quantity can't be negative")
+        else:
+            tiers.append({"ticket_type": ticket_type, "price": price,
+                          "quantity_available": quantity})
+    return tiers
+
+
+# ------------------------------------------------------------
+# writes
+# ------------------------------------------------------------
+def _write(chunk, report, dry_run):
+    if dry_run:
+        report.imported += len(chunk)
+        report.tiers += sum(len(tiers) for _, _, tiers in chunk)
+        return
+
+    try:
+        _insert(chunk, report)
+        return
+    except SQLAlchemyError:
+        db.session.rollback()
+
+    # find the offending rows: one transaction per row
+    for item in chunk:
+        try:
+            _insert([item], report)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            report.fail(item[0], [f"rejected by the database: {getattr(e, 'orig', None) or e}"])
+
+
+def _insert(chunk, report):
+    event_ids = _insert_events([values for _, values, _ in chunk])
+    tickets = [
+        dict(tier, event_id=event_id)
+        for event_id, (_, _, tiers) in zip(event_ids, chunk)
+        for tier in tiers
+    ]
+    if tickets:
+        db.session.execute(insert(Ticket), tickets)
+    record_changes(event_ids)
+    db.session.commit()
+
+    report.imported += len(event_ids)
+    report.tiers += len(tickets)
+    report.event_ids.extend(event_ids)
+
+
+def _insert_events(rows):
+    dialect = db.session.get_bind().dialect
+    if dialect.insert_executemany_returning_sort_by_parameter_order:
+        stmt = insert(Event).returning(Event.event_id, sort_by_parameter_order=True)
+        return list(db.session.execute(stmt, rows).scalars())
+
+    # e.g. MySQL: no RETURNING. Auto-increment ids may have gaps when
+    # another session inserts at the same time (innodb_autoinc_lock_mode
+    # 2), but one INSERT's rows still get them in row order
+    batch = uuid.uuid4().hex
+    db.session.execute(insert(Event), [dict(row, import_batch=batch) for row in rows])
+    return list(db.session.scalars(
+        select(Event.event_id).where(Event.import_batch == batch).order_by(Event.event_id)
+    ))
@@ -0,0 +1,172 @@
+# backend/services/hashing.py
+"""
+Password hashing off the request threads.
+
+pbkdf2 is deliberately slow (tens of ms of pure CPU per hash or verify).
+Done on the request thread, a login / registration burst at on-sale time
+starves every other request in the worker. So hashing and verifying go
+through a PasswordHasher:
+
+* the work runs on a small process pool (HASHER_WORKERS processes,
+  default 2; 0 runs it inline, e.g. in tests)
+* at most HASHER_MAX_PENDING calls may be queued or running at once; a
+  caller that can't get a slot within HASHER_TIMEOUT seconds (or whose
+  hash doesn't finish in that time) gets HasherBusy, which the app
+  answers with a 503 + Retry-After instead of piling up more waiting threads
+* PBKDF2_ROUNDS sets the cost of new hashes; needs_rehash() tells login
+  when a stored hash was made with other settings so it can be upgraded
+* stats() reports queue depth and counters (GET /api/admin/metrics/hashing)
+"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from flask import current_app, jsonify
+from passlib.hash import pbkdf2_sha256
+
+DEFAULT_ROUNDS = pbkdf2_sha256.default_rounds
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 64
+DEFAULT_TIMEOUT_SECONDS = 5.0
+
+
+class HasherBusy(Exception):
+    status_code = 503
+    retry_after = 1
+
+
+# run inside the pool's worker processes (must be importable top-level)
+
+def _hash(password, rounds):
+    return pbkdf2_sha256.using(rounds=rounds).hash(password)
+
+
+def _verify(password, password_hash):
+    try:
+        return pbkdf2_sha256.verify(password, password_hash)
+    except ValueError:
+        # not a pbkdf2 hash at all (e.g. a placeholder in sample data)
+        return False
+
+
+class PasswordHasher:
+    def __init__(self, rounds=DEFAULT_ROUNDS, workers=DEFAULT_WORKERS,
+                 max_pending=DEFAULT_MAX_PENDING, timeout=DEFAULT_TIMEOUT_SECONDS):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._scheme = pbkdf2_sha256.using(rounds=rounds)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pool = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._busy_seconds = 0.0
+
+    def hash(self, password):
+        return self._run(_hash, password, self.rounds)
+
+    def verify(self, password, password_hash):
+        if not password_hash:
+            return False
+        return self._run(_verify, password, password_hash)
+
+    def needs_rehash(self, password_hash):
+        """True if the hash wasn't made with the current PBKDF2_ROUNDS."""
+        try:
+            return self._scheme.needs_update(password_hash)
+        except ValueError:
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "rounds": self.rounds,
+                "pending": self.pending,
+                "max_pending": self.max_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "avg_ms": round(self._busy_seconds / self.completed * 1000, 2)
+                if self.completed else None,
+            }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _run(self, fn, *args):
+        started = time.perf_counter()
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self.rejected += 1
+            raise HasherBusy("Too many logins at once, please retry")
+
+        with self._lock:
+            self.pending += 1
+        try:
+            if not self.workers:
+                result = fn(*args)
+            else:
+                remaining = max(self.timeout - (time.perf_counter() - started), 0.01)
+                future = self._executor().submit(fn, *args)
+                try:
+                    result = future.result(timeout=remaining)
+                except FutureTimeout:
+                    # the slot stays taken until the worker is really done
+                    future.add_done_callback(lambda _: self._release())
+                    with self._lock:
+                        self.timed_out += 1
+                    raise HasherBusy("Too many logins at once, please retry") from None
+        except HasherBusy:
+            raise
+        except BaseException:
+            self._release()
+            raise
+
+        with self._lock:
+            self.completed += 1
+            self._busy_seconds += time.perf_counter() - started
+        self._release()
+        return result
+
+    def _release(self):
+        with self._lock:
+            self.pending -= 1
+        self._slots.release()
+
+    def _executor(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawn, not fork: forking a threaded server process is unsafe
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._pool
+
+
+def init_hasher(app):
+    app.extensions["password_hasher"] = PasswordHasher(
+        rounds=app.config.get("PBKDF2_ROUNDS", DEFAULT_ROUNDS),
+        workers=app.config.get("HASHER_WORKERS", DEFAULT_WORKERS),
+        max_pending=app.config.get("HASHER_MAX_PENDING", DEFAULT_MAX_PENDING),
+        timeout=app.config.get("HASHER_TIMEOUT", DEFAULT_TIMEOUT_SECONDS),
+    )
+    app.register_error_handler(HasherBusy, _busy_response)
+
+
+def get_hasher():
+    return current_app.extensions["password_hasher"]
+
+
+def _busy_response(e):
+    return jsonify({"error": str(e)}), e.status_code, {"Retry-After": str(e.retry_after)}
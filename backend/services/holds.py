@@ -0,0 +1,247 @@
+# backend/services/holds.py
+"""
+Time-limited seat holds (cart reservations).
+
+A hold parks `quantity` seats of one ticket tier for one customer for
+HOLD_TTL_SECONDS while they pay. Holds are rows in SEAT_HOLD, so every
+worker process sees the same ones, and placing a hold takes its seats
+off sale right away with the same conditional UPDATE a purchase uses
+(purchasing.take_seats):
+
+    UPDATE TICKET SET quantity_available = quantity_available - :qty
+    WHERE ticket_id = :id AND quantity_available >= :qty
+
+so the check and the reservation are one statement: seats can't be
+both held and sold, and everything that reads quantity_available
+already treats held seats as gone. Renewing a hold moves only the
+difference.
+
+create_purchase(..., holds=store) claims the buyer's holds inside the
+purchase transaction: seats they already hold aren't taken twice, and a
+hold bigger than the purchase puts the rest back.
+
+Expired holds are put back on sale by expire(). It deletes a hold only
+if the row is still the one it saw expire, and returns the seats only
+if that DELETE matched -- so any number of workers may sweep at once,
+and a hold renewed or checked out in the meantime is left alone. The
+hold and purchase write paths sweep first; run `flask expire-holds`
+every minute or so for read-only traffic.
+
+A hold can't be bigger than a purchase may take from one tier
+(MAX_QUANTITY_PER_TIER), and a customer holds at most
+HOLD_MAX_PER_CUSTOMER tiers at a time, so nobody can park a tier's
+stock in holds they could never check out.
+"""
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, func, select
+
+from backend.db import db
+from backend.models.customer import Customer, SeatHold, Ticket
+from backend.services.purchasing import MAX_QUANTITY_PER_TIER, return_seats, take_seats
+from backend.signals import inventory_changed
+
+DEFAULT_HOLD_TTL_SECONDS = 600
+DEFAULT_MAX_HOLDS_PER_CUSTOMER = 10
+
+# expired holds put back per expire() call on the request path
+EXPIRE_BATCH_SIZE = 100
+
+
+class HoldError(Exception):
+    """Too few seats left to hold -> 409."""
+    status_code = 409
+
+
+class HoldLimitError(HoldError):
+    """Hold bigger than a purchase could be, or too many holds -> 400."""
+    status_code = 400
+
+
+class HoldNotFound(HoldError):
+    status_code = 404
+
+
+class SeatHolds:
+    """Hold settings; every operation works on SEAT_HOLD through db.session."""
+
+    def __init__(self, ttl_seconds=DEFAULT_HOLD_TTL_SECONDS,
+                 max_per_customer=DEFAULT_MAX_HOLDS_PER_CUSTOMER, clock=datetime.now):
+        self.ttl_seconds = ttl_seconds
+        self.max_per_customer = max_per_customer
+        self.clock = clock
+
+    def hold(self, customer_id, ticket_id, quantity):
+        """
+        Create or replace the customer's hold on a tier, and commit.
+
+        Raises HoldNotFound for an unknown tier, HoldError if too few seats
+        are left, and HoldLimitError past MAX_QUANTITY_PER_TIER seats or,
+        for a new hold, past max_per_customer tiers held.
+        """
+        if quantity < 1:
+            raise HoldLimitError("quantity must be at least 1")
+        if quantity > MAX_QUANTITY_PER_TIER:
+            raise HoldLimitError(f"At most {MAX_QUANTITY_PER_TIER} tickets per tier")
+
+        self.expire()
+        event_id = db.session.scalar(select(Ticket.event_id).where(Ticket.ticket_id == ticket_id))
+        if event_id is None:
+            raise HoldNotFound("Ticket not found")
+
+        now = self.clock()
+        try:
+            # one customer's hold changes run one at a time, so two new
+            # holds can't both pass the limit (or insert the same row)
+            db.session.execute(
+                select(Customer.customer_id)
+                .where(Customer.customer_id == customer_id)
+                .with_for_update()
+            )
+            mine = db.session.scalars(
+                select(SeatHold)
+                .where(SeatHold.customer_id == customer_id, SeatHold.ticket_id == ticket_id)
+                .with_for_update()
+            ).first()
+
+            if mine is None:
+                active = db.session.scalar(
+                    select(func.count())
+                    .select_from(SeatHold)
+                    .where(SeatHold.customer_id == customer_id, SeatHold.expires_at > now)
+                )
+                if active >= self.max_per_customer:
+                    raise HoldLimitError(f"At most {self.max_per_customer} active holds at a time")
+
+            extra = quantity - (mine.quantity if mine else 0)
+            if extra > 0 and not take_seats(ticket_id, extra):
+                raise HoldError(f"Not enough tickets left for ticket {ticket_id}")
+            if extra < 0:
+                return_seats(ticket_id, -extra)
+
+            if mine is None:
+                mine = SeatHold(customer_id=customer_id, ticket_id=ticket_id)
+                db.session.add(mine)
+            mine.quantity = quantity
+            mine.expires_at = now + timedelta(seconds=self.ttl_seconds)
+            db.session.commit()
+
+        except Exception:
+            db.session.rollback()
+            raise
+
+        if extra:
+            _inventory_changed([event_id])
+        return mine
+
+    def release(self, customer_id, ticket_id):
+        """Drop an active hold and put its seats back; False if there was none."""
+        self.expire()
+        mine = db.session.execute(
+            select(SeatHold.quantity, SeatHold.expires_at, Ticket.event_id)
+            .join(Ticket, Ticket.ticket_id == SeatHold.ticket_id)
+            .where(SeatHold.customer_id == customer_id, SeatHold.ticket_id == ticket_id)
+        ).first()
+        if mine is None:
+            return False
+
+        released = _drop(customer_id, ticket_id, mine.quantity, mine.expires_at)
+        db.session.commit()
+        if released:
+            _inventory_changed([mine.event_id])
+        return released
+
+    def claim(self, customer_id, ticket_ids):
+        """
+        Delete the customer's holds on these tiers inside the caller's
+        transaction; returns {ticket_id: seats held}. Those seats are
+        already off sale, so the caller must not take them again.
+        """
+        mine = db.session.execute(
+            select(SeatHold.ticket_id, SeatHold.quantity)
+            .where(SeatHold.customer_id == customer_id, SeatHold.ticket_id.in_(list(ticket_ids)))
+            .order_by(SeatHold.ticket_id)
+            .with_for_update()
+        ).all()
+
+        claimed = {}
+        for ticket_id, quantity in mine:
+            # a sweep that got there first has put the seats back already
+            result = db.session.execute(
+                delete(SeatHold).where(
+                    SeatHold.customer_id == customer_id,
+                    SeatHold.ticket_id == ticket_id,
+                    SeatHold.quantity == quantity,
+                )
+            )
+            if result.rowcount == 1:
+                claimed[ticket_id] = quantity
+        return claimed
+
+    def holds_for(self, customer_id):
+        return (
+            SeatHold.query
+            .filter(SeatHold.customer_id == customer_id, SeatHold.expires_at > self.clock())
+            .order_by(SeatHold.ticket_id)
+            .all()
+        )
+
+    def expires_in(self, hold):
+        return max((hold.expires_at - self.clock()).total_seconds(), 0)
+
+    def expire(self, limit=EXPIRE_BATCH_SIZE):
+        """Put the seats of up to `limit` expired holds back on sale; returns how many."""
+        due = db.session.execute(
+            select(SeatHold.customer_id, SeatHold.ticket_id, SeatHold.quantity,
+                   SeatHold.expires_at, Ticket.event_id)
+            .join(Ticket, Ticket.ticket_id == SeatHold.ticket_id)
+            .where(SeatHold.expires_at <= self.clock())
+            .order_by(SeatHold.expires_at)
+            .limit(limit)
+        ).all()
+        db.session.commit()
+
+        expired = set()
+        for customer_id, ticket_id, quantity, expires_at, event_id in due:
+            # one short transaction per hold: never waits on one row while
+            # holding another
+            if _drop(customer_id, ticket_id, quantity, expires_at):
+                expired.add(event_id)
+            db.session.commit()
+
+        if expired:
+            _inventory_changed(sorted(expired))
+        return len(due)
+
+
+def _drop(customer_id, ticket_id, quantity, expires_at):
+    # matches only the hold as it was read: if it was renewed, claimed or
+    # dropped since, nothing is deleted and no seats are returned
+    result = db.session.execute(
+        delete(SeatHold).where(
+            SeatHold.customer_id == customer_id,
+            SeatHold.ticket_id == ticket_id,
+            SeatHold.quantity == quantity,
+            SeatHold.expires_at == expires_at,
+        )
+    )
+    if result.rowcount != 1:
+        return False
+    return_seats(ticket_id, quantity)
+    return True
+
+
+def _inventory_changed(event_ids):
+    inventory_changed.send(current_app._get_current_object(), event_ids=event_ids)
+
+
+def init_holds(app):
+    app.extensions["seat_holds"] = SeatHolds(
+        ttl_seconds=app.config.get("HOLD_TTL_SECONDS", DEFAULT_HOLD_TTL_SECONDS),
+        max_per_customer=app.config.get("HOLD_MAX_PER_CUSTOMER", DEFAULT_MAX_HOLDS_PER_CUSTOMER),
+    )
+
+
+def get_holds():
+    return current_app.extensions["seat_holds"]
@@ -0,0 +1,86 @@
+# backend/services/identity.py
+"""
+JWT identity (email) -> compact customer record, cached.
+
+Authorizing a request only needs a handful of CUSTOMER columns, so
+they're read once into a CustomerRecord and kept in a bounded TTL cache
+(IDENTITY_CACHE_SIZE entries, IDENTITY_CACHE_TTL seconds, default 60)
+instead of queried on every authenticated call.
+
+The record's role is the *effective* role: customers who organize at
+least one event count as admins. Ownership is read with an indexed
+EXISTS on EVENT.organizer_email rather than written back to
+CUSTOMER.role, so login stays a read.
+
+Anything that changes a customer's role or account -- or which events
+they organize -- should send customer_changed (backend/signals.py) after
+committing; that drops the cached record in this process. The TTL bounds
+how long another worker keeps its copy.
+"""
+from collections import namedtuple
+
+from flask import current_app
+
+from backend.db import db
+from backend.models.customer import Customer, Event
+from backend.signals import customer_changed
+from backend.utils.cache import TTLCache
+
+DEFAULT_TTL_SECONDS = 60
+
+CustomerRecord = namedtuple("CustomerRecord", "customer_id email first_name last_name role")
+
+
+def init_identity(app):
+    app.extensions["identity_cache"] = TTLCache(
+        maxsize=app.config.get("IDENTITY_CACHE_SIZE", 4096),
+        ttl=app.config.get("IDENTITY_CACHE_TTL", DEFAULT_TTL_SECONDS),
+    )
+    customer_changed.connect(_on_customer_changed, app)
+
+
+def get_customer_record(email):
+    """The CustomerRecord for an email, or None if there's no such account."""
+    if not email:
+        return None
+    # unknown emails aren't cached, so a fresh registration is seen at once
+    return current_app.extensions["identity_cache"].get_or_load(
+        email, lambda: _load(email), cache_none=False
+    )
+
+
+def owns_events():
+    """Correlated EXISTS: does the customer in the query organize any event?"""
+    return db.exists().where(Event.organizer_email == Customer.email).label("owns_events")
+
+
+def effective_role(role, owns_events):
+    return "admin" if role == "admin" or owns_events else (role or "user")
+
+
+def invalidate_customer(email=None):
+    """Drop one cached record (or all of them when email is None)."""
+    current_app.extensions["identity_cache"].invalidate(email)
+
+
+def _on_customer_changed(app, email=None, **extra):
+    app.extensions["identity_cache"].invalidate(email)
+
+
+def _load(email):
+    row = (
+        db.session.query(
+            Customer.customer_id,
+            Customer.email,
+            Customer.first_name,
+            Customer.last_name,
+            Customer.role,
+            owns_events(),
+        )
+        .filter(Customer.email == email)
+        .first()
+    )
+    if row is None:
+        return None
+    *fields, role, owns = row
+    return CustomerRecord(*fields, effective_role(role, owns))
@@ -0,0 +1,233 @@
+# backend/services/index_advisor.py
+"""
+Index advisor: EXPLAIN the query shapes the app actually runs.
+
+The shapes come from utils/sql_metrics.py, which keeps one example
+(statement + parameters) of every SELECT shape a request ran. Two ways
+to fill it:
+
+    GET /api/admin/metrics/index-advice   the shapes this process has
+                                          served so far (live traffic)
+    flask index-advisor [--path ...]      replay the hot reads (REPLAY_PATHS,
+                                          or --path) through the app first
+
+Each shape is EXPLAINed on the primary (EXPLAIN QUERY PLAN on SQLite,
+EXPLAIN on MySQL) and reported with:
+
+    full_scans   tables read start to end (SQLite "SCAN t" without an
+                 index, MySQL type=ALL)
+    temp_sort    the result is sorted / grouped in a temp structure
+                 (SQLite "USE TEMP B-TREE", MySQL "Using filesort" /
+                 "Using temporary")
+    suggestions  CREATE INDEX statements: for a scanned table, the columns
+                 the statement compares with = / IN first, then one range
+                 or the ORDER BY columns; for a sort, the = / IN columns
+                 then the ORDER BY columns. A matching index (or primary
+                 key) that exists but wasn't used is reported as such
+                 instead (tiny table, or a predicate the planner can't use).
+
+A full scan with no predicate on the table (the reference data loads,
+keyset pages in primary key order) gets no suggestion: reading
+everything is the point. Neither does a sort with no = / IN predicate
+on the sorted table (a sort over a join or a GROUP BY), which no single
+index removes.
+"""
+import re
+
+from flask import current_app
+from flask_jwt_extended import create_access_token
+from sqlalchemy import inspect
+
+from backend.db import db
+from backend.models import Category, Customer, Event, Venue
+from backend.utils.sql_metrics import SHAPE_LENGTH, explain, get_sql_metrics
+
+# hot reads replayed by `flask index-advisor` ({...} filled from the data)
+REPLAY_PATHS = (
+    "/api/events/?limit=50",
+    "/api/events/?limit=50&fields=event_id,event_name,event_date,status",
+    "/api/events/filter?location={city}",
+    "/api/events/filter?date=month",
+    "/api/events/cards?category={category}&limit=20",
+    "/api/events/{event_id}",
+    "/api/event-tickets/{event_id}",
+    "/api/tickets/?limit=50",
+    "/api/purchases/?limit=50",
+    "/api/customers/?limit=50",
+    "/api/admin/events",
+    "/api/admin/stats",
+)
+
+_COLUMN = r'"?(\w+)"?\."?(\w+)"?'
+_PREDICATE = re.compile(_COLUMN + r"\s*(=|<=|>=|<|>|\bIN\b|\bBETWEEN\b|\bLIKE\b|\bIS\b)", re.I)
+_ORDER_BY = re.compile(r"\bORDER BY\b(.*?)(?:\bLIMIT\b|\bOFFSET\b|\bFOR UPDATE\b|$)", re.I | re.S)
+_WHERE = re.compile(r"\bWHERE\b(.*?)(?:\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|$)", re.I | re.S)
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)$")
+_SQLITE_SORT = re.compile(r"USE TEMP B-TREE")
+
+
+def replay(app, paths=None):
+    """GET each path through the app, as an admin; returns {path: status}."""
+    client = app.test_client()
+    values = _placeholder_values()
+    headers = {}
+    admin = db.session.query(Customer.email).filter(Customer.role == "admin").first()
+    if admin is not None:
+        token = create_access_token(identity=admin.email, additional_claims={"role": "admin"})
+        headers["Authorization"] = f"Bearer {token}"
+
+    statuses = {}
+    for template in paths or REPLAY_PATHS:
+        path = template.format(**values)
+        statuses[path] = client.get(path, headers=headers).status_code
+    return statuses
+
+
+def _placeholder_values():
+    event_id = db.session.query(db.func.min(Event.event_id)).scalar()
+    city = db.session.query(Venue.city).order_by(Venue.venue_id).limit(1).scalar()
+    category = db.session.query(Category.category_name).order_by(Category.category_id).limit(1).scalar()
+    return {"event_id": event_id or 1, "city": city or "", "category": category or ""}
+
+
+def advise(shapes=None, engine=None):
+    """One report entry per shape, the ones with findings first."""
+    if shapes is None:
+        shapes = get_sql_metrics().shapes()
+    engine = engine or db.engine
+    dialect = engine.dialect.name
+    tables = {name.lower(): name for name in inspect(engine).get_table_names()}
+    indexes = {}
+
+    report = []
+    connection = engine.raw_connection()
+    try:
+        for shape, statement, parameters, runs, route in shapes:
+            entry = {
+                "shape": shape[:SHAPE_LENGTH],
+                "route": route,
+                "runs": runs,
+                "full_scans": [],
+                "temp_sort": False,
+                "suggestions": [],
+                "plan": None,
+            }
+            report.append(entry)
+            try:
+                plan = explain(dialect, connection, statement, parameters)
+            except Exception as e:  # e.g. a statement only valid inside its transaction
+                entry["plan"] = [f"EXPLAIN failed: {e}"]
+                continue
+            finally:
+                connection.rollback()
+            if plan is None:
+                continue
+
+            scans, entry["temp_sort"], entry["plan"] = _read_plan(dialect, plan)
+            entry["full_scans"] = [tables[t.lower()] for t in scans if t.lower() in tables]
+            targets = [(table, False) for table in entry["full_scans"]]
+            if entry["temp_sort"] and not targets:
+                targets = [(table, True) for table in _order_by_tables(statement)]
+            for table, for_sort in targets:
+                if table.lower() not in tables:
+                    continue
+                table = tables[table.lower()]
+                if table not in indexes:
+                    indexes[table] = _indexes(engine, table)
+                suggestion = _suggest(statement, table, indexes[table], for_sort)
+                if suggestion:
+                    entry["suggestions"].append(suggestion)
+    finally:
+        connection.close()
+
+    report.sort(key=lambda e: (not e["suggestions"], not (e["full_scans"] or e["temp_sort"]), -e["runs"]))
+    return report
+
+
+def _read_plan(dialect, plan):
+    """(tables scanned in full, sorts in a temp structure?, readable plan lines)"""
+    scans, temp_sort, lines = [], False, []
+    for row in plan:
+        if dialect == "sqlite":
+            detail = row["detail"]
+            lines.append(detail)
+            match = _SQLITE_SCAN.match(detail)
+            if match:
+                scans.append(match.group(1))
+            temp_sort = temp_sort or bool(_SQLITE_SORT.search(detail))
+        else:
+            extra = row.get("Extra") or ""
+            lines.append(
+                f"{row.get('table')}: type={row.get('type')} key={row.get('key')} "
+                f"rows={row.get('rows')} {extra}".rstrip()
+            )
+            if row.get("type") == "ALL" and row.get("table"):
+                scans.append(row["table"])
+            temp_sort = temp_sort or "Using filesort" in extra or "Using temporary" in extra
+    return scans, temp_sort, lines
+
+
+def _order_by_tables(statement):
+    match = _ORDER_BY.search(statement)
+    return list(dict.fromkeys(t for t, _ in re.findall(_COLUMN, match.group(1)))) if match else []
+
+
+def _indexes(engine, table):
+    """[(name, [columns])] of the table's indexes, primary key first."""
+    inspector = inspect(engine)
+    primary_key = inspector.get_pk_constraint(table)["constrained_columns"]
+    return [("PRIMARY KEY", primary_key)] + [
+        (index["name"], index["column_names"]) for index in inspector.get_indexes(table)
+    ]
+
+
+def _suggest(statement, table, existing, for_sort=False):
+    """A CREATE INDEX for `table` from the statement's predicates, or None."""
+    equal, ranged = [], []
+    where = _WHERE.search(statement)
+    for t, column, op in _PREDICATE.findall(where.group(1) if where else ""):
+        if t.lower() == table.lower():
+            (equal if op.upper() in ("=", "IN", "IS") else ranged).append(column)
+
+    order = []
+    match = _ORDER_BY.search(statement)
+    if match:
+        order = [c for t, c in re.findall(_COLUMN, match.group(1)) if t.lower() == table.lower()]
+
+    if for_sort:
+        if not equal or not order:
+            return None
+        columns = list(dict.fromkeys(equal + order))
+    else:
+        if not equal and not ranged:
+            return None
+        columns = list(dict.fromkeys(equal + (ranged[:1] or order)))
+
+    wanted = [c.lower() for c in columns]
+    for name, indexed in existing:
+        if [c.lower() for c in indexed[:len(wanted)]] == wanted:
+            return f"{name} on {table} ({', '.join(columns)}) exists but was not used"
+    name = f"idx_{table.lower()}_{'_'.join(columns)}"
+    return f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"
+
+
+def format_report(report, show_all=False):
+    lines = []
+    for entry in report:
+        if not show_all and not (entry["full_scans"] or entry["temp_sort"]):
+            continue
+        findings = [f"full scan of {t}" for t in entry["full_scans"]]
+        if entry["temp_sort"]:
+            findings.append("temp sort")
+        lines.append(f"[{entry['runs']}x {entry['route']}] {', '.join(findings) or 'ok'}")
+        lines.append(f"    {entry['shape']}")
+        for line in entry["plan"] or []:
+            lines.append(f"    plan: {line}")
+        for suggestion in entry["suggestions"]:
+            lines.append(f"    -> {suggestion}")
+    return "\n".join(lines)
+
+
+def replay_and_advise(paths=None):
+    replay(current_app, paths)
+    return advise()
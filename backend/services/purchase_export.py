@@ -0,0 +1,246 @@
+# backend/services/purchase_export.py
+"""
+Purchase export: one CSV line per purchased ticket tier, in the format of
+backend/exports/purchases_export.csv.
+
+    PURCHASE ⋈ PURCHASE_TICKET ⋈ TICKET ⋈ EVENT ⋈ CUSTOMER
+
+The join is read through a server-side cursor EXPORT_CHUNK_SIZE rows at a
+time (yield_per) and written out chunk by chunk, optionally gzipped, so
+memory stays flat however many purchases there are.
+
+Exports are incremental on purchase_id: export_purchases() keeps a
+watermark file next to the output (<output>.watermark) with the highest
+purchase_id written, and the next run only appends purchases after it.
+
+* purchase ids are handed out at INSERT but become visible at COMMIT,
+  so a lower id can show up after a higher one. A run only goes up to
+  the newest purchase dated at least EXPORT_COMMIT_LAG_SECONDS (60) ago:
+  every id below that one was taken earlier still, and its transaction
+  has had the lag to commit or roll back.
+* each run is written to <output>.partial first and only appended to
+  the output once it's complete. The watermark records the output's
+  size along with the purchase_id; a run that died after appending but
+  before moving the watermark has its rows cut off again (truncated to
+  that size) and redone by the next run.
+
+The output file therefore ends up with every purchase exactly once, but
+a reader tailing it can see rows that are then truncated and written
+again: treat what it reads as at-least-once and dedupe on
+(Purchase ID, Ticket Type).
+
+Used by `flask export-purchases` (backend/commands.py) and
+GET /api/admin/exports/purchases.
+"""
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from backend.db import db
+from backend.models.customer import Customer, Event, Purchase, PurchaseTicket, Ticket
+
+EXPORT_CHUNK_SIZE = 1000
+
+# how long a purchase may take to commit after it was dated
+DEFAULT_COMMIT_LAG_SECONDS = 60
+
+HEADER = [
+    "Purchase ID", "Customer ID", "Customer Email", "Event Name", "Ticket Type",
+    "Quantity", "Subtotal", "Total Amount", "Payment Method", "Payment Status",
+    "Purchase Date",
+]
+
+
+def export_query(after_id=0, up_to_id=None):
+    query = (
+        db.session.query(
+            Purchase.purchase_id,
+            Purchase.customer_id,
+            Customer.email,
+            Event.event_name,
+            Ticket.ticket_type,
+            PurchaseTicket.quantity,
+            PurchaseTicket.subtotal,
+            Purchase.total_amount,
+            Purchase.payment_method,
+            Purchase.payment_status,
+            Purchase.purchase_date,
+        )
+        .join(PurchaseTicket, PurchaseTicket.purchase_id == Purchase.purchase_id)
+        .join(Ticket, Ticket.ticket_id == PurchaseTicket.ticket_id)
+        .join(Event, Event.event_id == Ticket.event_id)
+        .join(Customer, Customer.customer_id == Purchase.customer_id)
+        .filter(Purchase.purchase_id > after_id)
+    )
+    if up_to_id is not None:
+        query = query.filter(Purchase.purchase_id <= up_to_id)
+    return query.order_by(Purchase.purchase_id, PurchaseTicket.purchase_ticket_id)
+
+
+def csv_chunks(after_id=0, up_to_id=None, header=True, stats=None):
+    """
+    Yield the export as str chunks of about EXPORT_CHUNK_SIZE lines.
+
+    stats (a dict), if given, gets "rows" and "last_purchase_id" filled in.
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault("rows", 0)
+    stats.setdefault("last_purchase_id", after_id)
+
+    if header:
+        yield _csv_lines([HEADER])
+
+    lines = []
+    for row in export_query(after_id, up_to_id).yield_per(EXPORT_CHUNK_SIZE):
+        lines.append(_csv_row(row))
+        stats["last_purchase_id"] = row.purchase_id
+        if len(lines) >= EXPORT_CHUNK_SIZE:
+            stats["rows"] += len(lines)
+            yield _csv_lines(lines)
+            lines = []
+    if lines:
+        stats["rows"] += len(lines)
+        yield _csv_lines(lines)
+
+
+def gzip_chunks(chunks):
+    """Compress a stream of str chunks into gzip bytes on the fly."""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb") as compressed:
+        for chunk in chunks:
+            compressed.write(chunk.encode("utf-8"))
+            if buffer.tell():
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_cutoff(commit_lag=None):
+    """
+    The highest purchase_id that is safe to export: that of the newest
+    purchase dated at least commit_lag seconds ago (EXPORT_COMMIT_LAG_SECONDS).
+    """
+    if commit_lag is None:
+        commit_lag = current_app.config.get(
+            "EXPORT_COMMIT_LAG_SECONDS", DEFAULT_COMMIT_LAG_SECONDS
+        )
+    query = db.session.query(db.func.max(Purchase.purchase_id))
+    if commit_lag:
+        query = query.filter(Purchase.purchase_date <= datetime.now() - timedelta(seconds=commit_lag))
+    return query.scalar() or 0
+
+
+def read_watermark(output):
+    return (_load_watermark(output) or {}).get("purchase_id", 0)
+
+
+def export_purchases(output, compress=False, full=False, commit_lag=None):
+    """
+    Append every purchase after the watermark to `output` (CSV, or gzip
+    when compress) and advance the watermark. full=True starts over.
+    commit_lag overrides EXPORT_COMMIT_LAG_SECONDS (see export_cutoff).
+
+    Returns {"rows", "from_purchase_id", "last_purchase_id", "output"}.
+    """
+    if full:
+        for path in (output, output + ".watermark"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    mark = _load_watermark(output)
+    if mark is None:
+        # note where this output starts before the first append, so that
+        # append can be undone too
+        mark = {"purchase_id": 0, "size": _size(output)}
+        _write_watermark(output, 0, 0, mark["size"])
+    elif mark.get("size") is not None and _size(output) > mark["size"]:
+        # the last run appended but died before moving the watermark
+        with open(output, "r+b") as f:
+            f.truncate(mark["size"])
+
+    after_id = mark["purchase_id"]
+    # a fixed upper bound, so purchases made while we run wait for next time
+    up_to_id = max(export_cutoff(commit_lag), after_id)
+
+    stats = {}
+    chunks = csv_chunks(after_id, up_to_id, header=not _size(output), stats=stats)
+    if compress:
+        chunks = gzip_chunks(chunks)
+
+    partial = output + ".partial"
+    with open(partial, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk if compress else chunk.encode("utf-8"))
+
+    # gzip members / CSV lines can simply be concatenated
+    if stats["rows"] or not _size(output):
+        with open(output, "ab") as out, open(partial, "rb") as part:
+            shutil.copyfileobj(part, out)
+            out.flush()
+            os.fsync(out.fileno())
+    os.remove(partial)
+
+    _write_watermark(output, stats["last_purchase_id"], stats["rows"], _size(output))
+    return {
+        "rows": stats["rows"],
+        "from_purchase_id": after_id,
+        "last_purchase_id": stats["last_purchase_id"],
+        "output": output,
+    }
+
+
+def _load_watermark(output):
+    try:
+        with open(output + ".watermark") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_watermark(output, purchase_id, rows, size):
+    tmp = output + ".watermark.tmp"
+    with open(tmp, "w") as f:
+        json.dump({
+            "purchase_id": purchase_id,
+            "rows": rows,
+            "size": size,  # bytes of output this watermark covers
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+        }, f)
+    os.replace(tmp, output + ".watermark")
+
+
+def _size(path):
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+def _csv_row(row):
+    return [
+        row.purchase_id,
+        row.customer_id,
+        row.email,
+        row.event_name,
+        row.ticket_type,
+        row.quantity,
+        float(row.subtotal),
+        float(row.total_amount),
+        row.payment_method,
+        row.payment_status,
+        row.purchase_date.strftime("%Y-%m-%d %H:%M:%S") if row.purchase_date else "",
+    ]
+
+
+def _csv_lines(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
@@ -0,0 +1,289 @@
+# backend/services/purchasing.py
+"""
+Ticket purchase write path.
+
+Inventory is taken with one conditional UPDATE per ticket tier:
+
+    UPDATE TICKET SET quantity_available = quantity_available - :qty
+    WHERE ticket_id = :id AND quantity_available >= :qty
+
+If the row didn't match, there weren't enough seats left (or the tier
+doesn't exist) and the whole purchase is rolled back, so stock can never
+go negative. Nothing is SELECTed FOR UPDATE up front, and tiers are
+always touched in ticket_id order so two multi-tier purchases can't
+deadlock. Buyers of one tier queue on its TICKET row until commit.
+
+Rows shared by every tier of an event -- its EVENT_SALES and
+EVENT_SALES_HOURLY rollups (services/sales_rollups.py), then
+EVENT.tickets_sold -- are written last, right before the commit, so
+buyers of different tiers of one event only wait for that short tail of
+each other's transaction. refund_purchase() undoes all of it in the
+same order: seats go back on sale and the rollups are taken back down.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from flask import current_app
+from sqlalchemy import or_, update
+
+from backend.db import db
+from backend.models.customer import Event, Purchase, PurchaseTicket, Ticket
+from backend.services.sales_rollups import record_refund, record_sale
+from backend.signals import inventory_changed
+
+PAYMENT_METHODS = ("Credit Card", "Debit Card", "PayPal", "Cash")
+
+# most tickets one purchase may take from a single tier
+MAX_QUANTITY_PER_TIER = 50
+
+# buyers may refund their own purchase until this long before the event
+# (app.config["REFUND_CUTOFF_HOURS"]); organizers and admins at any time
+DEFAULT_REFUND_CUTOFF_HOURS = 24
+
+
+class PurchaseError(Exception):
+    """Bad purchase request -> 400."""
+    status_code = 400
+
+
+class SoldOutError(PurchaseError):
+    """Not enough seats left in a tier -> 409."""
+    status_code = 409
+
+
+class PurchaseNotFound(PurchaseError):
+    status_code = 404
+
+
+class TicketNotFound(PurchaseError):
+    status_code = 404
+
+
+class AlreadyRefunded(PurchaseError):
+    status_code = 409
+
+
+class RefundClosed(PurchaseError):
+    """Buyer refund of an event that is over, cancelled or too close -> 409."""
+    status_code = 409
+
+
+def create_purchase(customer_id, items, payment_method, payment_status="Completed",
+                    holds=None):
+    """
+    Buy tickets for a customer in a single transaction.
+
+    items -- iterable of (ticket_id, quantity); repeated ids are merged
+    holds -- optional SeatHolds store: the buyer's own holds on these
+             tiers are claimed, so the seats they hold aren't taken twice
+    Returns the committed Purchase; raises PurchaseError / SoldOutError
+    with nothing written.
+    """
+    if payment_method not in PAYMENT_METHODS:
+        raise PurchaseError(f"payment_method must be one of {', '.join(PAYMENT_METHODS)}")
+
+    wanted = Counter()
+    for ticket_id, quantity in items:
+        if not isinstance(ticket_id, int) or not isinstance(quantity, int) or quantity < 1:
+            raise PurchaseError("Each ticket needs an integer ticket_id and a positive quantity")
+        wanted[ticket_id] += quantity
+
+    if not wanted:
+        raise PurchaseError("No tickets requested")
+    if any(q > MAX_QUANTITY_PER_TIER for q in wanted.values()):
+        raise PurchaseError(f"At most {MAX_QUANTITY_PER_TIER} tickets per tier")
+
+    if holds is not None:
+        holds.expire()
+
+    try:
+        # 1. take the seats (fixed order -> no deadlocks between buyers);
+        #    seats the buyer holds are off sale already
+        held = holds.claim(customer_id, wanted) if holds is not None else {}
+        for ticket_id, quantity in sorted(wanted.items()):
+            extra = quantity - held.get(ticket_id, 0)
+            if extra > 0 and not take_seats(ticket_id, extra):
+                if db.session.get(Ticket, ticket_id) is None:
+                    raise TicketNotFound(f"Ticket {ticket_id} not found")
+                raise SoldOutError(f"Not enough tickets left for ticket {ticket_id}")
+            if extra < 0:
+                return_seats(ticket_id, -extra)
+
+        # 2. price the line items (one query for every tier)
+        tiers = {
+            t.ticket_id: t
+            for t in db.session.query(Ticket.ticket_id, Ticket.event_id, Ticket.price)
+            .filter(Ticket.ticket_id.in_(list(wanted)))
+        }
+
+        lines = []
+        sold_per_event = Counter()
+        for ticket_id, quantity in sorted(wanted.items()):
+            tier = tiers[ticket_id]
+            lines.append(PurchaseTicket(
+                ticket_id=ticket_id,
+                quantity=quantity,
+                subtotal=Decimal(tier.price) * quantity,
+            ))
+            sold_per_event[tier.event_id] += quantity
+
+        purchased_at = datetime.now()
+        purchase = Purchase(
+            customer_id=customer_id,
+            purchase_date=purchased_at,
+            total_amount=sum(line.subtotal for line in lines),
+            payment_method=payment_method,
+            payment_status=payment_status,
+            purchase_tickets=lines,
+        )
+        db.session.add(purchase)
+        db.session.flush()
+
+        # 3. dashboard rollups, same transaction (per-tier rows, then per-event)
+        record_sale(purchased_at, [
+            (line.ticket_id, tiers[line.ticket_id].event_id, line.quantity, line.subtotal)
+            for line in lines
+        ])
+
+        # 4. the event's sold counter last, right before the commit, so its
+        #    row lock is held as briefly as possible
+        _add_sold(sold_per_event, 1)
+        db.session.commit()
+
+    except Exception:
+        db.session.rollback()
+        raise
+
+    inventory_changed.send(current_app._get_current_object(), event_ids=sorted(sold_per_event))
+    return purchase
+
+
+def refund_purchase(purchase_id, customer_id=None, organizer_email=None):
+    """
+    Refund a purchase: mark it Refunded, put its seats back on sale and
+    take it out of the sales rollups, in one transaction.
+
+    customer_id     -- if given, the purchase must belong to that customer
+                       and every event in it must still be Upcoming and
+                       more than REFUND_CUTOFF_HOURS away...
+    organizer_email -- ...or (when given) every ticket in it must be for an
+                       event that email organizes
+    With neither, any purchase can be refunded.
+    Returns the purchase; raises PurchaseNotFound / RefundClosed /
+    AlreadyRefunded.
+    """
+    purchase = db.session.get(Purchase, purchase_id)
+    if purchase is None:
+        raise PurchaseNotFound("Purchase not found")
+    if not _may_refund_any_time(purchase, customer_id, organizer_email):
+        if customer_id is None or purchase.customer_id != customer_id:
+            raise PurchaseNotFound("Purchase not found")
+        _check_refund_window(purchase)
+
+    try:
+        # conditional, so two refunds of the same purchase can't both win
+        result = db.session.execute(
+            update(Purchase)
+            .where(Purchase.purchase_id == purchase_id, Purchase.payment_status != "Refunded")
+            .values(payment_status="Refunded")
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise AlreadyRefunded("Purchase was already refunded")
+
+        lines = (
+            db.session.query(
+                PurchaseTicket.ticket_id, Ticket.event_id,
+                PurchaseTicket.quantity, PurchaseTicket.subtotal,
+            )
+            .join(Ticket, Ticket.ticket_id == PurchaseTicket.ticket_id)
+            .filter(PurchaseTicket.purchase_id == purchase_id)
+            .order_by(PurchaseTicket.ticket_id)
+            .all()
+        )
+
+        returned_per_event = Counter()
+        for ticket_id, event_id, quantity, _ in lines:
+            return_seats(ticket_id, quantity)
+            returned_per_event[event_id] += quantity
+
+        # same order as create_purchase, so a refund can't deadlock a sale
+        record_refund(purchase.purchase_date, [tuple(line) for line in lines])
+        _add_sold(returned_per_event, -1)
+        db.session.commit()
+
+    except Exception:
+        db.session.rollback()
+        raise
+
+    db.session.refresh(purchase)
+    inventory_changed.send(current_app._get_current_object(),
+                           event_ids=sorted(returned_per_event))
+    return purchase
+
+
+def _may_refund_any_time(purchase, customer_id, organizer_email):
+    if customer_id is None and organizer_email is None:
+        return True
+    if organizer_email is None:
+        return False
+    # organizers refund their own events' sales only: every line must be
+    # for an event this email organizes
+    organizers = {
+        email for (email,) in
+        db.session.query(Event.organizer_email)
+        .join(Ticket, Ticket.event_id == Event.event_id)
+        .join(PurchaseTicket, PurchaseTicket.ticket_id == Ticket.ticket_id)
+        .filter(PurchaseTicket.purchase_id == purchase.purchase_id)
+        .distinct()
+    }
+    return organizers == {organizer_email}
+
+
+def _check_refund_window(purchase):
+    hours = current_app.config.get("REFUND_CUTOFF_HOURS", DEFAULT_REFUND_CUTOFF_HOURS)
+    closed = (
+        db.session.query(Event.event_id)
+        .join(Ticket, Ticket.event_id == Event.event_id)
+        .join(PurchaseTicket, PurchaseTicket.ticket_id == Ticket.ticket_id)
+        .filter(
+            PurchaseTicket.purchase_id == purchase.purchase_id,
+            or_(Event.status != "Upcoming",
+                Event.event_date <= datetime.now() + timedelta(hours=hours)),
+        )
+        .first()
+    )
+    if closed is not None:
+        raise RefundClosed("Refunds for this purchase have closed")
+
+
+def _add_sold(per_event, sign):
+    for event_id, quantity in sorted(per_event.items()):
+        db.session.execute(
+            update(Event)
+            .where(Event.event_id == event_id)
+            .values(tickets_sold=Event.tickets_sold + sign * quantity)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def take_seats(ticket_id, quantity):
+    """Take seats off sale in one conditional UPDATE; False if too few are left."""
+    result = db.session.execute(
+        update(Ticket)
+        .where(Ticket.ticket_id == ticket_id, Ticket.quantity_available >= quantity)
+        .values(quantity_available=Ticket.quantity_available - quantity)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def return_seats(ticket_id, quantity):
+    """Put seats back on sale (refunds, released or expired holds)."""
+    db.session.execute(
+        update(Ticket)
+        .where(Ticket.ticket_id == ticket_id)
+        .values(quantity_available=Ticket.quantity_available + quantity)
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,159 @@
+# backend/services/reconcile.py
+"""
+Reconciliation of the denormalized inventory counters.
+
+EVENT.tickets_sold and TICKET.quantity_available are copies of what
+PURCHASE_TICKET says; nothing else checks that they still agree. This
+walks EVENT in primary-key chunks and, for each chunk, compares in ONE
+statement (so counters and line items come from the same snapshot):
+
+* tickets_sold      vs SUM(quantity) of the event's non-refunded lines
+* tickets_sold      vs total_tickets              (oversold)
+* quantity_available + sold vs total_tickets      (tiers offer more seats
+                                                   than the event has)
+* quantity_available < 0                          (negative stock)
+
+Only tickets_sold can be derived from the line items, so only that is
+repaired (with repair=True), and only optimistically:
+
+    UPDATE event SET tickets_sold = :expected
+    WHERE event_id = :id AND tickets_sold = :seen
+
+If a purchase moved the counter since the check, the update matches
+nothing and the event is left for the next run -- no row is locked
+longer than one UPDATE, and nothing is locked while reading.
+
+Each chunk is its own short transaction, followed by `pause` seconds of
+sleep (rate limiting). Progress is saved to a checkpoint file after every
+chunk, so an interrupted run resumes where it stopped.
+"""
+import json
+import os
+import time
+from collections import namedtuple
+
+from sqlalchemy import func, or_, select, update
+
+from backend.db import db
+from backend.models.customer import Event, Purchase, PurchaseTicket, Ticket
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_PAUSE_SECONDS = 0.1
+
+Drift = namedtuple("Drift", "event_id kind stored expected repaired")
+
+
+def reconcile_inventory(chunk_size=DEFAULT_CHUNK_SIZE, pause=DEFAULT_PAUSE_SECONDS,
+                        repair=False, checkpoint=None, on_drift=None, sleep=time.sleep):
+    """
+    Check (and with repair=True fix) every event after the checkpoint.
+
+    on_drift -- called with each Drift as it's found
+    Returns {"events": checked, "drift": [...], "repaired": n, "resumed_from": id}.
+    """
+    after_id = _read_checkpoint(checkpoint)
+    result = {"events": 0, "drift": [], "repaired": 0, "resumed_from": after_id}
+
+    while True:
+        ids = [
+            event_id for (event_id,) in db.session.query(Event.event_id)
+            .filter(Event.event_id > after_id)
+            .order_by(Event.event_id)
+            .limit(chunk_size)
+        ]
+        if not ids:
+            break
+
+        for drift in _check_chunk(ids[0], ids[-1], repair):
+            result["drift"].append(drift)
+            result["repaired"] += drift.repaired
+            if on_drift:
+                on_drift(drift)
+        db.session.commit()
+
+        result["events"] += len(ids)
+        after_id = ids[-1]
+        _write_checkpoint(checkpoint, after_id)
+        if len(ids) < chunk_size:
+            break
+        sleep(pause)
+
+    # finished: the next run starts from the beginning again
+    if checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    return result
+
+
+def _check_chunk(first_id, last_id, repair):
+    in_chunk = Ticket.event_id.between(first_id, last_id)
+
+    sold = (
+        select(Ticket.event_id, func.sum(PurchaseTicket.quantity).label("sold"))
+        .join(PurchaseTicket, PurchaseTicket.ticket_id == Ticket.ticket_id)
+        .join(Purchase, Purchase.purchase_id == PurchaseTicket.purchase_id)
+        .where(in_chunk, Purchase.payment_status != "Refunded")
+        .group_by(Ticket.event_id)
+        .subquery()
+    )
+    stock = (
+        select(
+            Ticket.event_id,
+            func.sum(Ticket.quantity_available).label("available"),
+            func.min(Ticket.quantity_available).label("lowest"),
+        )
+        .where(in_chunk)
+        .group_by(Ticket.event_id)
+        .subquery()
+    )
+    rows = db.session.execute(
+        select(
+            Event.event_id, Event.tickets_sold, Event.total_tickets,
+            sold.c.sold, stock.c.available, stock.c.lowest,
+        )
+        .outerjoin(sold, sold.c.event_id == Event.event_id)
+        .outerjoin(stock, stock.c.event_id == Event.event_id)
+        .where(Event.event_id.between(first_id, last_id))
+        .order_by(Event.event_id)
+    ).all()
+
+    for event_id, stored, total, expected, available, lowest in rows:
+        stored, expected = stored or 0, int(expected or 0)
+
+        if stored != expected:
+            repaired = repair and _repair_tickets_sold(event_id, stored, expected)
+            yield Drift(event_id, "tickets_sold", stored, expected, bool(repaired))
+        if expected > total:
+            yield Drift(event_id, "oversold", expected, total, False)
+        if available is not None and available + expected > total:
+            yield Drift(event_id, "tier_capacity", int(available) + expected, total, False)
+        if lowest is not None and lowest < 0:
+            yield Drift(event_id, "negative_stock", lowest, 0, False)
+
+
+def _repair_tickets_sold(event_id, seen, expected):
+    unchanged = Event.tickets_sold == seen
+    if seen == 0:
+        unchanged = or_(unchanged, Event.tickets_sold.is_(None))
+    result = db.session.execute(
+        update(Event)
+        .where(Event.event_id == event_id, unchanged)
+        .values(tickets_sold=expected)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def _read_checkpoint(path):
+    if not path or not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return json.load(f)["last_event_id"]
+
+
+def _write_checkpoint(path, last_event_id):
+    if not path:
+        return
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"last_event_id": last_event_id}, f)
+    os.replace(tmp, path)
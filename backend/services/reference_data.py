@@ -0,0 +1,125 @@
+# backend/services/reference_data.py
+"""
+Cached reference data: categories and venues.
+
+These tables almost never change, so they're read through a bounded TTL
+cache (REFERENCE_CACHE_TTL seconds, default 300) instead of queried on
+every call. The same cache supplies the category / venue objects embedded
+in the event endpoints, so those don't join or lazy-load them per row.
+
+Anything that writes CATEGORY or VENUE rows should send category_changed /
+venue_changed (backend/signals.py) after committing; that drops the
+cached copy in this process.
+"""
+from flask import current_app
+from sqlalchemy import select
+
+from backend.db import db
+from backend.models.customer import Category, Venue
+from backend.signals import category_changed, venue_changed
+from backend.utils.cache import TTLCache
+
+DEFAULT_TTL_SECONDS = 300
+
+
+def init_reference_data(app):
+    app.extensions["reference_cache"] = TTLCache(
+        maxsize=app.config.get("REFERENCE_CACHE_SIZE", 64),
+        ttl=app.config.get("REFERENCE_CACHE_TTL", DEFAULT_TTL_SECONDS),
+    )
+    category_changed.connect(_on_category_changed, app)
+    venue_changed.connect(_on_venue_changed, app)
+
+
+def _cache():
+    return current_app.extensions["reference_cache"]
+
+
+def get_categories():
+    """{category_id: {...}} ordered by id."""
+    return _cache().get_or_load("categories", _load_categories)
+
+
+def get_venues():
+    """{venue_id: {...}} ordered by id."""
+    return _cache().get_or_load("venues", _load_venues)
+
+
+def get_category(category_id):
+    return get_categories().get(category_id)
+
+
+def get_venue(venue_id):
+    return get_venues().get(venue_id)
+
+
+def venue_ids_in_city(city, venues=None):
+    venues = get_venues() if venues is None else venues
+    return [v["venue_id"] for v in venues.values() if v["city"] == city]
+
+
+def category_id_by_name(name, categories=None):
+    categories = get_categories() if categories is None else categories
+    for c in categories.values():
+        if c["category_name"] == name:
+            return c["category_id"]
+    return None
+
+
+def invalidate_reference_data(kind=None):
+    """Drop the cached 'categories' / 'venues' (or both when kind is None)."""
+    _cache().invalidate(kind)
+
+
+def _on_category_changed(app, **extra):
+    app.extensions["reference_cache"].invalidate("categories")
+
+
+def _on_venue_changed(app, **extra):
+    app.extensions["reference_cache"].invalidate("venues")
+
+
+def _load_categories():
+    return categories_from_rows(db.session.execute(CATEGORIES_QUERY))
+
+
+def _load_venues():
+    return venues_from_rows(db.session.execute(VENUES_QUERY))
+
+
+# statements + row mapping, shared with the async catalog
+# (backend/routes/catalog_async.py)
+
+CATEGORIES_QUERY = select(
+    Category.category_id, Category.category_name, Category.description
+).order_by(Category.category_id)
+
+VENUES_QUERY = select(
+    Venue.venue_id, Venue.venue_name, Venue.address,
+    Venue.city, Venue.capacity, Venue.phone,
+).order_by(Venue.venue_id)
+
+
+def categories_from_rows(rows):
+    return {
+        c.category_id: {
+            "category_id": c.category_id,
+            "category_name": c.category_name,
+            "description": c.description,
+        }
+        for c in rows
+    }
+
+
+def venues_from_rows(rows):
+    return {
+        v.venue_id: {
+            "venue_id": v.venue_id,
+            "venue_name": v.venue_name,
+            "address": v.address,
+            "city": v.city,
+            "capacity": v.capacity,
+            "phone": v.phone,
+        }
+        for v in rows
+    }
@@ -0,0 +1,274 @@
+# backend/services/sales_rollups.py
+"""
+Incrementally maintained sales rollups (models/sales.py).
+
+record_sale() / record_refund() are called by the purchase and refund
+write paths *inside their transaction*, so the rollups commit or roll
+back together with the purchase itself. Each touches one row per event,
+per tier and per (event, hour) with an upsert that adds to the counters
+in place -- no read, no aggregate over PURCHASE_TICKET.
+
+The admin stats endpoint then reads a handful of rows per event it
+shows, instead of summing every purchase line on each page view.
+
+rebuild_rollups() recomputes all of it from PURCHASE_TICKET in one
+streamed pass (`flask rebuild-sales-rollups`), for backfills and after
+imports that bypass the write path. It locks out purchases and refunds
+while it runs (see its docstring).
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.db import db
+from backend.models.customer import Event, Purchase, PurchaseTicket, Ticket
+from backend.models.sales import EventSales, HourlySales, TicketSales
+
+REBUILD_CHUNK_SIZE = 5000
+
+_UPSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+    "mysql": mysql_insert,
+    "mariadb": mysql_insert,
+}
+
+
+def sale_hour(when):
+    return when.replace(minute=0, second=0, microsecond=0)
+
+
+def record_sale(purchased_at, lines):
+    """
+    Add one purchase to the rollups.
+
+    lines -- [(ticket_id, event_id, quantity, subtotal), ...]
+    """
+    _apply(purchased_at, lines, sign=1)
+
+
+def record_refund(purchased_at, lines):
+    """Take a refunded purchase back out (same lines as record_sale)."""
+    _apply(purchased_at, lines, sign=-1)
+
+
+def _apply(purchased_at, lines, sign):
+    hour = sale_hour(purchased_at)
+    per_event = defaultdict(lambda: [0, Decimal("0")])
+
+    # fixed order (tiers, then events) like the inventory updates
+    for ticket_id, event_id, quantity, subtotal in sorted(lines):
+        sold = per_event[event_id]
+        sold[0] += quantity
+        sold[1] += subtotal
+        counters = {"tickets_sold": sign * quantity, "revenue": sign * subtotal}
+        if sign < 0:
+            counters["tickets_refunded"] = quantity
+        _add(TicketSales, {"ticket_id": ticket_id}, counters, event_id=event_id)
+
+    for event_id, (quantity, amount) in sorted(per_event.items()):
+        counters = {"tickets_sold": sign * quantity, "revenue": sign * amount}
+        if sign > 0:
+            counters["purchases"] = 1
+        else:
+            counters.update(purchases=-1, tickets_refunded=quantity, refunded_amount=amount)
+        _add(EventSales, {"event_id": event_id}, counters)
+        _add(HourlySales, {"event_id": event_id, "hour": hour},
+             {"tickets_sold": sign * quantity, "revenue": sign * amount})
+
+
+def _add(model, keys, counters, **extra):
+    """counter += delta on the row for `keys`, creating it if needed."""
+    table = model.__table__
+    values = {**keys, **extra, **counters}
+    upsert = _UPSERTS.get(db.session.get_bind().dialect.name)
+
+    if upsert is mysql_insert:
+        stmt = upsert(table).values(values)
+        stmt = stmt.on_duplicate_key_update(
+            {name: table.c[name] + stmt.inserted[name] for name in counters}
+        )
+    elif upsert is not None:
+        stmt = upsert(table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={name: table.c[name] + stmt.excluded[name] for name in counters},
+        )
+    else:
+        # no native upsert: update, and insert if there was nothing to update
+        result = db.session.execute(
+            update(table)
+            .where(*[table.c[k] == v for k, v in keys.items()])
+            .values({name: table.c[name] + delta for name, delta in counters.items()})
+        )
+        if result.rowcount:
+            return
+        stmt = insert(table).values(values)
+    db.session.execute(stmt)
+
+
+def organizer_stats(organizer_email, since):
+    """
+    Dashboard numbers for every event an organizer owns, from the rollups:
+    three indexed queries however many purchases there are.
+    """
+    events = {}
+    for row in (
+        db.session.query(
+            Event.event_id, Event.event_name, Event.event_date, Event.status,
+            Event.total_tickets, EventSales.tickets_sold, EventSales.revenue,
+            EventSales.purchases, EventSales.tickets_refunded, EventSales.refunded_amount,
+        )
+        .outerjoin(EventSales, EventSales.event_id == Event.event_id)
+        .filter(Event.organizer_email == organizer_email)
+        .order_by(Event.event_date, Event.event_id)
+    ):
+        sold = row.tickets_sold or 0
+        events[row.event_id] = {
+            "event_id": row.event_id,
+            "event_name": row.event_name,
+            "event_date": row.event_date.strftime("%Y-%m-%d %H:%M:%S"),
+            "status": row.status,
+            "total_tickets": row.total_tickets,
+            "tickets_sold": sold,
+            "revenue": float(row.revenue or 0),
+            "sell_through": round(sold / row.total_tickets, 4) if row.total_tickets else None,
+            "purchases": row.purchases or 0,
+            "tickets_refunded": row.tickets_refunded or 0,
+            "refunded_amount": float(row.refunded_amount or 0),
+            "tiers": [],
+        }
+
+    for row in (
+        db.session.query(
+            Ticket.ticket_id, Ticket.event_id, Ticket.ticket_type, Ticket.price,
+            Ticket.quantity_available, TicketSales.tickets_sold, TicketSales.revenue,
+        )
+        .join(Event, Event.event_id == Ticket.event_id)
+        .outerjoin(TicketSales, TicketSales.ticket_id == Ticket.ticket_id)
+        .filter(Event.organizer_email == organizer_email)
+        .order_by(Ticket.ticket_id)
+    ):
+        events[row.event_id]["tiers"].append({
+            "ticket_id": row.ticket_id,
+            "ticket_type": row.ticket_type,
+            "price": float(row.price),
+            "quantity_available": row.quantity_available,
+            "tickets_sold": row.tickets_sold or 0,
+            "revenue": float(row.revenue or 0),
+        })
+
+    hourly = [
+        {"hour": hour.strftime("%Y-%m-%d %H:00"), "tickets_sold": int(sold), "revenue": float(revenue)}
+        for hour, sold, revenue in (
+            db.session.query(
+                HourlySales.hour, func.sum(HourlySales.tickets_sold), func.sum(HourlySales.revenue)
+            )
+            .join(Event, Event.event_id == HourlySales.event_id)
+            .filter(Event.organizer_email == organizer_email, HourlySales.hour >= since)
+            .group_by(HourlySales.hour)
+            .order_by(HourlySales.hour)
+        )
+    ]
+
+    events = list(events.values())
+    return {
+        "totals": {
+            "events": len(events),
+            "tickets_sold": sum(e["tickets_sold"] for e in events),
+            "revenue": round(sum(e["revenue"] for e in events), 2),
+            "refunded_amount": round(sum(e["refunded_amount"] for e in events), 2),
+        },
+        "events": events,
+        "hourly": hourly,
+    }
+
+
+def rebuild_rollups():
+    """
+    Recompute every rollup from PURCHASE_TICKET; returns rows read.
+
+    Purchases and refunds update the rollups in their own transactions,
+    so the rebuild first locks the rows both of them update first --
+    every ticket tier (SELECT ... FOR UPDATE, in ticket_id order) -- and
+    then clears the rollups. A purchase or refund already in flight finishes
+    before the rebuild reads; any later one waits for it to commit and
+    is applied on top of the rebuilt rows, so nothing is lost or counted
+    twice. (SQLite has no row locks; clearing the tables first takes its
+    database-wide write lock instead.) Databases without either need
+    writes paused while this runs.
+    """
+    _lock_writers()
+    for model in (HourlySales, TicketSales, EventSales):
+        db.session.execute(delete(model))
+
+    events = defaultdict(lambda: {"tickets_sold": 0, "revenue": Decimal("0"), "purchases": 0,
+                                  "tickets_refunded": 0, "refunded_amount": Decimal("0")})
+    tiers = defaultdict(lambda: {"tickets_sold": 0, "revenue": Decimal("0"),
+                                 "tickets_refunded": 0})
+    hours = defaultdict(lambda: {"tickets_sold": 0, "revenue": Decimal("0")})
+    current_purchase, counted = None, set()  # events already counted for this purchase
+
+    rows = (
+        db.session.query(
+            Purchase.purchase_id,
+            Purchase.purchase_date,
+            Purchase.payment_status,
+            PurchaseTicket.ticket_id,
+            Ticket.event_id,
+            PurchaseTicket.quantity,
+            PurchaseTicket.subtotal,
+        )
+        .join(PurchaseTicket, PurchaseTicket.purchase_id == Purchase.purchase_id)
+        .join(Ticket, Ticket.ticket_id == PurchaseTicket.ticket_id)
+        .order_by(Purchase.purchase_id)
+        .yield_per(REBUILD_CHUNK_SIZE)
+    )
+
+    read = 0
+    for purchase_id, purchased_at, status, ticket_id, event_id, quantity, subtotal in rows:
+        read += 1
+        if purchase_id != current_purchase:
+            current_purchase, counted = purchase_id, set()
+        event, tier = events[event_id], tiers[ticket_id]
+        tier["event_id"] = event_id
+        if status == "Refunded":
+            event["tickets_refunded"] += quantity
+            event["refunded_amount"] += subtotal
+            tier["tickets_refunded"] += quantity
+            continue
+
+        event["tickets_sold"] += quantity
+        event["revenue"] += subtotal
+        if event_id not in counted:
+            counted.add(event_id)
+            event["purchases"] += 1
+        tier["tickets_sold"] += quantity
+        tier["revenue"] += subtotal
+        hour = hours[(event_id, sale_hour(purchased_at))]
+        hour["tickets_sold"] += quantity
+        hour["revenue"] += subtotal
+
+    _insert_chunked(EventSales, [{"event_id": k, **v} for k, v in events.items()])
+    _insert_chunked(TicketSales, [{"ticket_id": k, **v} for k, v in tiers.items()])
+    _insert_chunked(HourlySales, [
+        {"event_id": event_id, "hour": hour, **v} for (event_id, hour), v in hours.items()
+    ])
+    db.session.commit()
+    return read
+
+
+def _lock_writers():
+    # FOR UPDATE compiles to nothing on SQLite
+    db.session.execute(
+        select(Ticket.ticket_id).order_by(Ticket.ticket_id).with_for_update()
+    ).all()
+
+
+def _insert_chunked(model, rows):
+    for start in range(0, len(rows), REBUILD_CHUNK_SIZE):
+        db.session.execute(insert(model), rows[start:start + REBUILD_CHUNK_SIZE])
@@ -0,0 +1,306 @@
+# backend/services/search_index.py
+"""
+In-process inverted index over events for the search endpoints.
+
+Every event is tokenized (case-folded words) over its name, description,
+organizer, venue (name + city) and category. Each token maps to the
+events containing it with a field-weighted score, so a query costs one
+dict lookup per query word instead of a LIKE '%q%' table scan.
+
+* all query words must match; the last one also matches as a prefix so
+  results keep up while the user is still typing ("roc" -> "rock")
+* results are ranked by sum(field weight * idf) over the query words
+* each event's venue, category and date are kept next to its terms, so
+  the location / category / date filters of the search pages are
+  applied before the MAX_RESULTS cut rather than to what survived it
+* the index is built once per process on first use (one streamed joined
+  query), then kept current from the event_changed / events_imported /
+  venue_changed signals sent in this process, and from the CATALOG_CHANGE
+  log for edits made by other worker processes (services/catalog_changes.py)
+  -- either way only the touched events are re-read
+"""
+import bisect
+import heapq
+import math
+import re
+import threading
+
+from flask import current_app
+
+from backend.db import db
+from backend.models.customer import Category, Event, Venue
+from backend.services.catalog_changes import ChangeFollower
+from backend.signals import event_changed, events_imported, venue_changed
+
+# how much a hit in each field counts towards the score
+FIELD_WEIGHTS = {
+    "event_name": 3.0,
+    "category_name": 2.0,
+    "venue_name": 1.5,
+    "organizer_name": 1.5,
+    "city": 1.0,
+    "description": 1.0,
+}
+
+# most ids one search hands back to the SQL side (keeps IN (...) bounded)
+MAX_RESULTS = 5000
+
+# ids per IN (...) when re-reading many events (bulk imports)
+IMPORT_CHUNK_SIZE = 500
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.casefold()) if text else []
+
+
+class EventSearchIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings = {}    # token -> {event_id: weight}
+        self._doc_terms = {}   # event_id -> {token, ...} (to undo an update)
+        self._facets = {}      # event_id -> (venue_id, category_id, event_date)
+        self._vocabulary = []  # sorted tokens, for prefix matches
+        self.built = False
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    # ---------- writes ----------
+
+    def add(self, event_id, fields, venue_id=None, category_id=None, event_date=None):
+        """Index (or re-index) one event. fields: {field name: text}."""
+        weights = {}
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            for token in tokenize(text):
+                weights[token] = weights.get(token, 0.0) + weight
+
+        with self._lock:
+            self._remove(event_id)
+            for token, weight in weights.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    bisect.insort(self._vocabulary, token)
+                postings[event_id] = weight
+            self._doc_terms[event_id] = set(weights)
+            self._facets[event_id] = (venue_id, category_id, event_date)
+
+    def remove(self, event_id):
+        with self._lock:
+            self._remove(event_id)
+
+    def _remove(self, event_id):
+        self._facets.pop(event_id, None)
+        for token in self._doc_terms.pop(event_id, ()):
+            postings = self._postings[token]
+            postings.pop(event_id, None)
+            if not postings:
+                del self._postings[token]
+                i = bisect.bisect_left(self._vocabulary, token)
+                del self._vocabulary[i]
+
+    # ---------- reads ----------
+
+    def search(self, query, limit=None, venue_ids=None, category_ids=None, dates=None):
+        """
+        Event ids matching every word of `query`, best first, at most
+        `limit` (MAX_RESULTS) of them.
+
+        venue_ids    -- only events at one of these venues
+        category_ids -- only events in one of these categories
+        dates        -- (start, end): only events in that range, either
+                        bound may be None
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        with self._lock:
+            total = max(len(self._doc_terms), 1)
+
+            # [(idf, postings), ...] per query word; the last word expands
+            # to every indexed term it is a prefix of
+            words = []
+            for i, token in enumerate(tokens):
+                terms = self._prefix_matches(token) if i == len(tokens) - 1 else [token]
+                lists = [
+                    (math.log(1 + total / len(self._postings[t])), self._postings[t])
+                    for t in terms if t in self._postings
+                ]
+                if not lists:
+                    return []
+                words.append(lists)
+
+            # intersect starting from the rarest word, so every later step
+            # only probes the (small) surviving candidate set
+            words.sort(key=lambda lists: sum(len(p) for _, p in lists))
+            scores = {}
+            for idf, postings in words[0]:
+                for event_id, weight in postings.items():
+                    score = weight * idf
+                    if score > scores.get(event_id, 0.0):
+                        scores[event_id] = score
+
+            for lists in words[1:]:
+                next_scores = {}
+                for event_id, score in scores.items():
+                    best = 0.0
+                    for idf, postings in lists:
+                        weight = postings.get(event_id)
+                        if weight is not None and weight * idf > best:
+                            best = weight * idf
+                    if best:
+                        next_scores[event_id] = score + best
+                scores = next_scores
+                if not scores:
+                    return []
+
+            if venue_ids is not None or category_ids is not None or dates is not None:
+                scores = {
+                    event_id: score for event_id, score in scores.items()
+                    if self._matches(event_id, venue_ids, category_ids, dates)
+                }
+
+        ranked = heapq.nsmallest(
+            MAX_RESULTS if limit is None else limit,
+            scores.items(),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return [event_id for event_id, _ in ranked]
+
+    def _matches(self, event_id, venue_ids, category_ids, dates):
+        venue_id, category_id, event_date = self._facets[event_id]
+        if venue_ids is not None and venue_id not in venue_ids:
+            return False
+        if category_ids is not None and category_id not in category_ids:
+            return False
+        if dates is not None:
+            start, end = dates
+            if event_date is None:
+                return False
+            if (start is not None and event_date < start) or (end is not None and event_date > end):
+                return False
+        return True
+
+    def _prefix_matches(self, prefix):
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\uffff")
+        return self._vocabulary[start:end]
+
+
+# ------------------------------------------------------------
+# app wiring
+# ------------------------------------------------------------
+def init_search_index(app):
+    app.extensions["event_search_index"] = EventSearchIndex()
+    app.extensions["event_search_changes"] = ChangeFollower()
+    event_changed.connect(_on_event_changed, app)
+    events_imported.connect(_on_events_imported, app)
+    venue_changed.connect(_on_venue_changed, app)
+
+
+def get_search_index():
+    """The app's index: built from the database on first use, then kept current."""
+    index = current_app.extensions["event_search_index"]
+    changes = current_app.extensions["event_search_changes"]
+    if not index.built:
+        with index._lock:
+            if not index.built:
+                _build(index, changes)
+        return index
+
+    # catch up with edits made by other worker processes
+    pending = changes.poll()
+    if pending is not None and pending.rebuild:
+        index = EventSearchIndex()
+        _build(index, changes)
+        current_app.extensions["event_search_index"] = index
+    elif pending is not None:
+        _reindex(index, pending.event_ids, pending.venue_ids)
+    return index
+
+
+def search_event_ids(query, venue_ids=None, category_ids=None, dates=None):
+    """Ranked ids for `query`, filtered (see EventSearchIndex.search) before the cap."""
+    return get_search_index().search(
+        query, venue_ids=venue_ids, category_ids=category_ids, dates=dates
+    )
+
+
+def _build(index, changes):
+    changes.start()
+    for event_id, fields, facets in _indexed_rows():
+        index.add(event_id, fields, *facets)
+    index.built = True
+
+
+def _reindex(index, event_ids, venue_ids=()):
+    """Re-read these events (and every event at these venues); drop the deleted ones."""
+    found = set()
+    for start in range(0, len(event_ids), IMPORT_CHUNK_SIZE):
+        for row_id, fields, facets in _indexed_rows(
+            event_ids=event_ids[start:start + IMPORT_CHUNK_SIZE]
+        ):
+            index.add(row_id, fields, *facets)
+            found.add(row_id)
+    for event_id in set(event_ids) - found:
+        index.remove(event_id)
+
+    for venue_id in venue_ids:
+        for row_id, fields, facets in _indexed_rows(venue_id=venue_id):
+            index.add(row_id, fields, *facets)
+
+
+def _on_event_changed(app, event_id, **extra):
+    index = app.extensions["event_search_index"]
+    if index.built:  # otherwise picked up by the full build
+        _reindex(index, [event_id])
+
+
+def _on_events_imported(app, event_ids, **extra):
+    index = app.extensions["event_search_index"]
+    if index.built:
+        _reindex(index, event_ids)
+
+
+def _on_venue_changed(app, venue_id, **extra):
+    # venue name / city are indexed with every event held there
+    index = app.extensions["event_search_index"]
+    if index.built:
+        _reindex(index, [], [venue_id])
+
+
+def _indexed_rows(event_ids=None, venue_id=None):
+    query = (
+        db.session.query(
+            Event.event_id,
+            Event.event_name,
+            Event.description,
+            Event.organizer_name,
+            Venue.venue_name,
+            Venue.city,
+            Category.category_name,
+            Event.venue_id,
+            Event.category_id,
+            Event.event_date,
+        )
+        .outerjoin(Venue, Event.venue_id == Venue.venue_id)
+        .outerjoin(Category, Event.category_id == Category.category_id)
+    )
+    if event_ids is not None:
+        query = query.filter(Event.event_id.in_(event_ids))
+    if venue_id is not None:
+        query = query.filter(Event.venue_id == venue_id)
+
+    for row in query.yield_per(1000):
+        yield row.event_id, {
+            "event_name": row.event_name,
+            "description": row.description,
+            "organizer_name": row.organizer_name,
+            "venue_name": row.venue_name,
+            "city": row.city,
+            "category_name": row.category_name,
+        }, (row.venue_id, row.category_id, row.event_date)
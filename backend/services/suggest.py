@@ -0,0 +1,189 @@
+# backend/services/suggest.py
+"""
+Type-ahead suggestions for the search box (event names, venue names, cities).
+
+Everything lives in one sorted array of (key, entry) pairs, where the keys
+are every word-start suffix of each name, case-folded:
+
+    "rock legends live" -> "rock legends live", "legends live", "live"
+
+so "leg" finds "Rock Legends Live". A prefix lookup is a bisect for the
+matching range plus a top-k by score over it. Any prefix whose range is
+longer than HOT_RANGE keys gets its top-k precomputed at build time, so
+every lookup is either a dict hit or a top-k over at most HOT_RANGE keys.
+
+The structure is immutable once built. It's built on first use (that
+build is the only one requests wait for), then rebuilt on a background
+thread whenever the catalog changes -- through event_changed /
+events_imported / venue_changed in this process, or the CATALOG_CHANGE
+log for edits made by other worker processes (services/catalog_changes.py).
+Requests keep answering from the previous snapshot until the new one is
+swapped in.
+"""
+import bisect
+import heapq
+import threading
+from collections import namedtuple
+
+from flask import current_app
+from sqlalchemy import func
+
+from backend.db import db
+from backend.models.customer import Event, Venue
+from backend.services.catalog_changes import ChangeFollower
+from backend.signals import event_changed, events_imported, venue_changed
+
+MAX_SUGGESTIONS = 10
+
+# prefixes matching more keys than this get a precomputed top-k list
+HOT_RANGE = 200
+
+Suggestion = namedtuple("Suggestion", "text type id score")
+
+
+class PrefixSuggester:
+    def __init__(self, suggestions):
+        # one entry per distinct name (recurring events share a name);
+        # keep the best-scoring one
+        best = {}
+        for s in suggestions:
+            key = (s.type, s.text.casefold())
+            if key not in best or s.score > best[key].score:
+                best[key] = s
+        self.entries = list(best.values())
+
+        pairs = []
+        for i, entry in enumerate(self.entries):
+            for key in _word_starts(entry.text):
+                pairs.append((key, i))
+        pairs.sort()
+        self._keys = [key for key, _ in pairs]
+        self._ids = [i for _, i in pairs]
+
+        # walk down from 1-character prefixes, only into ranges still too big
+        self._hot = {}
+        pending = [(0, len(self._keys), 1)]
+        while pending:
+            start, end, depth = pending.pop()
+            i = start
+            while i < end:
+                if len(self._keys[i]) < depth:
+                    i += 1
+                    continue
+                prefix = self._keys[i][:depth]
+                j = self._range_end(prefix, i, end)
+                if j - i > HOT_RANGE:
+                    self._hot[prefix] = self._top(i, j, MAX_SUGGESTIONS)
+                    pending.append((i, j, depth + 1))
+                i = j
+
+    def suggest(self, prefix, limit=MAX_SUGGESTIONS):
+        prefix = " ".join(prefix.casefold().split())
+        if not prefix:
+            return []
+        limit = min(limit, MAX_SUGGESTIONS)
+
+        ranked = self._hot.get(prefix)
+        if ranked is None:
+            start = bisect.bisect_left(self._keys, prefix)
+            ranked = self._top(start, self._range_end(prefix, start, len(self._keys)), limit)
+        return [self.entries[i] for i in ranked[:limit]]
+
+    def _range_end(self, prefix, start, end):
+        return bisect.bisect_left(self._keys, prefix + "\uffff", start, end)
+
+    def _top(self, start, end, limit):
+        return heapq.nsmallest(
+            limit,
+            set(self._ids[start:end]),
+            key=lambda i: (-self.entries[i].score, self.entries[i].text, i),
+        )
+
+
+def _word_starts(text):
+    words = text.casefold().split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+# ------------------------------------------------------------
+# app wiring
+# ------------------------------------------------------------
+class _SuggestState:
+    def __init__(self):
+        self.suggester = None
+        self.stale = False
+        self.lock = threading.Lock()       # held by whoever is building
+        self.changes = ChangeFollower()
+        self.rebuild = None                # the latest background rebuild thread
+
+
+def init_suggest(app):
+    app.extensions["event_suggest"] = _SuggestState()
+    event_changed.connect(_mark_stale, app)
+    events_imported.connect(_mark_stale, app)
+    venue_changed.connect(_mark_stale, app)
+
+
+def get_suggester():
+    state = current_app.extensions["event_suggest"]
+    if state.suggester is None:
+        with state.lock:
+            if state.suggester is None:
+                state.changes.start()
+                state.suggester = PrefixSuggester(_load_suggestions())
+        return state.suggester
+
+    pending = state.changes.poll()
+    if pending is not None or state.stale:
+        _rebuild_in_background(current_app._get_current_object(), state,
+                               restart=pending is not None and pending.rebuild)
+    return state.suggester
+
+
+def _rebuild_in_background(app, state, restart):
+    # one rebuild at a time; changes arriving meanwhile set stale again,
+    # and the next request starts another
+    if not state.lock.acquire(blocking=False):
+        state.stale = True
+        return
+    state.stale = False
+
+    def rebuild():
+        try:
+            with app.app_context():
+                if restart:
+                    state.changes.start()
+                state.suggester = PrefixSuggester(_load_suggestions())
+        except Exception:
+            state.stale = True
+            app.logger.exception("rebuilding the type-ahead suggestions failed")
+        finally:
+            state.lock.release()
+
+    state.rebuild = threading.Thread(target=rebuild, name="suggest-rebuild", daemon=True)
+    state.rebuild.start()
+
+
+def _mark_stale(app, **extra):
+    app.extensions["event_suggest"].stale = True
+
+
+def _load_suggestions():
+    # events: the more tickets sold, the higher they rank
+    for event_id, name, sold in db.session.query(
+        Event.event_id, Event.event_name, Event.tickets_sold
+    ).yield_per(5000):
+        yield Suggestion(name, "event", event_id, sold or 0)
+
+    # venues and cities: ranked by how many events they host
+    events_per_venue = dict(
+        db.session.query(Event.venue_id, func.count(Event.event_id)).group_by(Event.venue_id)
+    )
+    events_per_city = {}
+    for venue_id, name, city in db.session.query(Venue.venue_id, Venue.venue_name, Venue.city):
+        count = events_per_venue.get(venue_id, 0)
+        yield Suggestion(name, "venue", venue_id, count)
+        events_per_city[city] = events_per_city.get(city, 0) + count
+
+    for city, count in events_per_city.items():
+        yield Suggestion(city, "city", None, count)
@@ -0,0 +1,520 @@
+# backend/services/synthetic_data.py
+"""
+Synthetic, production-scale data for the Database/tables.sql schema
+(`flask generate-data`).
+
+Fills CATEGORY, VENUE, CUSTOMER, EVENT, TICKET, PURCHASE and
+PURCHASE_TICKET with rows that hang together the way real ones do:
+
+* popularity is skewed (Zipf): a few events, venues, cities and customers
+  get most of the sales, so the most popular events sell out
+* event dates spread from two years back to a year ahead of --as-of;
+  past events are Completed, a few are Cancelled (and sell nothing),
+  far-future ones aren't on sale yet
+* every purchase falls in its event's sales window, buys from tiers that
+  still have seats, and a few are Refunded (their seats went back)
+* EVENT.tickets_sold and TICKET.quantity_available are exactly what the
+  purchase lines say, so `flask reconcile-inventory` finds no drift
+
+Everything comes from one seed, so the same arguments give the same rows.
+
+Rows go to a sink in chunks: InsertSink (executemany INSERTs, one commit
+per chunk -- no ORM objects) or CsvSink (one CSV per table plus a
+load.sql of LOAD DATA statements for MySQL). Counters are only known
+once the purchases are simulated, and purchases can't be written before
+their tickets, so the event and purchase streams are each generated
+twice from the same seed: once to plan, once to write. Memory stays at a
+few numbers per event and tier, however many purchases there are.
+
+All customers share one password hash (DEFAULT_PASSWORD): hashing
+millions of passwords would take hours and test nothing.
+"""
+import csv
+import itertools
+import os
+import random
+from array import array
+from bisect import bisect
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from math import gcd
+
+from sqlalchemy import func, insert
+
+from backend.db import db
+from backend.models.customer import (
+    Category,
+    Customer,
+    Event,
+    Purchase,
+    PurchaseTicket,
+    Ticket,
+    Venue,
+)
+from backend.services.hashing import get_hasher
+
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_PASSWORD = "password123"
+AS_OF = datetime(2026, 1, 1)
+
+SCALES = {
+    "small": {"events": 2_000, "customers": 20_000, "purchases": 60_000},
+    "medium": {"events": 50_000, "customers": 500_000, "purchases": 1_500_000},
+    "large": {"events": 250_000, "customers": 3_000_000, "purchases": 10_000_000},
+}
+
+# (table in Database/tables.sql, model, columns in row order), in load order
+TABLES = [
+    ("CATEGORY", Category, ["category_id", "category_name", "description"]),
+    ("VENUE", Venue, ["venue_id", "venue_name", "address", "city", "capacity", "phone"]),
+    ("CUSTOMER", Customer, ["customer_id", "first_name", "last_name", "email", "password_hash",
+                            "role", "phone", "registration_date"]),
+    ("EVENT", Event, ["event_id", "event_name", "event_date", "description", "organizer_name",
+                      "organizer_email", "category_id", "venue_id", "total_tickets",
+                      "tickets_sold", "status"]),
+    ("TICKET", Ticket, ["ticket_id", "event_id", "ticket_type", "price", "quantity_available"]),
+    ("PURCHASE", Purchase, ["purchase_id", "customer_id", "purchase_date", "total_amount",
+                            "payment_method", "payment_status"]),
+    ("PURCHASE_TICKET", PurchaseTicket, ["purchase_ticket_id", "purchase_id", "ticket_id",
+                                         "quantity", "subtotal"]),
+]
+
+# category -> (share of events, price range in dollars, name words)
+CATEGORIES = {
+    "Concert": (0.30, (35, 180), ["Live", "Unplugged", "World Tour", "Acoustic Night", "Reunion"]),
+    "Sports": (0.25, (25, 220), ["Finals", "Derby", "Championship", "Classic", "Showdown"]),
+    "Theater": (0.12, (40, 160), ["Premiere", "Revival", "Gala", "Matinee", "Encore"]),
+    "Comedy": (0.10, (20, 90), ["Stand-Up", "Roast", "Late Show", "Improv Night", "Tour"]),
+    "Conference": (0.08, (120, 900), ["Summit", "Expo", "Forum", "Symposium", "Workshop"]),
+    "Festival": (0.08, (60, 350), ["Fest", "Weekender", "Carnival", "Fair", "Jamboree"]),
+    "Family": (0.05, (15, 70), ["On Ice", "Magic Show", "Circus", "Adventure", "Parade"]),
+    "Opera": (0.02, (50, 250), ["Opening Night", "Season Gala", "Recital", "Concert", "Premiere"]),
+}
+THEMES = [
+    "Rock", "Jazz", "Symphony", "Hockey", "Basketball", "Shakespeare", "Tech", "Startup",
+    "Country", "Hip-Hop", "Soccer", "Blues", "Indie", "Ballet", "Wrestling", "Food & Wine",
+    "Electronic", "Folk", "Baseball", "Science", "Gaming", "Salsa", "Broadway", "Boxing",
+]
+# city -> relative size (venues and demand follow it)
+CITIES = {
+    "Toronto": 30, "Montreal": 18, "Vancouver": 14, "Calgary": 8, "Ottawa": 7, "Edmonton": 7,
+    "Mississauga": 5, "Winnipeg": 4, "Hamilton": 3, "Quebec City": 3, "Halifax": 2,
+    "Oshawa": 1, "Kingston": 1, "Victoria": 2, "Saskatoon": 1, "Regina": 1,
+}
+VENUE_KINDS = [("Stadium", 45_000), ("Arena", 18_000), ("Amphitheatre", 9_000),
+               ("Convention Centre", 5_000), ("Concert Hall", 2_500), ("Theatre", 1_200),
+               ("Club", 450), ("Community Centre", 300)]
+FIRST_NAMES = [
+    "Olivia", "Liam", "Emma", "Noah", "Ava", "William", "Sophia", "James", "Isabella", "Lucas",
+    "Mia", "Benjamin", "Charlotte", "Ethan", "Amelia", "Jacob", "Harper", "Logan", "Chloe",
+    "Mason", "Aria", "Elijah", "Zoe", "Aiden", "Priya", "Wei", "Fatima", "Mateo", "Aisha", "Hiro",
+]
+LAST_NAMES = [
+    "Smith", "Brown", "Tremblay", "Martin", "Roy", "Wilson", "Macdonald", "Gagnon", "Johnson",
+    "Taylor", "Campbell", "Anderson", "Leblanc", "Lee", "Clark", "Nguyen", "Patel", "Singh",
+    "Chen", "Garcia", "Kim", "Wong", "Cote", "Morin", "Bouchard", "Walker", "Young", "Khan",
+]
+TIER_TYPES = [("General Admission", 1.0), ("VIP", 2.6), ("Floor", 1.6), ("Balcony", 0.8)]
+PAYMENT_METHODS = ["Credit Card"] * 6 + ["Debit Card"] * 2 + ["PayPal"] * 2 + ["Cash"]
+
+REFUND_RATE = 0.03
+PENDING_RATE = 0.01
+CANCEL_RATE = 0.02
+SALES_WINDOW_DAYS = 120
+EVENTS_PER_ORGANIZER = 200
+
+
+class GenerationError(Exception):
+    pass
+
+
+# ------------------------------------------------------------
+# sinks
+# ------------------------------------------------------------
+class InsertSink:
+    """executemany INSERTs straight into the app's database, commit per chunk."""
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self._tables = {name: (model, columns) for name, model, columns in TABLES}
+
+    def check_empty(self):
+        for name, model, _ in TABLES:
+            if db.session.query(func.count()).select_from(model).scalar():
+                raise GenerationError(f"{name} already has rows; generate into an empty database")
+
+    def write(self, table, rows):
+        model, columns = self._tables[table]
+        stmt = insert(model)
+        batch = []
+        for row in rows:
+            batch.append(dict(zip(columns, row)))
+            if len(batch) >= self.chunk_size:
+                db.session.execute(stmt, batch)
+                db.session.commit()
+                batch = []
+        if batch:
+            db.session.execute(stmt, batch)
+            db.session.commit()
+
+    def close(self):
+        pass
+
+
+class CsvSink:
+    """One <TABLE>.csv per table (\\N for NULL) plus load.sql for MySQL."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._files = {}
+        self._columns = {name: columns for name, _, columns in TABLES}
+
+    def write(self, table, rows):
+        if table not in self._files:
+            f = open(os.path.join(self.directory, f"{table}.csv"), "w", newline="", encoding="utf-8")
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(self._columns[table])
+            self._files[table] = (f, writer)
+        writer = self._files[table][1]
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+
+    def close(self):
+        for f, _ in self._files.values():
+            f.close()
+        with open(os.path.join(self.directory, "load.sql"), "w", encoding="utf-8") as f:
+            f.write("-- mysql --local-infile=1 event_ticketing < load.sql  (from this directory)\n")
+            f.write("SET FOREIGN_KEY_CHECKS = 0;\nSET UNIQUE_CHECKS = 0;\n\n")
+            for name, _, columns in TABLES:
+                if name in self._files:
+                    f.write(
+                        f"LOAD DATA LOCAL INFILE '{name}.csv' INTO TABLE {name}\n"
+                        "  CHARACTER SET utf8mb4\n"
+                        "  FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"'\n"
+                        "  LINES TERMINATED BY '\\n' IGNORE 1 LINES\n"
+                        f"  ({', '.join(columns)});\n\n"
+                    )
+            f.write("SET UNIQUE_CHECKS = 1;\nSET FOREIGN_KEY_CHECKS = 1;\n")
+
+
+def _csv_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+# ------------------------------------------------------------
+# generation
+# ------------------------------------------------------------
+def generate(sink, events, customers, purchases, seed=42, as_of=AS_OF,
+             password=DEFAULT_PASSWORD, progress=None):
+    """
+    Write a full dataset to `sink`; returns summary counts.
+
+    progress -- optional callable(message) for the CLI
+    """
+    say = progress or (lambda message: None)
+    if events < 1 or customers < 1:
+        raise GenerationError("need at least one event and one customer")
+    organizers = min(customers, max(1, events // EVENTS_PER_ORGANIZER))
+
+    sink.write("CATEGORY", [
+        (i, name, f"{name} events") for i, name in enumerate(CATEGORIES, 1)
+    ])
+    venues = _venues(random.Random(f"{seed}:venues"), max(8, events // 50))
+    sink.write("VENUE", [
+        (v["venue_id"], v["venue_name"], v["address"], v["city"], v["capacity"], v["phone"])
+        for v in venues
+    ])
+
+    say(f"customers: {customers}")
+    password_hash = get_hasher().hash(password)
+    sink.write("CUSTOMER", _customers(seed, customers, organizers, password_hash, as_of))
+
+    say(f"events: {events} (planning)")
+    plan = _Plan(events)
+    for event, tiers in _events(seed, events, venues, organizers, as_of):
+        plan.add(event, tiers)
+
+    say(f"purchases: {purchases} (simulating)")
+    customer_picker = _WeightedPicker(
+        _zipf_weights(customers, 0.8, random.Random(f"{seed}:customer-ranks")))
+    sold = array("l", bytes(8 * len(plan.capacity)))
+    made = 0
+    for _, _, _, _, _, status, lines in _purchases(seed, purchases, plan, customer_picker, as_of):
+        made += 1
+        if status != "Refunded":
+            for ticket_index, quantity, _ in lines:
+                sold[ticket_index] += quantity
+
+    say("events + tickets: writing")
+    event_rows, ticket_rows = [], []
+    sold_out = 0
+    for event, tiers in _events(seed, events, venues, organizers, as_of):
+        event_sold = 0
+        for tier in tiers:
+            tier_sold = sold[tier["index"]]
+            event_sold += tier_sold
+            ticket_rows.append((tier["index"] + 1, event["event_id"], tier["ticket_type"],
+                                _money(tier["price_cents"]), tier["capacity"] - tier_sold))
+        sold_out += event_sold == event["total_tickets"]
+        event_rows.append((event["event_id"], event["event_name"], event["event_date"],
+                           event["description"], event["organizer_name"], event["organizer_email"],
+                           event["category_id"], event["venue_id"], event["total_tickets"],
+                           event_sold, event["status"]))
+        if len(event_rows) >= DEFAULT_CHUNK_SIZE:
+            sink.write("EVENT", event_rows)
+            sink.write("TICKET", ticket_rows)
+            event_rows, ticket_rows = [], []
+    sink.write("EVENT", event_rows)
+    sink.write("TICKET", ticket_rows)
+
+    say(f"purchases: {made} (writing)")
+    purchase_rows, line_rows = [], []
+    line_id = 0
+    refunded = 0
+    for purchase_id, customer_id, when, total, method, status, lines in _purchases(
+            seed, purchases, plan, customer_picker, as_of):
+        refunded += status == "Refunded"
+        purchase_rows.append((purchase_id, customer_id, when, _money(total), method, status))
+        for ticket_index, quantity, subtotal in lines:
+            line_id += 1
+            line_rows.append((line_id, purchase_id, ticket_index + 1, quantity, _money(subtotal)))
+        if len(purchase_rows) >= DEFAULT_CHUNK_SIZE:
+            sink.write("PURCHASE", purchase_rows)
+            sink.write("PURCHASE_TICKET", line_rows)
+            purchase_rows, line_rows = [], []
+    sink.write("PURCHASE", purchase_rows)
+    sink.write("PURCHASE_TICKET", line_rows)
+    sink.close()
+
+    return {
+        "categories": len(CATEGORIES),
+        "venues": len(venues),
+        "customers": customers,
+        "organizers": organizers,
+        "events": events,
+        "sold_out_events": sold_out,
+        "tickets": len(plan.capacity),
+        "purchases": made,
+        "refunded_purchases": refunded,
+        "purchase_lines": line_id,
+    }
+
+
+def _money(cents):
+    return Decimal(cents).scaleb(-2)
+
+
+class _WeightedPicker:
+    """Draws ids 1..n with the given weights (bisect over the running sum)."""
+
+    def __init__(self, weights):
+        self.cumulative = array("d", itertools.accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def pick(self, rng):
+        index = bisect(self.cumulative, rng.random() * self.total)
+        return min(index, len(self.cumulative) - 1) + 1
+
+
+def _zipf_weights(n, s, rng):
+    """Weights 1 / rank**s, the ranks spread over ids 1..n by a fixed shuffle."""
+    step, offset = _coprime_step(n, rng), rng.randrange(n)
+    weights = array("d", bytes(8 * n))
+    for rank in range(n):
+        weights[(rank * step + offset) % n] = 1.0 / (rank + 1) ** s
+    return weights
+
+
+def _coprime_step(n, rng):
+    if n <= 2:
+        return 1
+    while True:
+        step = rng.randrange(n // 3, n)
+        if gcd(step, n) == 1:
+            return step
+
+
+def _venues(rng, count):
+    cities = list(CITIES)
+    city_weights = list(CITIES.values())
+    venues = []
+    for venue_id in range(1, count + 1):
+        city = rng.choices(cities, city_weights)[0]
+        kind, typical = rng.choices(VENUE_KINDS, [1, 3, 3, 5, 8, 10, 14, 10])[0]
+        venues.append({
+            "venue_id": venue_id,
+            "venue_name": f"{rng.choice(LAST_NAMES)} {kind}"[:100],
+            "address": f"{rng.randint(1, 9999)} {rng.choice(LAST_NAMES)} Street",
+            "city": city,
+            "capacity": max(100, int(typical * rng.uniform(0.6, 1.3))),
+            "phone": f"{rng.randint(200, 999)}-555-{rng.randint(0, 9999):04d}",
+        })
+    return venues
+
+
+def _customers(seed, count, organizers, password_hash, as_of):
+    rng = random.Random(f"{seed}:customers")
+    start = (as_of - timedelta(days=5 * 365)).date()
+    for customer_id in range(1, count + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        organizer = customer_id <= organizers
+        yield (
+            customer_id,
+            first,
+            last,
+            (f"organizer{customer_id}@example.com" if organizer
+             else f"{first}.{last}.{customer_id}@example.com".lower()),
+            password_hash,
+            "admin" if organizer else "user",
+            f"{rng.randint(200, 999)}-555-{rng.randint(0, 9999):04d}" if rng.random() < 0.7 else None,
+            start + timedelta(days=rng.randrange(5 * 365)),
+        )
+
+
+def _events(seed, count, venues, organizers, as_of):
+    """Yield (event dict, [tier dicts]); the same seed gives the same stream."""
+    rng = random.Random(f"{seed}:events")
+    categories = list(CATEGORIES)
+    category_weights = [share for share, _, _ in CATEGORIES.values()]
+    venue_picker = _WeightedPicker(_zipf_weights(len(venues), 0.7, random.Random(f"{seed}:venue-ranks")))
+    organizer_picker = _WeightedPicker(
+        _zipf_weights(organizers, 1.0, random.Random(f"{seed}:organizer-ranks")))
+    first_day = as_of - timedelta(days=730)
+    tier_index = 0
+
+    for event_id in range(1, count + 1):
+        category_id = rng.choices(range(1, len(categories) + 1), category_weights)[0]
+        _, (low, high), words = CATEGORIES[categories[category_id - 1]]
+        venue = venues[venue_picker.pick(rng) - 1]
+        event_date = (first_day + timedelta(days=rng.randrange(1095))).replace(
+            hour=rng.choice((11, 14, 18, 19, 19, 20, 20, 21)), minute=rng.choice((0, 0, 30)))
+        total = max(50, int(venue["capacity"] * rng.uniform(0.4, 1.0)))
+
+        if rng.random() < CANCEL_RATE:
+            status = "Cancelled"
+        elif event_date.date() == as_of.date():
+            status = "Ongoing"
+        else:
+            status = "Completed" if event_date < as_of else "Upcoming"
+
+        theme = rng.choice(THEMES)
+        organizer_id = organizer_picker.pick(rng)
+        event = {
+            "event_id": event_id,
+            "event_name": f"{theme} {rng.choice(words)} {event_date.year}",
+            "event_date": event_date,
+            "description": f"{theme} {categories[category_id - 1].lower()} at {venue['venue_name']}, "
+                           f"{venue['city']}.",
+            "organizer_name": f"Organizer {organizer_id}",
+            "organizer_email": f"organizer{organizer_id}@example.com",
+            "category_id": category_id,
+            "venue_id": venue["venue_id"],
+            "total_tickets": total,
+            "status": status,
+        }
+
+        # 1-4 tiers whose seats add up to total_tickets exactly
+        n_tiers = rng.choices((1, 2, 3, 4), (2, 5, 3, 1))[0]
+        base = rng.randint(low, high) * 100
+        shares = [rng.uniform(0.5, 1.0) if i == 0 else rng.uniform(0.05, 0.3) for i in range(n_tiers)]
+        seats = [int(total * share / sum(shares)) for share in shares]
+        seats[0] += total - sum(seats)
+        tiers = []
+        for (ticket_type, factor), capacity in zip(TIER_TYPES, seats):
+            tiers.append({
+                "index": tier_index,
+                "ticket_type": ticket_type,
+                "price_cents": int(base * factor) // 100 * 100 + rng.choice((0, 0, 50, 99)),
+                "capacity": capacity,
+            })
+            tier_index += 1
+        yield event, tiers
+
+
+class _Plan:
+    """Per event / tier numbers the purchase simulation needs (arrays, not rows)."""
+
+    def __init__(self, events):
+        self.first_tier = array("l")
+        self.capacity = array("l")
+        self.price_cents = array("l")
+        self.window_start = array("d")   # sales window, seconds since the epoch
+        self.window_end = array("d")
+        self.on_sale = array("b")
+
+    def add(self, event, tiers):
+        self.first_tier.append(tiers[0]["index"])
+        for tier in tiers:
+            self.capacity.append(tier["capacity"])
+            self.price_cents.append(tier["price_cents"])
+
+        end = event["event_date"]
+        start = end - timedelta(days=SALES_WINDOW_DAYS)
+        self.window_start.append(start.timestamp())
+        self.window_end.append(end.timestamp())
+        self.on_sale.append(event["status"] != "Cancelled")
+
+    def tiers_of(self, event_index):
+        end = (self.first_tier[event_index + 1] if event_index + 1 < len(self.first_tier)
+               else len(self.capacity))
+        return range(self.first_tier[event_index], end)
+
+
+def _purchases(seed, count, plan, customer_picker, as_of):
+    """
+    Yield (purchase_id, customer_id, date, total cents, method, status,
+    [(ticket index, quantity, subtotal cents)]). Deterministic for a seed.
+    """
+    rng = random.Random(f"{seed}:purchases")
+    as_of_ts = as_of.timestamp()
+    n_events = len(plan.first_tier)
+
+    # popularity is Zipf; only events whose sales opened before as_of sell
+    weights = _zipf_weights(n_events, 1.05, random.Random(f"{seed}:event-ranks"))
+    for event_index in range(n_events):
+        if not plan.on_sale[event_index] or plan.window_start[event_index] >= as_of_ts:
+            weights[event_index] = 0.0
+    if not any(weights):
+        return
+    picker = _WeightedPicker(weights)
+
+    remaining = array("l", plan.capacity)
+    seats_left = array("l", (sum(remaining[t] for t in plan.tiers_of(e)) for e in range(n_events)))
+
+    purchase_id = 0
+    attempts = 0
+    while purchase_id < count and attempts < count * 10:
+        attempts += 1
+        event_index = picker.pick(rng) - 1
+        if seats_left[event_index] <= 0:
+            continue  # sold out: that demand is turned away
+        open_tiers = [t for t in plan.tiers_of(event_index) if remaining[t] > 0]
+        chosen = rng.sample(open_tiers, 2 if len(open_tiers) > 1 and rng.random() < 0.15 else 1)
+
+        roll = rng.random()
+        status = ("Refunded" if roll < REFUND_RATE
+                  else "Pending" if roll < REFUND_RATE + PENDING_RATE
+                  else "Completed")
+        lines = []
+        for t in sorted(chosen):
+            quantity = min(remaining[t], rng.choices((1, 2, 3, 4, 6), (30, 45, 10, 12, 3))[0])
+            if status != "Refunded":
+                remaining[t] -= quantity
+                seats_left[event_index] -= quantity
+            lines.append((t, quantity, quantity * plan.price_cents[t]))
+
+        start = plan.window_start[event_index]
+        end = min(plan.window_end[event_index], as_of_ts)
+        # sales pick up towards the event
+        when = datetime.fromtimestamp(int(end - (end - start) * rng.random() ** 2))
+
+        purchase_id += 1
+        customer_id = customer_picker.pick(rng)
+        yield (purchase_id, customer_id, when, sum(line[2] for line in lines),
+               rng.choice(PAYMENT_METHODS), status, lines)
@@ -0,0 +1,34 @@
+# backend/signals.py
+"""
+Change notifications for the in-process read models (search index, ...).
+
+Send them after the change is committed:
+
+    event_changed.send(current_app._get_current_object(), event_id=42)
+    event_changed.send(current_app._get_current_object(), event_id=42, deleted=True)
+    venue_changed.send(current_app._get_current_object(), venue_id=7)
+    inventory_changed.send(current_app._get_current_object(), event_ids=[42])
+    events_imported.send(current_app._get_current_object(), event_ids=[42, 43])
+"""
+from blinker import Namespace
+
+_signals = Namespace()
+
+# an EVENT row was created / updated / deleted
+event_changed = _signals.signal("event-changed")
+
+# a VENUE row was created / updated / deleted
+venue_changed = _signals.signal("venue-changed")
+
+# a CATEGORY row was created / updated / deleted
+category_changed = _signals.signal("category-changed")
+
+# many events were inserted at once (event_ids=[...]) -- one signal for the
+# whole bulk import instead of one event_changed per row
+events_imported = _signals.signal("events-imported")
+
+# a CUSTOMER's role or account changed (email=...)
+customer_changed = _signals.signal("customer-changed")
+
+# tickets were sold / given back (event_ids=[...] whose stock moved)
+inventory_changed = _signals.signal("inventory-changed")
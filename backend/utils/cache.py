@@ -0,0 +1,78 @@
+# backend/utils/cache.py
+"""
+Small thread-safe LRU cache with a per-entry TTL.
+
+    cache = TTLCache(maxsize=256, ttl=300)
+    venues = cache.get_or_load("venues", load_venues)   # read-through
+    cache.invalidate("venues")                           # explicit hook
+
+The cache is per process; the TTL bounds how stale another worker's copy
+can get after an invalidation it didn't see.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, maxsize=256, ttl=300, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data = OrderedDict()   # key -> (expires_at, value), LRU order
+        self._generation = 0         # bumped by invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key, loader, ttl=None, cache_none=True):
+        """Return the cached value, or call loader() and cache what it returns."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # loaded outside the lock: two threads may both load on a cold
+            # key, which is cheaper than making every reader wait on a query
+            generation = self._generation
+            value = loader()
+            # don't cache a value read before an invalidation that raced it
+            if generation == self._generation and (value is not None or cache_none):
+                self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when key is None."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self):
+        return {"size": len(self._data), "maxsize": self.maxsize,
+                "hits": self.hits, "misses": self.misses}
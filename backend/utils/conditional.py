@@ -0,0 +1,156 @@
+# backend/utils/conditional.py
+"""
+ETag / Last-Modified conditional GETs for the catalog endpoints.
+
+Every catalog resource has a version number kept in memory. Writers bump
+the versions they affect (through the signals in backend/signals.py), and
+the ETag is built from those numbers only -- so a request whose
+If-None-Match still matches gets its 304 before the view runs: no query,
+no serialization.
+
+    @conditional("events:{event_id}", cache_control="public, max-age=30")
+    def get_event_by_id(event_id): ...
+
+Names may use the view's URL arguments ({event_id}). Bumping "events:7"
+also bumps "events", so list endpoints keyed on "events" change too.
+
+Versions are per process. So that a worker that never saw a write can't
+keep answering 304 forever, every ETag also carries the current
+ETAG_WINDOW_SECONDS time window (default 60s): a stale 304 can't outlive it.
+"""
+import hashlib
+import itertools
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+from backend.signals import (
+    category_changed,
+    event_changed,
+    events_imported,
+    inventory_changed,
+    venue_changed,
+)
+
+DEFAULT_WINDOW_SECONDS = 60
+
+
+class CatalogVersions:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self._versions = {}   # name -> (version, last modified)
+        self._boot = os.urandom(4).hex()
+        self._started = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def bump(self, *names):
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        with self._lock:
+            for name in names:
+                version = next(self._counter)
+                self._versions[name] = (version, now)
+                # "events:7" also moves "events"
+                if ":" in name:
+                    self._versions[name.split(":", 1)[0]] = (version, now)
+
+    def get(self, name):
+        """(version, last modified) of one name."""
+        return self._versions.get(name, (0, self._started))
+
+    def etag_and_last_modified(self, names, window, query_string=None):
+        versions = [self.get(name) for name in names]
+        last_modified = max(modified for _, modified in versions)
+
+        now = int(time.time())
+        window_start = now - now % window
+        window_dt = datetime.fromtimestamp(window_start, timezone.utc)
+        if window_dt > last_modified:
+            last_modified = window_dt
+
+        # the query string changes the body (paging, fields=...)
+        if query_string is None:
+            query_string = request.query_string
+        args = hashlib.md5(query_string).hexdigest()[:8]
+        numbers = ".".join(str(version) for version, _ in versions)
+        etag = f"{self._boot}-{window_start}-{numbers}-{args}"
+        return etag, last_modified
+
+
+def init_conditional(app):
+    app.extensions["catalog_versions"] = CatalogVersions()
+
+    event_changed.connect(_on_event_changed, app)
+    inventory_changed.connect(_on_inventory_changed, app)
+    events_imported.connect(_on_events_imported, app)
+    category_changed.connect(_on_category_changed, app)
+    venue_changed.connect(_on_venue_changed, app)
+
+
+def get_versions():
+    return current_app.extensions["catalog_versions"]
+
+
+def conditional(*names, cache_control):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = get_versions()
+            window = current_app.config.get("ETAG_WINDOW_SECONDS", DEFAULT_WINDOW_SECONDS)
+            etag, last_modified = versions.etag_and_last_modified(
+                [name.format(**kwargs) for name in names], window
+            )
+
+            if _not_modified(etag, last_modified):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            response.headers["Cache-Control"] = cache_control
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _on_event_changed(app, event_id, **extra):
+    app.extensions["catalog_versions"].bump(f"events:{event_id}", f"tickets:{event_id}")
+
+
+def _on_events_imported(app, **extra):
+    # new ids only: nothing cached under "events:<id>" / "tickets:<id>" yet
+    app.extensions["catalog_versions"].bump("events")
+
+
+def _on_inventory_changed(app, event_ids, **extra):
+    # /api/events/ shows tickets_sold, /api/event-tickets/<id> the stock
+    names = [f"tickets:{event_id}" for event_id in event_ids]
+    names += [f"events:{event_id}" for event_id in event_ids]
+    app.extensions["catalog_versions"].bump(*names)
+
+
+# category / venue objects are embedded in the event responses too, so
+# those bump "events" as well (event details also list them explicitly)
+
+def _on_category_changed(app, **extra):
+    app.extensions["catalog_versions"].bump("categories", "events")
+
+
+def _on_venue_changed(app, **extra):
+    app.extensions["catalog_versions"].bump("venues", "events")
+
+
+def _not_modified(etag, last_modified):
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since:
+        return last_modified <= request.if_modified_since
+    return False
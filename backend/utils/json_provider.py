@@ -0,0 +1,101 @@
+# backend/utils/json_provider.py
+"""
+Pluggable JSON provider: orjson when it's installed, the stdlib otherwise.
+
+    JSON_PROVIDER = "auto"     orjson if importable, else stdlib (default)
+                    "orjson"   orjson, fail at startup if it's missing
+                    "stdlib"   Flask's DefaultJSONProvider (json module)
+
+OrjsonProvider keeps Flask's rules, so jsonify() bodies decode to the
+same values either way: keys sorted, dates / datetimes as RFC 822
+strings (http_date), Decimal and UUID as strings, dataclasses as dicts.
+Two differences on the wire:
+
+* non-ASCII text is sent as UTF-8 rather than \\uXXXX escapes
+* dumps() is compact unless an indent is asked for (the stdlib puts a
+  space after , and :)
+
+Anything orjson refuses (integers past 64 bits, an indent other than 2,
+json.dumps options such as cls=) goes to the stdlib path.
+
+The precompiled row encoders (utils/row_encoders.py) read sort_keys and
+ensure_ascii off whichever provider is installed, so their output
+matches it.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson
+    orjson = None
+
+PROVIDERS = ("auto", "orjson", "stdlib")
+
+_COMPACT = (",", ":")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    ensure_ascii = False
+
+    def _options(self, indent=None):
+        # datetimes go through default() (http_date) like the stdlib provider;
+        # int keys are turned into strings, as json.dumps does
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _orjson_kwargs(self, kwargs):
+        """The indent orjson can honour for these dumps() kwargs, or False."""
+        indent = kwargs.get("indent")
+        if kwargs.keys() - {"indent", "separators"} or indent not in (None, 2):
+            return False
+        separators = kwargs.get("separators")
+        if indent is None and separators not in (None, _COMPACT):
+            return False
+        if indent is not None and separators not in (None, (",", ": ")):
+            return False
+        return indent or 0
+
+    def dumps_bytes(self, obj, indent=None):
+        return orjson.dumps(obj, default=self.default, option=self._options(indent))
+
+    def dumps(self, obj, **kwargs):
+        indent = self._orjson_kwargs(kwargs)
+        if indent is not False:
+            try:
+                return self.dumps_bytes(obj, indent).decode()
+            except TypeError:  # orjson.JSONEncodeError
+                pass
+        if kwargs.get("indent") is None:
+            kwargs.setdefault("separators", _COMPACT)
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if (self.compact is None and self._app.debug) or self.compact is False else None
+        try:
+            body = self.dumps_bytes(obj, indent) + b"\n"
+        except TypeError:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json(app):
+    choice = app.config.get("JSON_PROVIDER", "auto")
+    if choice not in PROVIDERS:
+        raise ValueError(f"JSON_PROVIDER must be one of {', '.join(PROVIDERS)}")
+    if choice == "orjson" and orjson is None:
+        raise RuntimeError("JSON_PROVIDER is 'orjson' but orjson isn't installed")
+
+    if choice == "orjson" or (choice == "auto" and orjson is not None):
+        app.json = OrjsonProvider(app)
+    else:
+        app.json = DefaultJSONProvider(app)
@@ -0,0 +1,195 @@
+# backend/utils/latency.py
+"""
+Per-route latency histograms.
+
+Every request's wall time is counted into a log-bucketed histogram for
+its route (blueprint, method, URL rule). Bucket i holds the requests that
+took (2**((i-1)/4), 2**(i/4)] ms -- four buckets per doubling, so any
+percentile read back is within ~19% of the true value, and a histogram
+is a few dozen integers however many requests it has seen.
+
+The bucket bounds are fixed, so histograms merge by adding counts: the
+routes of a blueprint into a blueprint total, or (through the Prometheus
+export, summed by `le`) the workers of a deployment.
+
+    GET /api/admin/metrics/latency      JSON percentiles per blueprint / route
+    GET /api/admin/metrics/prometheus   text exposition format, one
+                                        http_request_duration_seconds
+                                        histogram per route
+
+Every route registered on the app is exported, including the ones no
+request has hit yet (all zeros), so the series set doesn't change as
+traffic arrives. Requests that matched no route (404s) are not counted.
+Histograms are per process and since start.
+"""
+import math
+import threading
+import time
+from collections import Counter
+
+from flask import current_app, g, request
+
+SUB_BUCKETS = 4        # per doubling
+MIN_INDEX = -40        # 2**-10 ms: everything faster lands here
+
+# the `le` bounds exported to Prometheus: 0.25 ms .. ~33 s, doubling.
+# Each is a bucket bound of the fine histogram, so the export is exact.
+EXPORT_BOUNDS_MS = [2.0 ** k for k in range(-2, 16)]
+
+PERCENTILES = (50, 90, 99)
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+        self.sum_ms = 0.0
+
+    @staticmethod
+    def index(ms):
+        if ms <= 0:
+            return MIN_INDEX
+        return max(MIN_INDEX, math.ceil(math.log2(ms) * SUB_BUCKETS))
+
+    @staticmethod
+    def upper_bound(index):
+        return 2.0 ** (index / SUB_BUCKETS)
+
+    def observe(self, ms):
+        self.buckets[self.index(ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+
+    def merge(self, other):
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+        return self
+
+    def percentile(self, pct):
+        """Upper bound (ms) of the bucket holding the pct-th percentile."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return self.upper_bound(index)
+
+    def cumulative(self, bounds_ms):
+        """[(bound, requests <= bound)] for ascending bucket-aligned bounds."""
+        out, seen = [], 0
+        ordered = sorted(self.buckets.items())
+        i = 0
+        for bound in bounds_ms:
+            limit = self.index(bound)
+            while i < len(ordered) and ordered[i][0] <= limit:
+                seen += ordered[i][1]
+                i += 1
+            out.append((bound, seen))
+        return out
+
+    def summary(self):
+        return {
+            "requests": self.count,
+            "avg_ms": round(self.sum_ms / self.count, 2) if self.count else None,
+            **{
+                f"p{pct}_ms": _round(self.percentile(pct)) for pct in PERCENTILES
+            },
+        }
+
+
+def _round(ms):
+    return None if ms is None else round(ms, 3)
+
+
+class RouteLatencies:
+    """One histogram per (blueprint, method, rule)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def observe(self, key, ms):
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(ms)
+
+    def snapshot(self, url_map=None):
+        """{key: copy of its histogram}, plus empty ones for unhit routes."""
+        with self._lock:
+            histograms = {
+                key: LatencyHistogram().merge(h) for key, h in self._histograms.items()
+            }
+        for key in _route_keys(url_map) if url_map is not None else ():
+            histograms.setdefault(key, LatencyHistogram())
+        return dict(sorted(histograms.items(), key=lambda item: (item[0][0] or "", item[0][2], item[0][1])))
+
+    def summary(self, url_map=None):
+        blueprints, routes = {}, {}
+        for (blueprint, method, rule), histogram in self.snapshot(url_map).items():
+            name = blueprint or "app"
+            blueprints.setdefault(name, LatencyHistogram()).merge(histogram)
+            routes[f"{method} {rule}"] = {"blueprint": name, **histogram.summary()}
+        return {
+            "blueprints": {name: h.summary() for name, h in sorted(blueprints.items())},
+            "routes": routes,
+        }
+
+    def prometheus(self, url_map=None):
+        name = "http_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Request latency by route.",
+            f"# TYPE {name} histogram",
+        ]
+        for (blueprint, method, rule), histogram in self.snapshot(url_map).items():
+            labels = (
+                f'blueprint="{_label(blueprint or "app")}",'
+                f'method="{_label(method)}",route="{_label(rule)}"'
+            )
+            for bound, count in histogram.cumulative(EXPORT_BOUNDS_MS):
+                lines.append(f'{name}_bucket{{{labels},le="{bound / 1000:g}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum_ms / 1000:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _route_keys(url_map):
+    for rule in url_map.iter_rules():
+        if rule.endpoint == "static":
+            continue
+        blueprint = rule.endpoint.rpartition(".")[0] or None
+        for method in sorted(rule.methods - {"HEAD", "OPTIONS"}):
+            yield (blueprint, method, rule.rule)
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def init_latency(app):
+    app.extensions["route_latencies"] = RouteLatencies()
+    app.before_request(_start_timer)
+    app.after_request(_observe)
+
+
+def get_latencies():
+    return current_app.extensions["route_latencies"]
+
+
+def _start_timer():
+    g.request_timer = time.perf_counter()
+
+
+def _observe(response):
+    started = g.pop("request_timer", None)
+    if started is not None and request.url_rule is not None:
+        get_latencies().observe(
+            (request.blueprint, request.method, request.url_rule.rule),
+            (time.perf_counter() - started) * 1000,
+        )
+    return response
@@ -0,0 +1,199 @@
+# backend/utils/pagination.py
+"""
+Keyset (cursor) pagination + field projection for the list endpoints.
+
+    GET /api/events/?limit=50&fields=event_id,event_name&cursor=<opaque>
+
+* the page is found by seeking past the last key of the previous page
+  (WHERE key > :last ORDER BY key LIMIT n) so deep pages cost the same
+  as the first one, unlike OFFSET
+* only the columns named in `fields` (plus the key) are selected, so
+  big columns such as Event.description are never read unless asked for
+* the body stays a plain JSON list; the next page is advertised in the
+  X-Next-Cursor and Link headers (no header = last page)
+* rows are written to JSON by the precompiled encoder for their fields
+  (utils/row_encoders.py), without a dict per row
+"""
+import base64
+import json
+from urllib.parse import urlencode
+
+from flask import jsonify, request
+from sqlalchemy import and_, or_, select
+
+from backend.db import db
+from backend.utils.row_encoders import json_response, rows_json
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class PaginationError(ValueError):
+    pass
+
+
+def paginated_list(fields, key, query=None):
+    """
+    Build the JSON response for one page of a list endpoint.
+
+    fields -- {name: (column, to_json or None)} in output order
+    key    -- names of the fields to seek/sort on; the last one must be the
+              primary key so the ordering is unique
+    query  -- optional callable(select) -> select for extra filters
+    """
+    try:
+        limit = page_size()
+        names = requested_fields(fields)
+        after = decode_cursor(request.args.get("cursor"), [fields[k][0] for k in key])
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    stmt = page_statement(fields, key, names, after, limit)
+    if query is not None:
+        stmt = query(stmt)
+    body, last_key = page_json(db.session.execute(stmt).all(), fields, key, names, limit)
+    return _page_response(body, last_key)
+
+
+def paginated_cached_list(rows, fields, key):
+    """
+    Same contract as paginated_list(), but pages through rows that are
+    already in memory (dicts keyed by field name, sorted by key), e.g.
+    from the reference data cache.
+    """
+    try:
+        limit = page_size()
+        names = requested_fields(fields)
+        after = decode_cursor(request.args.get("cursor"), [fields[k][0] for k in key])
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    body, last_key = cached_page_json(rows, fields, key, names, after, limit)
+    return _page_response(body, last_key)
+
+
+# the request-independent halves of the two functions above, shared with
+# the async catalog (backend/routes/catalog_async.py)
+
+def page_statement(fields, key, names, after, limit):
+    """SELECT for one page; always selects the key so the next cursor can be built."""
+    selected = names + [k for k in key if k not in names]
+    stmt = select(*[fields[name][0] for name in selected])
+    if after is not None:
+        stmt = stmt.where(seek_past(fields, key, after))
+    return stmt.order_by(*[fields[k][0] for k in key]).limit(limit + 1)
+
+
+def page_json(rows, fields, key, names, limit, app=None):
+    """(JSON array text, last key or None) from the rows of page_statement()."""
+    selected = names + [k for k in key if k not in names]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    body = rows_json(fields, names, rows, app=app)
+    last_key = [rows[-1][selected.index(k)] for k in key] if has_more else None
+    return body, last_key
+
+
+def cached_page_json(rows, fields, key, names, after, limit, app=None):
+    """page_json() for in-memory rows (dicts sorted by key)."""
+    page = []
+    has_more = False
+    for row in rows:
+        if after is not None and [row[k] for k in key] <= after:
+            continue
+        if len(page) == limit:
+            has_more = True
+            break
+        page.append(row)
+
+    body = rows_json(fields, names, page, mapping=True, app=app)
+    last_key = [page[-1][k] for k in key] if has_more else None
+    return body, last_key
+
+
+def next_page_link(last_key, base_url, args):
+    """(X-Next-Cursor value, Link header value) for the page after last_key."""
+    token = encode_cursor(last_key)
+    args = dict(args)
+    args["cursor"] = token
+    return token, f'<{base_url}?{urlencode(args)}>; rel="next"'
+
+
+def _page_response(body, last_key):
+    response = json_response(body)
+    if last_key is not None:
+        token, link = next_page_link(last_key, request.base_url, request.args.to_dict())
+        response.headers["X-Next-Cursor"] = token
+        response.headers["Link"] = link
+    return response
+
+
+def encode_cursor(values):
+    raw = json.dumps([_to_cursor_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, columns):
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [
+            _from_cursor_value(v, col.type.python_type)
+            for v, col in zip(values, columns)
+        ]
+    except (ValueError, TypeError):
+        raise PaginationError("Invalid cursor")
+
+
+def page_size(args=None):
+    raw = (request.args if args is None else args).get("limit")
+    if raw is None:
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise PaginationError("limit must be an integer")
+    if limit < 1:
+        raise PaginationError("limit must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def requested_fields(fields, args=None):
+    raw = (request.args if args is None else args).get("fields")
+    if not raw:
+        return list(fields)
+    # a name asked for twice is sent once
+    names = list(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    unknown = [f for f in names if f not in fields]
+    if unknown:
+        raise PaginationError(f"Unknown field(s): {', '.join(unknown)}")
+    return names
+
+
+def seek_past(fields, key, after):
+    """WHERE clause for the rows after `after` (a decoded cursor) in key order."""
+    # (a, b) > (x, y)  ==  a > x OR (a = x AND b > y), written out so
+    # every database can use the (a, b) index for it
+    columns = [fields[k][0] for k in key]
+    clauses = []
+    for i, col in enumerate(columns):
+        equal = [columns[j] == after[j] for j in range(i)]
+        clauses.append(and_(*equal, col > after[i]))
+    return or_(*clauses)
+
+
+def _to_cursor_value(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _from_cursor_value(value, python_type):
+    if hasattr(python_type, "fromisoformat"):
+        return python_type.fromisoformat(value)
+    return python_type(value)
@@ -1,7 +1,42 @@
 # backend/utils/roles.py
+"""
+Shared auth helpers for JWT-protected views.
+
+    @admin_bp.route("/events")
+    @admin_required
+    def get_admin_events():
+        admin = current_customer()
+
+current_customer() resolves the token's identity (the email) through the
+identity cache (services/identity.py), once per request, so authorizing
+doesn't cost a query. Roles are checked against that record rather than
+the token's "role" claim, so a role change applies without a new login.
+"""
 from functools import wraps
-from flask import jsonify
-from flask_jwt_extended import verify_jwt_in_request, get_jwt
+
+from flask import g, jsonify
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+from backend.services.identity import get_customer_record
+
+
+def current_customer():
+    """CustomerRecord for the request's JWT identity, or None."""
+    if "current_customer" not in g:
+        g.current_customer = get_customer_record(get_jwt_identity())
+    return g.current_customer
+
+
+def login_required(fn):
+    """A valid JWT for an account that still exists (404 otherwise)."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        verify_jwt_in_request()
+        if current_customer() is None:
+            return jsonify({"error": "User not found"}), 404
+        return fn(*args, **kwargs)
+
+    return wrapper
 
 
 def admin_required(fn):
@@ -9,9 +44,9 @@ def admin_required(fn):
     def wrapper(*args, **kwargs):
         # ensure JWT exists
         verify_jwt_in_request()
-        claims = get_jwt()
-        if claims.get("role") != "admin":
-            return jsonify({"error": "Admin only"}), 403
+        customer = current_customer()
+        if customer is None or customer.role != "admin":
+            return jsonify({"error": "Admin access required"}), 403
         return fn(*args, **kwargs)
 
     return wrapper
@@ -0,0 +1,343 @@
+# backend/utils/sql_metrics.py
+"""
+Per-request SQL instrumentation and N+1 detection.
+
+Every statement a request runs (on the primary or a replica) is counted
+and timed, and its *shape* -- the SQL with literals and IN lists folded
+to ?, whitespace collapsed -- is fingerprinted. A request that runs the
+same SELECT shape SQL_N_PLUS_ONE_THRESHOLD times or more (default 5) is
+flagged as an N+1: one query per row of something it already loaded.
+Writes are counted but never flagged (row-by-row retries of a rejected
+bulk chunk are deliberate).
+
+Each response carries the totals in a Server-Timing header (browser dev
+tools show it in the network panel):
+
+    Server-Timing: db;dur=4.21;desc="7 queries", app;dur=11.80
+
+and the last SQL_METRICS_WINDOW_SECONDS (default 300) of requests are
+aggregated per route for GET /api/admin/metrics/sql. Aggregates are per
+process, like the other runtime metrics.
+
+Flagged requests are logged. With SQL_N_PLUS_ONE_RAISE set (the test
+fixtures set it) the request fails with NPlusOneDetected instead, so a
+test that exercises a per-row query loop fails.
+
+Statements run after the response is handed over (streamed bodies) are
+not counted.
+
+Slow queries: any statement that takes SLOW_QUERY_MS (default 250) or
+longer -- in a request, a CLI job, anywhere with an app context -- is
+logged and kept in a ring of the last SLOW_QUERY_LOG_SIZE (default 100)
+for GET /api/admin/metrics/slow-queries, with its SQL text, bind
+parameters (numbers kept, strings and everything else redacted), duration
+and EXPLAIN plan (EXPLAIN QUERY PLAN on SQLite, EXPLAIN on MySQL). The
+plan is taken right away on the same DBAPI connection, so it sees the
+same transaction; it is skipped for executemany and streamed results.
+SLOW_QUERY_MS = None turns the log off.
+
+One example (statement + bind parameters) of each SELECT shape requests
+ran is kept in memory, up to SQL_SHAPE_SAMPLES (default 500) shapes, for
+the index advisor (services/index_advisor.py) to EXPLAIN. Those
+parameters are never logged or served.
+
+SQL_METRICS_ENABLED = False turns all of this off.
+"""
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+
+from backend.db import db
+
+DEFAULT_THRESHOLD = 5
+DEFAULT_WINDOW_SECONDS = 300
+DEFAULT_SLOW_QUERY_MS = 250
+DEFAULT_SLOW_QUERY_LOG_SIZE = 100
+DEFAULT_SHAPE_SAMPLES = 500
+MAX_SAMPLES_PER_ROUTE = 2000
+SHAPE_LENGTH = 300
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_SPACE = re.compile(r"\s+")
+
+EXPLAIN_PREFIX = {"sqlite": "EXPLAIN QUERY PLAN ", "mysql": "EXPLAIN ", "mariadb": "EXPLAIN "}
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+
+class NPlusOneDetected(AssertionError):
+    pass
+
+
+def fingerprint(statement):
+    """The shape of a statement: same shape = same query with other values."""
+    shape = _STRING.sub("?", statement)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PARAM.sub("?", shape)
+    shape = _LIST.sub("?", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+class RequestSQL:
+    """What one request did against the database."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.shapes = Counter()
+        self.examples = {}
+
+    def record(self, statement, parameters, seconds, executemany=False):
+        self.statements += 1
+        self.db_seconds += seconds
+        shape = fingerprint(statement)
+        self.shapes[shape] += 1
+        if not executemany and shape not in self.examples and _is_read(shape):
+            self.examples[shape] = (statement, parameters)
+
+    def repeated(self, threshold):
+        """{shape: times run} for every SELECT shape run `threshold` times or more."""
+        return {shape: n for shape, n in self.shapes.items() if n >= threshold and _is_read(shape)}
+
+
+def _is_read(shape):
+    return shape.split(" ", 1)[0].upper() in ("SELECT", "WITH")
+
+
+class SQLMetrics:
+    """Rolling per-route aggregates over the last `window` seconds."""
+
+    def __init__(self, window=DEFAULT_WINDOW_SECONDS, threshold=DEFAULT_THRESHOLD,
+                 max_shapes=DEFAULT_SHAPE_SAMPLES):
+        self.window = window
+        self.threshold = threshold
+        self.max_shapes = max_shapes
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=MAX_SAMPLES_PER_ROUTE))
+        self._shapes = {}  # shape -> [statement, parameters, times run, route]
+
+    def add(self, route, sql, total_seconds, repeated):
+        sample = (time.monotonic(), sql.statements, sql.db_seconds, total_seconds, repeated)
+        with self._lock:
+            self._samples[route].append(sample)
+            for shape, (statement, parameters) in sql.examples.items():
+                seen = self._shapes.get(shape)
+                if seen is not None:
+                    seen[2] += sql.shapes[shape]
+                elif len(self._shapes) < self.max_shapes:
+                    self._shapes[shape] = [statement, parameters, sql.shapes[shape], route]
+
+    def shapes(self):
+        """[(shape, example statement, its parameters, times run, first route)]"""
+        with self._lock:
+            return [(shape, *example) for shape, example in self._shapes.items()]
+
+    def stats(self):
+        cutoff = time.monotonic() - self.window
+        routes = {}
+        with self._lock:
+            for route, samples in self._samples.items():
+                while samples and samples[0][0] < cutoff:
+                    samples.popleft()
+                if samples:
+                    routes[route] = _summarize(list(samples))
+        return {
+            "window_seconds": self.window,
+            "n_plus_one_threshold": self.threshold,
+            "routes": dict(sorted(routes.items())),
+        }
+
+
+class SlowQueryLog:
+    """The most recent slow statements, newest last."""
+
+    def __init__(self, threshold_ms=DEFAULT_SLOW_QUERY_MS, size=DEFAULT_SLOW_QUERY_LOG_SIZE):
+        self.threshold_ms = threshold_ms
+        self._lock = threading.Lock()
+        self._entries = deque(maxlen=size)
+
+    def add(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self):
+        with self._lock:
+            return list(self._entries)
+
+
+def redact(parameters, executemany=False):
+    """Bind parameters safe to log: numbers and NULLs only."""
+    if executemany:
+        return f"<{len(parameters)} rows>"
+    if isinstance(parameters, dict):
+        return {key: _redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(value) for value in parameters]
+    return _redact(parameters)
+
+
+def _redact(value):
+    if value is None or isinstance(value, (bool, int, float, Decimal)):
+        return value
+    if isinstance(value, (str, bytes)):
+        return f"<redacted {type(value).__name__}, {len(value)}>"
+    return f"<redacted {type(value).__name__}>"
+
+
+def explain(dialect, dbapi_connection, statement, parameters):
+    """The plan of `statement` as a list of row dicts, or None if it has none."""
+    prefix = EXPLAIN_PREFIX.get(dialect)
+    if prefix is None or statement.lstrip().split(" ", 1)[0].upper() not in EXPLAINABLE:
+        return None
+    # a raw DBAPI cursor: no SQLAlchemy events, so nothing counts or recurses
+    plan_cursor = dbapi_connection.cursor()
+    try:
+        plan_cursor.execute(prefix + statement, parameters)
+        columns = [column[0] for column in plan_cursor.description]
+        return [dict(zip(columns, row)) for row in plan_cursor.fetchall()]
+    finally:
+        plan_cursor.close()
+
+
+def _summarize(samples):
+    statements = [s[1] for s in samples]
+    db_ms = sorted(s[2] * 1000 for s in samples)
+    total_ms = sorted(s[3] * 1000 for s in samples)
+    worst = Counter()
+    for *_, repeated in samples:
+        for shape, n in repeated.items():
+            worst[shape] = max(worst[shape], n)
+    return {
+        "requests": len(samples),
+        "statements_avg": round(sum(statements) / len(samples), 2),
+        "statements_max": max(statements),
+        "db_ms_avg": round(sum(db_ms) / len(samples), 2),
+        "db_ms_p95": round(_percentile(db_ms, 95), 2),
+        "total_ms_avg": round(sum(total_ms) / len(samples), 2),
+        "total_ms_p95": round(_percentile(total_ms, 95), 2),
+        "n_plus_one_requests": sum(1 for s in samples if s[4]),
+        "n_plus_one_shapes": [
+            {"sql": shape[:SHAPE_LENGTH], "max_repeats": n} for shape, n in worst.most_common(5)
+        ],
+    }
+
+
+def _percentile(ordered, pct):
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def init_sql_metrics(app):
+    # call right after init_db(): the engines must exist, and the
+    # before_request hook should run before any other that queries
+    if not app.config.get("SQL_METRICS_ENABLED", True):
+        return
+
+    app.extensions["sql_metrics"] = SQLMetrics(
+        window=app.config.get("SQL_METRICS_WINDOW_SECONDS", DEFAULT_WINDOW_SECONDS),
+        threshold=app.config.get("SQL_N_PLUS_ONE_THRESHOLD", DEFAULT_THRESHOLD),
+        max_shapes=app.config.get("SQL_SHAPE_SAMPLES", DEFAULT_SHAPE_SAMPLES),
+    )
+    slow_ms = app.config.get("SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS)
+    if slow_ms is not None:
+        app.extensions["slow_queries"] = SlowQueryLog(
+            threshold_ms=slow_ms,
+            size=app.config.get("SLOW_QUERY_LOG_SIZE", DEFAULT_SLOW_QUERY_LOG_SIZE),
+        )
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+
+
+def get_sql_metrics():
+    return current_app.extensions["sql_metrics"]
+
+
+def get_slow_queries():
+    return current_app.extensions.get("slow_queries")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._sql_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_sql_started", None)
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+
+    if has_request_context():
+        sql = g.get("request_sql")
+        if sql is not None:
+            sql.record(statement, parameters, seconds, executemany)
+
+    slow = has_app_context() and current_app.extensions.get("slow_queries")
+    if slow and seconds * 1000 >= slow.threshold_ms:
+        _log_slow_query(slow, conn, cursor, statement, parameters, context, executemany, seconds)
+
+
+def _log_slow_query(slow, conn, cursor, statement, parameters, context, executemany, seconds):
+    plan = None
+    if not executemany and not context.execution_options.get("stream_results"):
+        try:
+            # same DBAPI connection: same transaction as the statement
+            plan = explain(conn.dialect.name, cursor.connection, statement, parameters)
+        except Exception as e:  # the plan is a nice-to-have, never fail the query for it
+            plan = f"EXPLAIN failed: {e}"
+
+    entry = {
+        "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "duration_ms": round(seconds * 1000, 2),
+        "sql": statement,
+        "params": redact(parameters, executemany),
+        "plan": plan,
+        "request": f"{request.method} {request.path}" if has_request_context() else None,
+    }
+    slow.add(entry)
+    current_app.logger.warning(
+        "slow query (%.1f ms) in %s: %s params=%s plan=%s",
+        entry["duration_ms"], entry["request"] or "app", statement, entry["params"], plan,
+    )
+
+
+def _start_request():
+    g.request_sql = RequestSQL()
+
+
+def _finish_request(response):
+    sql = g.pop("request_sql", None)
+    if sql is None:
+        return response
+    total = time.perf_counter() - sql.started
+
+    response.headers["Server-Timing"] = (
+        f'db;dur={sql.db_seconds * 1000:.2f};desc="{sql.statements} queries", '
+        f"app;dur={total * 1000:.2f}"
+    )
+
+    metrics = current_app.extensions["sql_metrics"]
+    repeated = sql.repeated(metrics.threshold)
+    if request.url_rule is not None:
+        metrics.add(f"{request.method} {request.url_rule.rule}", sql, total, repeated)
+
+    if repeated:
+        report = "; ".join(f"{n}x {shape[:SHAPE_LENGTH]}" for shape, n in repeated.items())
+        if current_app.config.get("SQL_N_PLUS_ONE_RAISE"):
+            raise NPlusOneDetected(f"{request.method} {request.path}: {report}")
+        current_app.logger.warning("N+1 queries in %s %s: %s", request.method, request.path, report)
+    return response
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark: catalog reads on WSGI threads vs. the ASGI / asyncio read path.
+
+    python -m benchmarks.bench_asgi_catalog --concurrency 256 --requests 20000
+    python -m benchmarks.bench_asgi_catalog --uri mysql+pymysql://u:p@db/tickets
+
+Serves the same database twice -- the Flask app from a WSGI server with
+a fixed pool of --threads worker threads (like gunicorn --threads), and
+backend.asgi under uvicorn -- then fires --requests GETs at each from
+--concurrency client threads, over the catalog URLs (list, details,
+tiers, search). Prints requests per second, p50 and p99 latency.
+
+Without --uri it builds and seeds a throwaway SQLite file. SQLite answers
+in microseconds, so that mostly measures framework overhead; the point of
+the async path shows with a networked database, where each query waits.
+
+Needs the ASGI extras: starlette, uvicorn, greenlet, aiosqlite / aiomysql.
+"""
+import argparse
+import logging
+import os
+import random
+import socket
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import uvicorn
+from werkzeug.serving import BaseWSGIServer
+
+from backend.app import create_app
+from backend.asgi import create_asgi_app
+from backend.db import db
+from benchmarks.bench_search import QUERIES, seed
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """A WSGI server with a fixed number of worker threads."""
+
+    request_queue_size = 4096
+
+    def __init__(self, host, port, app, threads):
+        super().__init__(host, port, app)
+        self._pool = ThreadPoolExecutor(threads)
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+class ThreadedUvicorn(uvicorn.Server):
+    def install_signal_handlers(self):
+        pass  # not on the main thread
+
+
+def percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * pct / 100), len(samples) - 1)]
+
+
+def catalog_paths(n_events, n, rng):
+    paths = []
+    for _ in range(n):
+        event_id = rng.randint(1, n_events)
+        paths.append(rng.choice([
+            "/api/events/?limit=50",
+            f"/api/events/{event_id}",
+            f"/api/event-tickets/{event_id}",
+            f"/api/events/search?q={rng.choice(QUERIES).replace(' ', '+')}",
+        ]))
+    return paths
+
+
+def hammer(base, paths, concurrency):
+    samples, errors = [], []
+
+    def get(path):
+        t0 = time.perf_counter()
+        try:
+            with urllib.request.urlopen(base + path, timeout=60) as response:
+                response.read()
+        except Exception as e:
+            errors.append(e)
+            return
+        samples.append((time.perf_counter() - t0) * 1000)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(get, paths))
+    return samples, errors, time.perf_counter() - started
+
+
+def report(label, samples, errors, elapsed):
+    print(f"{label:<26} {len(samples) / elapsed:8.0f} req/s"
+          f"   p50 {percentile(samples, 50):7.1f} ms"
+          f"   p99 {percentile(samples, 99):7.1f} ms"
+          f"   errors {len(errors)}")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--uri", help="existing database to read (default: seeded SQLite)")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--threads", type=int, default=16, help="WSGI worker threads")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    uri = args.uri or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_asgi.db')}"
+    app = create_app({"SQLALCHEMY_DATABASE_URI": uri})
+    with app.app_context():
+        if not args.uri:
+            db.create_all()
+            seed(args.events, random.Random(args.seed))
+
+    rng = random.Random(args.seed)
+    paths = catalog_paths(args.events, args.requests, rng)
+
+    # --- WSGI: a fixed pool of threads, one request each ---
+    wsgi = PooledWSGIServer("127.0.0.1", 0, app, args.threads)
+    threading.Thread(target=wsgi.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{wsgi.server_port}"
+    hammer(base, paths[:200], 8)  # warm up (search index, caches)
+    report(f"wsgi x{args.threads} threads", *hammer(base, paths, args.concurrency))
+    wsgi.shutdown()
+
+    # --- ASGI: the async catalog, same Flask app behind it ---
+    port = free_port()
+    server = ThreadedUvicorn(uvicorn.Config(
+        create_asgi_app(flask_app=app), host="127.0.0.1", port=port,
+        log_level="warning", backlog=4096,
+    ))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    base = f"http://127.0.0.1:{port}"
+    hammer(base, paths[:200], 8)
+    report("asgi (uvicorn, 1 loop)", *hammer(base, paths, args.concurrency))
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
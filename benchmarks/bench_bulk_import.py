@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: POST /api/admin/events/bulk with a large CSV upload.
+
+    python -m benchmarks.bench_bulk_import --rows 50000
+
+Builds a CSV of --rows events (two tiers each), uploads it through the
+Flask test client as the seeded organizer and prints rows per second.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from flask_jwt_extended import create_access_token
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Category, Customer, Venue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_import.db")
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+                      "BULK_IMPORT_CHUNK_SIZE": args.chunk_size,
+                      "HASHER_WORKERS": 0})
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([
+            Category(category_id=1, category_name="Concert"),
+            Venue(venue_id=1, venue_name="Grand Arena", address="123 Main Street",
+                  city="Toronto", capacity=15000),
+        ])
+        organizer = Customer(email="organizer@example.com", first_name="Org",
+                             last_name="Anizer", role="admin", password_hash="-")
+        db.session.add(organizer)
+        db.session.commit()
+        token = create_access_token(identity="organizer@example.com")
+
+    lines = ["event_name,event_date,category_id,venue_id,total_tickets,tiers"]
+    for i in range(args.rows):
+        lines.append(f"Imported Show {i},2030-06-01T20:00:00,1,1,1000,"
+                     f"General Admission:50.00:800|VIP:120.00:200")
+    body = "\n".join(lines).encode()
+
+    client = app.test_client()
+    t0 = time.perf_counter()
+    response = client.post("/api/admin/events/bulk", data=body, content_type="text/csv",
+                           headers={"Authorization": f"Bearer {token}"})
+    elapsed = time.perf_counter() - t0
+
+    report = response.get_json()
+    print(f"{report['imported']} events / {report['tiers']} tiers "
+          f"({report['failed']} failed) in {elapsed:.2f}s "
+          f"= {report['imported'] / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: every blueprint under concurrent HTTP load, as JSON.
+
+    python -m benchmarks.bench_http --output bench.json
+    python -m benchmarks.bench_http --scenarios browse_events,event_details --requests 2000
+    python -m benchmarks.bench_http --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_http --baseline benchmarks/baseline.json --tolerance 0.25
+
+Builds a throwaway SQLite database (--events synthetic events with two
+tiers each, an organizer, --customers buyers), serves create_app() from a
+threaded werkzeug server and, scenario by scenario, sends --requests
+requests from --concurrency client threads. Request mixes are drawn from
+a seeded RNG, so two runs with the same flags send the same requests.
+
+For every scenario the JSON report has throughput, p50 / p95 / p99 / max
+latency, the status codes seen and the SQL statements the server ran per
+request (counted on the engine, per request, in-process).
+
+With --baseline, each scenario is compared to the stored run and the
+exit status is 1 if any regressed: p95 up or throughput down by more
+than --tolerance (a fraction), or more SQL statements per request than
+the baseline plus --sql-tolerance.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from flask import g, has_request_context
+from sqlalchemy import event, insert
+from werkzeug.serving import make_server
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Customer, Event, Ticket
+from benchmarks.bench_search import CITIES, QUERIES, seed
+
+ORGANIZER = "org0@example.com"  # owns every 500th seeded event
+PASSWORD = "bench-password"
+SQL_HEADER = "X-Bench-SQL-Statements"
+
+
+# ------------------------------------------------------------
+# scenarios: name -> callable(rng, ctx) -> (method, path, json body, token)
+# ------------------------------------------------------------
+def _event_id(rng, ctx):
+    return rng.randint(1, ctx["events"])
+
+
+def _ticket_id(rng, ctx):
+    return rng.randint(1, ctx["events"] * 2)
+
+
+def _buyer(rng, ctx):
+    return ctx["buyers"][rng.randrange(len(ctx["buyers"]))]
+
+
+def _event_body(rng, name):
+    return {
+        "event_name": name,
+        "event_date": (datetime(2031, 1, 1) + timedelta(hours=rng.randint(0, 8000))).isoformat(),
+        "description": "Created by the benchmark",
+        "category_id": rng.randint(1, 6),
+        "venue_id": rng.randint(1, len(CITIES)),
+        "total_tickets": 500,
+    }
+
+
+SCENARIOS = {
+    # browse
+    "browse_events": lambda rng, ctx: ("GET", "/api/events/?limit=50", None, None),
+    "browse_tickets": lambda rng, ctx: ("GET", "/api/tickets/?limit=50", None, None),
+    "categories": lambda rng, ctx: ("GET", "/api/categories/", None, None),
+    "venues": lambda rng, ctx: ("GET", "/api/venues/", None, None),
+    "event_cards": lambda rng, ctx: ("GET", "/api/events/cards?limit=20", None, None),
+    # filter / search
+    "filter": lambda rng, ctx: (
+        "GET", f"/api/events/filter?q={rng.choice(QUERIES).replace(' ', '+')}"
+               f"&location={rng.choice(CITIES)}", None, None),
+    "search": lambda rng, ctx: (
+        "GET", f"/api/events/search?q={rng.choice(QUERIES).replace(' ', '+')}", None, None),
+    "suggest": lambda rng, ctx: (
+        "GET", f"/api/events/suggest?prefix={rng.choice(QUERIES)[:3]}", None, None),
+    # details
+    "event_details": lambda rng, ctx: ("GET", f"/api/events/{_event_id(rng, ctx)}", None, None),
+    "event_tickets": lambda rng, ctx: (
+        "GET", f"/api/event-tickets/{_event_id(rng, ctx)}", None, None),
+    # auth
+    "login": lambda rng, ctx: (
+        "POST", "/api/auth/login",
+        {"email": f"buyer{rng.randrange(len(ctx['buyers']))}@example.com", "password": PASSWORD},
+        None),
+    "me": lambda rng, ctx: ("GET", "/api/auth/me", None, _buyer(rng, ctx)),
+    # admin CRUD (on the organizer's own events)
+    "admin_list": lambda rng, ctx: ("GET", "/api/admin/events", None, ctx["organizer"]),
+    "admin_create": lambda rng, ctx: (
+        "POST", "/api/admin/events", _event_body(rng, "Bench Event"), ctx["organizer"]),
+    "admin_update": lambda rng, ctx: (
+        "PUT", f"/api/admin/events/{rng.choice(ctx['owned'])}",
+        _event_body(rng, "Bench Updated"), ctx["organizer"]),
+    "admin_delete": lambda rng, ctx: (
+        "DELETE", f"/api/admin/events/{ctx['created'].pop()}", None, ctx["organizer"]),
+    "admin_stats": lambda rng, ctx: ("GET", "/api/admin/stats", None, ctx["organizer"]),
+    "customers": lambda rng, ctx: ("GET", "/api/customers/?limit=50", None, None),
+    # purchases
+    "hold": lambda rng, ctx: (
+        "POST", "/api/holds/", {"ticket_id": _ticket_id(rng, ctx), "quantity": 1},
+        _buyer(rng, ctx)),
+    "purchase": lambda rng, ctx: (
+        "POST", "/api/purchases/",
+        {"tickets": [{"ticket_id": _ticket_id(rng, ctx), "quantity": rng.randint(1, 2)}]},
+        _buyer(rng, ctx)),
+    "purchase_list": lambda rng, ctx: ("GET", "/api/purchases/?limit=50", None, None),
+}
+
+
+# ------------------------------------------------------------
+# setup
+# ------------------------------------------------------------
+def build_app(args):
+    path = os.path.join(tempfile.mkdtemp(), "bench_http.db")
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "PBKDF2_ROUNDS": args.rounds,
+        "HASHER_WORKERS": args.hasher_workers,
+    })
+    with app.app_context():
+        db.create_all()
+        seed(args.events, random.Random(args.seed))
+        tiers = []
+        for event_id in range(1, args.events + 1):
+            tiers.append({"event_id": event_id, "ticket_type": "General Admission",
+                          "price": Decimal("60.00"), "quantity_available": 800})
+            tiers.append({"event_id": event_id, "ticket_type": "VIP",
+                          "price": Decimal("140.00"), "quantity_available": 200})
+        db.session.execute(insert(Ticket), tiers)
+
+        organizer = Customer(email=ORGANIZER, first_name="Org", last_name="Zero", role="admin")
+        organizer.set_password(PASSWORD)
+        db.session.add(organizer)
+        for i in range(args.customers):
+            buyer = Customer(email=f"buyer{i}@example.com", first_name="Buyer", last_name=str(i))
+            buyer.set_password(PASSWORD)
+            db.session.add(buyer)
+        db.session.commit()
+    _count_statements(app)
+    return app
+
+
+def _count_statements(app):
+    """Count SQL statements per request and report them in a response header."""
+    def before_cursor_execute(*_):
+        if has_request_context():
+            g.bench_statements = g.get("bench_statements", 0) + 1
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    @app.after_request
+    def add_header(response):
+        response.headers[SQL_HEADER] = str(g.get("bench_statements", 0))
+        return response
+
+
+def build_context(app, args):
+    client = app.test_client()
+
+    def token(email):
+        response = client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+        return response.get_json()["token"]
+
+    with app.app_context():
+        owned = [e for (e,) in db.session.query(Event.event_id)
+                 .filter(Event.organizer_email == ORGANIZER).order_by(Event.event_id)]
+    return {
+        "events": args.events,
+        "organizer": token(ORGANIZER),
+        "buyers": [token(f"buyer{i}@example.com") for i in range(min(args.customers, 50))],
+        "owned": owned,
+        "created": [],
+    }
+
+
+def _created_events(app):
+    with app.app_context():
+        return [e for (e,) in db.session.query(Event.event_id).filter(
+            Event.organizer_email == ORGANIZER, Event.event_name == "Bench Event")]
+
+
+# ------------------------------------------------------------
+# load
+# ------------------------------------------------------------
+def send(base, method, path, body, token):
+    headers = {}
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    request = urllib.request.Request(base + path, data=data, headers=headers, method=method)
+
+    t0 = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            status, statements = response.status, response.headers.get(SQL_HEADER)
+    except urllib.error.HTTPError as e:
+        e.read()
+        status, statements = e.code, e.headers.get(SQL_HEADER)
+    except OSError:
+        status, statements = 0, None  # connection refused / reset / timeout
+    return (time.perf_counter() - t0) * 1000, status, int(statements or 0)
+
+
+def percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * pct / 100), len(samples) - 1)]
+
+
+def run_scenario(base, name, ctx, args):
+    rng = random.Random(f"{args.seed}:{name}")
+    calls = [SCENARIOS[name](rng, ctx) for _ in range(args.requests + args.warmup)]
+    warmup, calls = calls[:args.warmup], calls[args.warmup:]
+
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        list(pool.map(lambda call: send(base, *call), warmup))
+        started = time.perf_counter()
+        results = list(pool.map(lambda call: send(base, *call), calls))
+        elapsed = time.perf_counter() - started
+
+    latencies = [r[0] for r in results]
+    statuses = Counter(r[1] for r in results)
+    statements = [r[2] for r in results]
+    method, path = calls[0][0], calls[0][1].split("?")[0]
+    return {
+        "request": f"{method} {path}",
+        "requests": len(results),
+        "errors": sum(n for status, n in statuses.items() if not 200 <= status < 400),
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        "throughput_rps": round(len(results) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(max(latencies), 2),
+        },
+        "sql_per_request": {
+            "mean": round(sum(statements) / len(statements), 2),
+            "max": max(statements),
+        },
+    }
+
+
+def scenario_order(names):
+    # deletes need the events the creates made
+    if "admin_delete" in names and "admin_create" not in names:
+        names = names + ["admin_create"]
+    return sorted(names, key=lambda n: (n == "admin_delete", list(SCENARIOS).index(n)))
+
+
+# ------------------------------------------------------------
+# baseline comparison
+# ------------------------------------------------------------
+def compare(report, baseline, tolerance, sql_tolerance):
+    """List of regression messages (empty = no regressions)."""
+    regressions = []
+    for name, now in report["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        p95, base_p95 = now["latency_ms"]["p95"], before["latency_ms"]["p95"]
+        if p95 > base_p95 * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base_p95} -> {p95} ms")
+        rps, base_rps = now["throughput_rps"], before["throughput_rps"]
+        if rps < base_rps * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base_rps} -> {rps} req/s")
+        sql, base_sql = now["sql_per_request"]["mean"], before["sql_per_request"]["mean"]
+        if sql > base_sql + sql_tolerance:
+            regressions.append(f"{name}: SQL statements/request {base_sql} -> {sql}")
+        if now["errors"] > before["errors"]:
+            regressions.append(f"{name}: errors {before['errors']} -> {now['errors']}")
+    return regressions
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", default="all",
+                        help=f"comma-separated, or 'all': {', '.join(SCENARIOS)}")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--customers", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=500, help="per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="per scenario, not measured")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=29000, help="PBKDF2 rounds")
+    parser.add_argument("--hasher-workers", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="also store the report as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against this stored report")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed p95 / throughput change as a fraction (default 0.2)")
+    parser.add_argument("--sql-tolerance", type=float, default=0.5,
+                        help="allowed extra SQL statements per request (default 0.5)")
+    args = parser.parse_args()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    names = list(SCENARIOS) if args.scenarios == "all" else args.scenarios.split(",")
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    app = build_app(args)
+    ctx = build_context(app, args)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    server.socket.listen(1024)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    report = {
+        "meta": {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **{k: getattr(args, k) for k in (
+                "events", "customers", "requests", "warmup", "concurrency", "rounds", "seed")},
+        },
+        "scenarios": {},
+    }
+    for name in scenario_order(names):
+        if name == "admin_delete":
+            ctx["created"] = _created_events(app)
+            if len(ctx["created"]) < args.requests + args.warmup:
+                print(f"{name:<16} skipped: only {len(ctx['created'])} events to delete",
+                      file=sys.stderr)
+                continue
+        result = report["scenarios"][name] = run_scenario(base, name, ctx, args)
+        print(f"{name:<16} {result['throughput_rps']:8.1f} req/s"
+              f"   p50 {result['latency_ms']['p50']:7.1f}"
+              f"   p95 {result['latency_ms']['p95']:7.1f}"
+              f"   p99 {result['latency_ms']['p99']:7.1f} ms"
+              f"   sql/req {result['sql_per_request']['mean']:5.1f}"
+              f"   errors {result['errors']}", file=sys.stderr)
+
+    server.shutdown()
+    app.extensions["password_hasher"].shutdown()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance, args.sql_tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("no regressions against the baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dicts + jsonify() vs. the precompiled row encoders.
+
+    python -m benchmarks.bench_json --events 50000
+
+Builds a throwaway SQLite database with synthetic events and ticket
+tiers, reads them once, then times only the serialization of the same
+rows four ways:
+
+    dicts + stdlib     what the list endpoints did: a dict per row
+                       (converters applied), Flask's json-module provider
+    dicts + orjson     the same dicts through OrjsonProvider
+    rows + stdlib      row encoders compiled for the stdlib provider
+    rows + orjson      row encoders compiled for OrjsonProvider
+
+and checks every variant decodes to the same list.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import insert, select
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Ticket
+from backend.routes.events import EVENT_FIELDS
+from backend.routes.tickets import TICKET_FIELDS
+from backend.utils import json_provider
+from backend.utils.row_encoders import rows_json
+from benchmarks.bench_search import seed, timed
+
+TIERS = (("General Admission", Decimal("75.00")), ("VIP", Decimal("150.00")))
+
+
+def seed_tickets(n_events):
+    rows = [
+        {"event_id": i, "ticket_type": name, "price": price, "quantity_available": 500}
+        for i in range(1, n_events + 1)
+        for name, price in TIERS
+    ]
+    for start in range(0, len(rows), 10000):
+        db.session.execute(insert(Ticket), rows[start:start + 10000])
+    db.session.commit()
+
+
+def as_dicts(rows, fields, names):
+    """The per-row dicts paginated_list() used to hand to jsonify()."""
+    items = []
+    for row in rows:
+        item = {}
+        for i, name in enumerate(names):
+            to_json = fields[name][1]
+            value = row[i]
+            item[name] = to_json(value) if to_json and value is not None else value
+        items.append(item)
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_json.db")
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}"})
+
+    with app.app_context():
+        db.create_all()
+        t0 = time.perf_counter()
+        seed(args.events, random.Random(args.seed))
+        seed_tickets(args.events)
+        print(f"seeded {args.events} events in {time.perf_counter() - t0:.1f}s")
+
+        stdlib = DefaultJSONProvider(app)
+        providers = {"stdlib": stdlib}
+        if json_provider.orjson is not None:
+            providers["orjson"] = json_provider.OrjsonProvider(app)
+        else:
+            print("orjson not installed: stdlib only")
+
+        print(f"\n{'list':<9}{'rows':>8}{'variant':>17}{'ms':>10}{'speedup':>9}")
+        for label, fields in (("events", EVENT_FIELDS), ("tickets", TICKET_FIELDS)):
+            names = list(fields)
+            rows = db.session.execute(select(*[fields[n][0] for n in names])).all()
+
+            variants = [
+                (f"{kind} + {name}", provider, kind)
+                for kind in ("dicts", "rows")
+                for name, provider in providers.items()
+            ]
+            baseline, expected = None, None
+            for variant, provider, kind in variants:
+                # row_encoder() compiles for (and caches per) the app's provider
+                app.json = provider
+                if kind == "dicts":
+                    def fn():
+                        return provider.dumps(as_dicts(rows, fields, names), separators=(",", ":"))
+                else:
+                    rows_json(fields, names, rows[:1])  # compile outside the timing
+
+                    def fn():
+                        return rows_json(fields, names, rows)
+
+                ms, body = timed(fn, args.repeat)
+                decoded = json.loads(body)
+                if expected is None:
+                    baseline, expected = ms, decoded
+                elif decoded != expected:
+                    raise SystemExit(f"{label}: {variant} decodes differently")
+                print(f"{label:<9}{len(rows):>8}{variant:>17}{ms:>10.1f}{baseline / ms:>8.1f}x")
+
+        app.json = stdlib
+
+
+if __name__ == "__main__":
+    main()
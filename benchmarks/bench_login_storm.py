@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: browse latency during a login storm.
+
+    python -m benchmarks.bench_login_storm --logins 16 --seconds 5
+
+Serves the app from a threaded werkzeug server, then for each hasher
+setup (inline on the request threads = before, process pool = after)
+runs --logins threads logging in back to back while one more thread
+browses /api/events/<id>. Prints browse p50/p99 and logins per second.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from werkzeug.serving import make_server
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Customer
+from benchmarks.bench_search import seed
+
+
+def percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * pct / 100), len(samples) - 1)]
+
+
+def _get(url):
+    with urllib.request.urlopen(url) as response:
+        response.read()
+
+
+def _login(url, email, password):
+    request = urllib.request.Request(
+        url, data=json.dumps({"email": email, "password": password}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def run(label, config, args):
+    path = os.path.join(tempfile.mkdtemp(), "bench_login.db")
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+                      "PBKDF2_ROUNDS": args.rounds, **config})
+    with app.app_context():
+        db.create_all()
+        seed(2000, random.Random(args.seed))
+        for i in range(args.logins):
+            customer = Customer(email=f"fan{i}@example.com", first_name="Fan", last_name=str(i))
+            customer.set_password("hunter2")
+            db.session.add(customer)
+        db.session.commit()
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    base = f"http://127.0.0.1:{server.server_port}/api"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    stop = threading.Event()
+    statuses = []
+
+    def storm(i):
+        while not stop.is_set():
+            statuses.append(_login(f"{base}/auth/login", f"fan{i}@example.com", "hunter2"))
+
+    _get(f"{base}/events/1")  # warm up
+    threads = [threading.Thread(target=storm, args=(i,)) for i in range(args.logins)]
+    for t in threads:
+        t.start()
+
+    samples = []
+    deadline = time.perf_counter() + args.seconds
+    rng = random.Random(args.seed)
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        _get(f"{base}/events/{rng.randint(1, 2000)}")
+        samples.append((time.perf_counter() - t0) * 1000)
+
+    stop.set()
+    for t in threads:
+        t.join()
+    server.shutdown()
+    app.extensions["password_hasher"].shutdown()
+
+    ok = statuses.count(200)
+    print(f"{label:<22} browse p50 {percentile(samples, 50):7.1f} ms"
+          f"   p99 {percentile(samples, 99):7.1f} ms"
+          f"   logins/s {ok / args.seconds:6.1f}"
+          f"   503s {statuses.count(503)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=16, help="concurrent login threads")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rounds", type=int, default=29000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    run("inline (before)", {"HASHER_WORKERS": 0, "HASHER_MAX_PENDING": 10_000}, args)
+    run(f"pool x{args.workers} (after)", {"HASHER_WORKERS": args.workers}, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: LIKE '%q%' scans vs. the in-memory event search index.
+
+    python -m benchmarks.bench_search --events 100000
+
+Builds a throwaway SQLite database, fills it with synthetic events and
+times the same keyword queries both ways.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, or_
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Category, Event, Venue
+from backend.services.search_index import get_search_index
+
+COMMON = (
+    "rock jazz live legends night summer festival championship basketball "
+    "hockey comedy special theater shakespeare summit tech innovation gala "
+    "classic tribute acoustic orchestra symphony finals derby marathon expo"
+).split()
+# plus a long tail of rarer words, like real event titles have
+RARE = [f"{a}{b}" for a in ("al", "bo", "ka", "mi", "ro", "su", "te", "vi")
+        for b in ("dan", "fer", "gos", "lin", "mar", "nos", "pel", "quin", "rez",
+                  "sol", "tan", "ver", "wix", "yul", "zor")]
+WORDS = COMMON + RARE
+CITIES = ["Toronto", "Oshawa", "Mississauga", "Ottawa", "Hamilton", "Kingston"]
+QUERIES = ["rock", "jazz night", "summer festival", "comedy special", "sym", "kalin", "mitan rock"]
+
+
+def seed(n_events, rng):
+    db.session.execute(insert(Category), [
+        {"category_id": i, "category_name": name, "description": name}
+        for i, name in enumerate(["Concert", "Sports", "Theater", "Conference", "Comedy", "Festival"], 1)
+    ])
+    db.session.execute(insert(Venue), [
+        {"venue_id": i, "venue_name": f"{city} Arena", "address": f"{i} Main St",
+         "city": city, "capacity": 5000}
+        for i, city in enumerate(CITIES, 1)
+    ])
+    start = datetime(2030, 1, 1)
+    rows = []
+    for i in range(1, n_events + 1):
+        rows.append({
+            "event_id": i,
+            "event_name": " ".join(rng.sample(WORDS, 3)).title(),
+            "event_date": start + timedelta(hours=i),
+            "description": " ".join(rng.choices(WORDS, k=12)),
+            "organizer_name": f"Organizer {i % 500}",
+            "organizer_email": f"org{i % 500}@example.com",
+            "category_id": rng.randint(1, 6),
+            "venue_id": rng.randint(1, len(CITIES)),
+            "total_tickets": 1000,
+            "tickets_sold": 0,
+            "status": "Upcoming",
+        })
+        if len(rows) == 10000:
+            db.session.execute(insert(Event), rows)
+            rows = []
+    if rows:
+        db.session.execute(insert(Event), rows)
+    db.session.commit()
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_search.db")
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}"})
+
+    with app.app_context():
+        db.create_all()
+        t0 = time.perf_counter()
+        seed(args.events, random.Random(args.seed))
+        print(f"seeded {args.events} events in {time.perf_counter() - t0:.1f}s")
+
+        t0 = time.perf_counter()
+        index = get_search_index()
+        print(f"built index over {len(index)} events in {time.perf_counter() - t0:.1f}s\n")
+
+        print(f"{'query':<18}{'LIKE ms':>10}{'index ms':>10}{'speedup':>9}{'hits':>8}")
+        for q in QUERIES:
+            def like():
+                query = Event.query.with_entities(Event.event_id)
+                for word in q.split():
+                    query = query.filter(or_(
+                        Event.event_name.ilike(f"%{word}%"),
+                        Event.description.ilike(f"%{word}%"),
+                    ))
+                return query.all()
+
+            like_ms, like_rows = timed(like, args.repeat)
+            index_ms, ids = timed(lambda: index.search(q), args.repeat)
+            print(f"{q:<18}{like_ms:>10.2f}{index_ms:>10.2f}"
+                  f"{like_ms / max(index_ms, 1e-6):>8.0f}x{len(ids):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /api/events/suggest lookup latency.
+
+    python -m benchmarks.bench_suggest --events 100000
+
+Times PrefixSuggester.suggest() directly (p50/p99 per lookup) for every
+1-6 character prefix of a sample of event names, then the full HTTP
+round trip through the Flask test client for comparison.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Event
+from backend.services.suggest import get_suggester
+from benchmarks.bench_search import seed
+
+
+def percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * pct / 100), len(samples) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    path = os.path.join(tempfile.mkdtemp(), "bench_suggest.db")
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}"})
+
+    with app.app_context():
+        db.create_all()
+        seed(args.events, rng)
+
+        t0 = time.perf_counter()
+        suggester = get_suggester()
+        print(f"built suggester over {len(suggester.entries)} names "
+              f"in {time.perf_counter() - t0:.2f}s")
+
+        names = [n for (n,) in db.session.query(Event.event_name).limit(2000)]
+
+    prefixes = []
+    for _ in range(args.lookups):
+        word = rng.choice(rng.choice(names).split())
+        prefixes.append(word[:rng.randint(1, min(6, len(word)))])
+
+    samples = []
+    for prefix in prefixes:
+        t0 = time.perf_counter()
+        suggester.suggest(prefix)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    print(f"lookup   p50 {percentile(samples, 50):8.1f} us   p99 {percentile(samples, 99):8.1f} us")
+
+    client = app.test_client()
+    samples = []
+    for prefix in prefixes[:2000]:
+        t0 = time.perf_counter()
+        client.get(f"/api/events/suggest?prefix={prefix}")
+        samples.append((time.perf_counter() - t0) * 1e6)
+    print(f"http     p50 {percentile(samples, 50):8.1f} us   p99 {percentile(samples, 99):8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Shared pytest fixtures: a throwaway SQLite copy of the schema with a small
+slice of the sample data from Database/sampledata.sql.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Category, Venue, Event, Ticket, Customer
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        # hash inline and cheaply: no worker processes in tests
+        "HASHER_WORKERS": 0,
+        "PBKDF2_ROUNDS": 1000,
+        # a request that loops one query per row fails its test
+        "SQL_N_PLUS_ONE_RAISE": True,
+    })
+
+    with app.app_context():
+        db.create_all()
+        _seed()
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def other_worker(app):
+    """A second app on the same database: another worker process, as far as state goes."""
+    other = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": app.config["SQLALCHEMY_DATABASE_URI"],
+        "HASHER_WORKERS": 0,
+    })
+    yield other
+
+    with other.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def count_queries(app):
+    """Collects every SQL statement the app runs while the fixture is active."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def _seed():
+    db.session.add_all([
+        Category(category_id=1, category_name="Concert", description="Live music"),
+        Category(category_id=2, category_name="Sports", description="Sporting events"),
+        Venue(venue_id=1, venue_name="Grand Arena", address="123 Main Street",
+              city="Toronto", capacity=15000, phone="416-555-0101"),
+        Venue(venue_id=2, venue_name="Community Center", address="789 King Street",
+              city="Oshawa", capacity=500, phone="905-555-0103"),
+    ])
+
+    for i in range(1, 21):
+        db.session.add(Event(
+            event_id=i,
+            event_name=f"Rock Legends Live {i}" if i % 2 else f"Basketball Night {i}",
+            event_date=datetime(2030, 1, 1, 19, 0) if i % 2 else datetime(2030, 2, 1, 18, 30),
+            description="Seeded test event",
+            organizer_name="LiveNation Events",
+            organizer_email="organizer@example.com",
+            category_id=1 if i % 2 else 2,
+            venue_id=1 if i % 4 else 2,
+            total_tickets=1000,
+            tickets_sold=0,
+            status="Upcoming",
+        ))
+        db.session.add_all([
+            Ticket(event_id=i, ticket_type="General Admission",
+                   price=Decimal("75.00"), quantity_available=800),
+            Ticket(event_id=i, ticket_type="VIP",
+                   price=Decimal("150.00"), quantity_available=200),
+        ])
+
+    admin = Customer(customer_id=1, first_name="Ada", last_name="Admin",
+                     email="organizer@example.com", role="admin")
+    admin.set_password("admin123")
+    buyer = Customer(customer_id=2, first_name="Test", last_name="User",
+                     email="test@example.com", role="user")
+    buyer.set_password("test123")
+    db.session.add_all([admin, buyer])
+
+    db.session.commit()
@@ -22,9 +22,17 @@ async function initAdminDashboard() {
 
     userInfoEl.textContent = `${me.first_name || ""} ${me.last_name || ""} · ${me.email || ""}`;
 
-    const events = await fetchAdminEvents();
+    const [events, stats] = await Promise.all([
+      fetchAdminEvents(),
+      fetchAdminStats().catch(() => null),
+    ]);
     window.adminEvents = events || [];
 
+    const statsById = {};
+    ((stats && stats.events) || []).forEach((s) => {
+      statsById[s.event_id] = s;
+    });
+
     if (!events || events.length === 0) {
       statusEl.textContent = "No events found.";
       tableEl.style.display = "none";
@@ -50,6 +58,9 @@ async function initAdminDashboard() {
             });
 
         const statusClass = getStatusClass(e.status);
+        const s = statsById[e.event_id];
+        const sellThrough = s && s.sell_through != null ? `${(s.sell_through * 100).toFixed(1)}%` : "—";
+        const revenue = s ? `$${s.revenue.toFixed(2)}` : "—";
 
         return `
           <tr>
@@ -59,6 +70,8 @@ async function initAdminDashboard() {
             <td><span class="status-pill ${statusClass}">${e.status}</span></td>
             <td>${e.total_tickets}</td>
             <td>${e.tickets_sold}</td>
+            <td>${sellThrough}</td>
+            <td>${revenue}</td>
             <td>${e.organizer_email || ""}</td>
             <td>
               <button class="btn-small edit-btn" onclick="openEditEvent(${e.event_id})">Edit</button>
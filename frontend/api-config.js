@@ -16,11 +16,13 @@ const API_ENDPOINTS = {
     createEvent: `${API_BASE_URL}/admin/events`,
     updateEvent: (id) => `${API_BASE_URL}/admin/events/${id}`,
     deleteEvent: (id) => `${API_BASE_URL}/admin/events/${id}`,
+    stats: `${API_BASE_URL}/admin/stats`,
   },
 
  events: {
     getAll: `${API_BASE_URL}/events`,
     getById: (id) => `${API_BASE_URL}/events/${id}`,   
+    cards: `${API_BASE_URL}/events/cards`,
 },
 
 
@@ -126,6 +128,11 @@ async function fetchAdminEvents() {
   return await apiRequest(API_ENDPOINTS.admin.getMyEvents);
 }
 
+// revenue / sell-through per event (served from the sales rollups)
+async function fetchAdminStats() {
+  return await apiRequest(API_ENDPOINTS.admin.stats);
+}
+
 // ============================================================
 // Purchases / Tickets
 // ============================================================
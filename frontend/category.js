@@ -21,19 +21,20 @@ function getMinPrice(tickets) {
 // ============================================================
 // FETCH ALL EVENTS + ATTACH NEEDED DATA
 // ============================================================
-async function fetchAllEvents() {
-  const response = await fetch(`${API_BASE}/events/`);
-  const events = await response.json();
-
-  // Attach venue, category, tickets
-  for (let e of events) {
-    const detail = await (await fetch(`${API_BASE}/events/${e.event_id}`)).json();
-    e.category = detail.category;
-    e.venue = detail.venue;
-
-    e.tickets = await (await fetch(`${API_BASE}/event-tickets/${e.event_id}`)).json();
-  }
-
+async function fetchAllEvents(category) {
+  // venue, category and tickets come back attached; /events/cards is
+  // paged, so walk the cursor until there's no next page
+  const events = [];
+  let cursor = null;
+  do {
+    const url = new URL(`${API_BASE}/events/cards`);
+    if (category && category !== "All") url.searchParams.append("category", category);
+    if (cursor) url.searchParams.append("cursor", cursor);
+
+    const response = await fetch(url);
+    events.push(...(await response.json()));
+    cursor = response.headers.get("X-Next-Cursor");
+  } while (cursor);
   return events;
 }
 
@@ -166,7 +167,7 @@ async function loadCategoryEvents() {
   document.getElementById("categoryTitle").textContent =
     category === "All" ? "All Events" : `${category} Events`;
 
-  const events = await fetchAllEvents();
+  const events = await fetchAllEvents(category);
 
   let filtered = filterByCategory(events, category);
   filtered = filterByLocation(filtered, location);
@@ -29,19 +29,11 @@ async function loadEventDetails() {
 
     // 2. Load relational data
     const tickets = await apiRequest(`${API_BASE_URL}/event-tickets/${eventId}`);
-    const categories = await apiRequest(`${API_BASE_URL}/categories/`);
-    const venues = await apiRequest(`${API_BASE_URL}/venues/`);
 
-    console.log("===== ALL VENUES =====");
-console.log(venues);
-
-console.log("===== ALL CATEGORIES =====");
-console.log(categories);
-
-
-    // 3. Join relational data
-    const category = categories.find(c => Number(c.category_id) === Number(event.category_id));
-const venue = venues.find(v => Number(v.venue_id) === Number(event.venue_id));
+    // 3. Category and venue already come embedded in the event
+    //    (/venues/ is paged, so don't look them up in the full list)
+    const category = event.category;
+    const venue = event.venue;
 
 console.log("===== MATCHED CATEGORY =====", category);
 console.log("===== MATCHED VENUE =====", venue);
@@ -127,8 +119,24 @@ function loadTicketOptions(tickets) {
     .join("");
 }
 
-function purchaseTicket(id, type, price) {
-  alert(`Stub: purchase ${type} for $${price}.`);
+async function purchaseTicket(id, type, price) {
+  if (!localStorage.getItem("authToken")) {
+    window.location.href = "login.html";
+    return;
+  }
+
+  if (!confirm(`Buy 1 ${type} ticket for $${parseFloat(price).toFixed(2)}?`)) return;
+
+  try {
+    const purchase = await createPurchase({
+      payment_method: "Credit Card",
+      tickets: [{ ticket_id: id, quantity: 1 }],
+    });
+    alert(`Purchase #${purchase.purchase_id} confirmed.`);
+    loadEventDetails();
+  } catch (err) {
+    alert("Sorry, that ticket could not be purchased (it may be sold out).");
+  }
 }
 
 document.addEventListener("DOMContentLoaded", loadEventDetails);
@@ -99,22 +99,11 @@ async function fetchEventsFromAPI() {
   grid.innerHTML = `<p style="grid-column:1/-1;text-align:center;">Loading...</p>`;
 
   try {
-    const res = await fetch(`${API_BASE}/events/`);
-    const events = await res.json();
+    // one call: cards come back sorted by date with venue, category and tickets attached
+    const res = await fetch(`${API_BASE}/events/cards?limit=6`);
+    const upcoming = await res.json();
 
-    const upcoming = events.sort((a, b) => new Date(a.event_date) - new Date(b.event_date));
-
-    for (let event of upcoming) {
-      const tRes = await fetch(`${API_BASE}/event-tickets/${event.event_id}`);
-      event.tickets = await tRes.json();
-
-      const eRes = await fetch(`${API_BASE}/events/${event.event_id}`);
-      const fullData = await eRes.json();
-      event.venue = fullData.venue;
-      event.category = fullData.category;
-    }
-
-    renderEvents(upcoming.slice(0, 6));
+    renderEvents(upcoming);
   } catch (err) {
     console.error(err);
     grid.innerHTML = `<p style="color:red;">Failed to load events.</p>`;
@@ -153,6 +142,39 @@ function quickSearch(keyword) {
   searchEvents();
 }
 
+// ============================================================
+// TYPE-AHEAD SUGGESTIONS
+// ============================================================
+let suggestTimer = null;
+
+function loadSuggestions() {
+  clearTimeout(suggestTimer);
+  suggestTimer = setTimeout(async () => {
+    const prefix = document.getElementById("searchInput").value.trim();
+    const list = document.getElementById("searchSuggestions");
+    if (!prefix) {
+      list.innerHTML = "";
+      return;
+    }
+
+    const url = new URL(`${API_BASE}/events/suggest`);
+    url.searchParams.append("prefix", prefix);
+    url.searchParams.append("limit", "8");
+
+    try {
+      const suggestions = await (await fetch(url)).json();
+      // event / venue names are user-supplied: set them as values, never as HTML
+      list.replaceChildren(...suggestions.map(s => {
+        const option = document.createElement("option");
+        option.value = s.text;
+        return option;
+      }));
+    } catch (err) {
+      console.error(err);
+    }
+  }, 150);
+}
+
 // ============================================================
 // CATEGORY COUNTS
 // ============================================================
@@ -160,8 +182,19 @@ async function loadCategoryCounts() {
   const res = await fetch(`${API_BASE}/categories/`);
   const categories = await res.json();
 
-  const eventsRes = await fetch(`${API_BASE}/events/`);
-  const events = await eventsRes.json();
+  // /events/ is paged: walk the cursor, asking only for the column we count on
+  const events = [];
+  let cursor = null;
+  do {
+    const url = new URL(`${API_BASE}/events/`);
+    url.searchParams.append("fields", "category_id");
+    url.searchParams.append("limit", "500");
+    if (cursor) url.searchParams.append("cursor", cursor);
+
+    const eventsRes = await fetch(url);
+    events.push(...(await eventsRes.json()));
+    cursor = eventsRes.headers.get("X-Next-Cursor");
+  } while (cursor);
 
   const counts = {};
   for (let c of categories) counts[c.category_name] = 0;
@@ -190,6 +223,7 @@ document.addEventListener("DOMContentLoaded", () => {
   document.getElementById("searchInput").addEventListener("keypress", e => {
     if (e.key === "Enter") searchEvents();
   });
+  document.getElementById("searchInput").addEventListener("input", loadSuggestions);
 });
 
 // EXPORT for debugging if needed
@@ -0,0 +1,55 @@
+"""
+Tests for the admin listings (/api/customers/, /api/purchases/)
+"""
+import json
+
+from backend.db import db
+from backend.utils import streaming
+
+
+def test_customers_stream_as_ndjson(client):
+    response = client.get("/api/customers/", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [r["customer_id"] for r in rows] == [1, 2]
+    assert "password_hash" not in rows[0]
+
+
+def test_customers_stream_as_csv_with_projection(client):
+    response = client.get("/api/customers/?format=csv&fields=customer_id,email")
+
+    assert response.mimetype == "text/csv"
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines == [
+        "customer_id,email",
+        "1,organizer@example.com",
+        "2,test@example.com",
+    ]
+
+
+def test_plain_json_is_still_the_default(client):
+    response = client.get("/api/purchases/")
+    assert response.mimetype == "application/json"
+    assert response.get_json() == []
+
+
+def test_streams_span_several_chunks(app, client, monkeypatch):
+    with app.app_context():
+        for i in range(7):
+            db.session.execute(db.text(
+                "INSERT INTO customer (email, password_hash, role, registration_date) "
+                f"VALUES ('fan{i}@example.com', '-', 'user', '2030-01-01')"
+            ))
+        db.session.commit()
+    monkeypatch.setattr(streaming, "STREAM_CHUNK_SIZE", 2)   # 9 rows: 2+2+2+2+1
+
+    response = client.get("/api/customers/?format=ndjson", buffered=False)
+    chunks = [c.decode() for c in response.response]
+    assert len(chunks) == 5
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert [r["customer_id"] for r in rows] == list(range(1, 10))
+
+    lines = client.get("/api/customers/?format=csv&fields=customer_id").get_data(as_text=True)
+    assert lines.splitlines() == ["customer_id", *[str(i) for i in range(1, 10)]]
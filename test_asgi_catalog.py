@@ -0,0 +1,78 @@
+"""
+The async catalog (backend/asgi.py) must answer exactly like the Flask
+endpoints it stands in for, and hand everything else to Flask.
+"""
+import pytest
+
+pytest.importorskip("starlette")
+pytest.importorskip("httpx")  # starlette's TestClient
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+from starlette.testclient import TestClient  # noqa: E402
+
+from backend.asgi import async_uri, create_asgi_app  # noqa: E402
+
+
+@pytest.fixture
+def asgi_client(app):
+    with TestClient(create_asgi_app(flask_app=app)) as client:
+        yield client
+
+
+@pytest.mark.parametrize("path", [
+    "/api/events/",
+    "/api/events/?limit=5&fields=event_id,event_name",
+    "/api/events/search?q=rock",
+    "/api/events/filter?q=rock&location=Oshawa",
+    "/api/events/filter?location=Toronto&date=year",
+    "/api/events/cards?limit=3",
+    "/api/events/cards?limit=2&category=Sports&q=night",
+    "/api/events/cards?ids=3,1,3",
+    "/api/events/cards?limit=0",
+    "/api/events/suggest?prefix=tor",
+    "/api/events/suggest?prefix=ro&limit=x",
+    "/api/events/3",
+    "/api/events/999",
+    "/api/event-tickets/1",
+    "/api/categories/",
+    "/api/venues/?limit=1",
+])
+def test_async_routes_match_flask(client, asgi_client, path):
+    expected = client.get(path)
+    response = asgi_client.get(path)
+
+    assert response.status_code == expected.status_code
+    assert response.content == expected.data
+    for header in ("X-Next-Cursor", "ETag", "Cache-Control"):
+        assert response.headers.get(header) == expected.headers.get(header)
+    # same next-page link; only the test clients' host names differ
+    link = (response.headers.get("Link") or "").replace("http://testserver/", "/")
+    assert link == (expected.headers.get("Link") or "").replace("http://localhost/", "/")
+
+
+def test_catalog_reads_do_not_go_through_wsgi(asgi_client, monkeypatch):
+    from backend.routes import events
+    monkeypatch.setattr(events, "_tickets_by_event", None)  # the Flask views would fail
+
+    assert asgi_client.get("/api/events/filter?q=rock").status_code == 200
+    assert asgi_client.get("/api/events/cards?limit=3").status_code == 200
+    assert asgi_client.get("/api/events/suggest?prefix=ro").status_code == 200
+
+
+def test_async_etag_revalidates_to_304(asgi_client):
+    etag = asgi_client.get("/api/events/1").headers["ETag"]
+    assert asgi_client.get("/api/events/1", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_writes_fall_through_to_flask(asgi_client):
+    response = asgi_client.post("/api/auth/login", json={
+        "email": "test@example.com", "password": "test123",
+    })
+    assert response.status_code == 200
+    assert "token" in response.json()
+
+
+def test_async_uri_swaps_the_driver():
+    assert async_uri("mysql+pymysql://u:p@db/tickets") == "mysql+aiomysql://u:p@db/tickets"
+    assert async_uri("sqlite:////tmp/x.db") == "sqlite+aiosqlite:////tmp/x.db"
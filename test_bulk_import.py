@@ -0,0 +1,129 @@
+"""
+Tests for POST /api/admin/events/bulk (services/event_import.py)
+"""
+import json
+
+from flask_jwt_extended import create_access_token
+
+from backend.db import db
+from backend.models import Event, Ticket
+
+
+def _admin(app):
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_csv_import_creates_events_and_tiers_and_reports_bad_rows(app, client):
+    body = "\n".join([
+        "event_name,event_date,category_id,venue_id,total_tickets,tiers",
+        "Jazz Night,2030-03-01T19:30:00,1,2,400,General Admission:45.00:350|VIP:90.00:50",
+        "No Date,,1,2,400,",
+        "Bad Venue,2030-03-02T19:30:00,1,99,400,",
+        "Too Many Seats,2030-03-03T19:30:00,2,1,10,GA:10:11",
+        "Hockey Night,2030-03-04T19:00:00,2,1,900,",
+    ])
+    response = client.post("/api/admin/events/bulk", headers=_admin(app),
+                           data=body, content_type="text/csv")
+
+    assert response.status_code == 200
+    report = response.get_json()
+    assert report["imported"] == 2
+    assert report["tiers"] == 2
+    assert [e["row"] for e in report["errors"]] == [2, 3, 4]
+    assert report["errors"][1]["errors"] == ["venue_id 99 does not exist"]
+
+    with app.app_context():
+        jazz = Event.query.filter_by(event_name="Jazz Night").one()
+        assert jazz.organizer_email == "organizer@example.com"
+        tiers = Ticket.query.filter_by(event_id=jazz.event_id).order_by(Ticket.price).all()
+        assert [(t.ticket_type, float(t.price), t.quantity_available) for t in tiers] == [
+            ("General Admission", 45.0, 350), ("VIP", 90.0, 50),
+        ]
+
+    # imported events are searchable right away
+    assert [r["event_name"] for r in client.get("/api/events/search?q=hockey").get_json()] == [
+        "Hockey Night"
+    ]
+
+
+def test_ndjson_import_in_chunks_and_dry_run(app, client):
+    app.config["BULK_IMPORT_CHUNK_SIZE"] = 7
+    lines = [
+        json.dumps({
+            "event_name": f"Comedy Hour {i}",
+            "event_date": "2030-05-01T20:00:00",
+            "category_id": 1,
+            "venue_id": 1,
+            "total_tickets": 100,
+            "tiers": [{"ticket_type": "General Admission", "price": "20", "quantity": 100}],
+        })
+        for i in range(30)
+    ]
+    lines.insert(10, "{not json")
+    body = "\n".join(lines)
+
+    response = client.post("/api/admin/events/bulk?dry_run=1", headers=_admin(app),
+                           data=body, content_type="application/x-ndjson")
+    assert response.get_json()["imported"] == 30
+    with app.app_context():
+        assert Event.query.filter(Event.event_name.like("Comedy%")).count() == 0
+
+    response = client.post("/api/admin/events/bulk", headers=_admin(app),
+                           data=body, content_type="application/x-ndjson")
+    report = response.get_json()
+    assert (report["imported"], report["tiers"], report["failed"]) == (30, 30, 1)
+    assert report["errors"] == [{"row": 11, "errors": ["not valid JSON"]}]
+
+    with app.app_context():
+        assert Event.query.filter(Event.event_name.like("Comedy%")).count() == 30
+
+
+def test_import_without_returning_inserts_each_chunk_once(app, client, count_queries, monkeypatch):
+    # what MySQL gets: no RETURNING for executemany, ids read back by batch key
+    with app.app_context():
+        dialect = db.engine.dialect
+    monkeypatch.setattr(dialect, "insert_executemany_returning_sort_by_parameter_order", False)
+    app.config["BULK_IMPORT_CHUNK_SIZE"] = 4
+    lines = [
+        json.dumps({
+            "event_name": f"Open Mic {i}",
+            "event_date": "2030-06-01T20:00:00",
+            "category_id": 1,
+            "venue_id": 1,
+            "total_tickets": 10 + i,
+            "tiers": [{"ticket_type": "General Admission", "price": "5", "quantity": 10 + i}],
+        })
+        for i in range(10)
+    ]
+
+    count_queries.clear()
+    response = client.post("/api/admin/events/bulk", headers=_admin(app),
+                           data="\n".join(lines), content_type="application/x-ndjson")
+    assert response.get_json()["imported"] == 10
+    assert sum(s.startswith("INSERT INTO event ") for s in count_queries) == 3
+    assert sum("WHERE event.import_batch = " in s for s in count_queries) == 3
+
+    with app.app_context():
+        # every tier went to the event it was listed with
+        pairs = (
+            db.session.query(Event.total_tickets, Ticket.quantity_available)
+            .join(Ticket, Ticket.event_id == Event.event_id)
+            .filter(Event.event_name.like("Open Mic%"))
+            .all()
+        )
+        assert sorted(pairs) == [(10 + i, 10 + i) for i in range(10)]
+
+
+def test_bulk_import_requires_admin_and_a_known_format(app, client):
+    with app.app_context():
+        token = create_access_token(identity="test@example.com")
+    response = client.post("/api/admin/events/bulk", data="x",
+                           headers={"Authorization": f"Bearer {token}"}, content_type="text/csv")
+    assert response.status_code == 403
+
+    response = client.post("/api/admin/events/bulk", headers=_admin(app),
+                           data="x", content_type="application/pdf")
+    assert response.status_code == 415
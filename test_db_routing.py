@@ -0,0 +1,105 @@
+"""
+Read-replica routing (backend/db.py): two SQLite files stand in for the
+primary and one replica, seeded identically and then made to differ so
+each response shows which database it was read from.
+"""
+import shutil
+
+import pytest
+from sqlalchemy import text
+
+from backend.app import create_app
+from backend.db import STICKY_COOKIE, db
+from backend.models import Ticket
+from conftest import _seed
+
+
+@pytest.fixture
+def app(tmp_path):
+    primary, replica = tmp_path / "primary.db", tmp_path / "replica.db"
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{primary}",
+        "SQLALCHEMY_REPLICA_URIS": [f"sqlite:///{replica}"],
+        "HASHER_WORKERS": 0,
+        "PBKDF2_ROUNDS": 1000,
+    })
+
+    with app.app_context():
+        db.create_all()
+        _seed()
+        db.session.remove()
+        db.engines["replica_0"].dispose()
+        shutil.copy(primary, replica)
+        with db.engines["replica_0"].begin() as conn:
+            conn.execute(text("UPDATE ticket SET ticket_type = 'Replica ' || ticket_type"))
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def _ticket_types(client):
+    response = client.get("/api/tickets/?limit=2&fields=ticket_type")
+    assert response.status_code == 200
+    return [t["ticket_type"] for t in response.get_json()]
+
+
+def test_catalog_reads_come_from_the_replica(client):
+    assert _ticket_types(client) == ["Replica General Admission", "Replica VIP"]
+
+
+def test_writes_go_to_the_primary_and_stick_reads_to_it(app, client):
+    response = client.post("/api/auth/register", json={
+        "first_name": "New", "last_name": "Person",
+        "email": "new@example.com", "password": "secret123",
+    })
+    assert response.status_code in (200, 201)
+    assert STICKY_COOKIE in response.headers.get("Set-Cookie", "")
+
+    with app.app_context():
+        with db.engines["replica_0"].connect() as conn:
+            on_replica = conn.execute(
+                text("SELECT COUNT(*) FROM customer WHERE email = 'new@example.com'")
+            ).scalar()
+    assert on_replica == 0
+
+    # the client just wrote: read its own writes from the primary
+    assert _ticket_types(client) == ["General Admission", "VIP"]
+
+    client.delete_cookie(STICKY_COOKIE)
+    assert _ticket_types(client) == ["Replica General Admission", "Replica VIP"]
+
+
+def test_locking_reads_and_reads_after_a_write_use_the_primary(app):
+    with app.test_request_context("/api/tickets/"):
+        app.preprocess_request()
+        assert db.session.get(Ticket, 1).ticket_type == "Replica General Admission"
+        db.session.expunge_all()
+
+        locked = db.session.query(Ticket).filter_by(ticket_id=1).with_for_update().one()
+        assert locked.ticket_type == "General Admission"
+        db.session.rollback()
+
+        db.session.get(Ticket, 2).quantity_available -= 1
+        db.session.flush()
+        assert db.session.query(Ticket.ticket_type).filter_by(ticket_id=1).scalar() == "General Admission"
+        db.session.rollback()
+
+
+def test_replicas_are_left_out_of_later_apps_create_all(app, tmp_path):
+    # bind metadata is process-wide: an app with replicas must not leave its
+    # replica bind keys behind for the next app's create_all() to trip over
+    other = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'other.db'}",
+    })
+    with other.app_context():
+        db.create_all()
+        assert set(db.metadatas) == {None}
+        assert db.session.query(Ticket).count() == 0
+        db.drop_all()
+        db.session.remove()
@@ -0,0 +1,330 @@
+"""
+Tests for the public event browse endpoints (run against SQLite, see conftest.py)
+"""
+import threading
+from datetime import datetime
+
+from flask_jwt_extended import create_access_token
+
+from backend.db import db
+from backend.models import Category, Venue
+from backend.services import search_index, suggest
+from backend.signals import category_changed, venue_changed
+
+
+def test_filter_returns_venue_category_and_tickets(client):
+    response = client.get("/api/events/filter")
+    assert response.status_code == 200
+
+    events = response.get_json()
+    assert len(events) == 20
+
+    first = next(e for e in events if e["event_id"] == 1)
+    assert first["venue"] == {"venue_name": "Grand Arena", "city": "Toronto"}
+    assert first["category"] == {"category_name": "Concert"}
+    assert [t["ticket_type"] for t in first["tickets"]] == ["General Admission", "VIP"]
+    assert first["tickets"][1]["price"] == 150.0
+
+
+def test_filter_by_location_and_text(client):
+    events = client.get("/api/events/filter?location=Oshawa").get_json()
+    assert events and all(e["venue"]["city"] == "Oshawa" for e in events)
+
+    events = client.get("/api/events/filter?q=Basketball").get_json()
+    assert len(events) == 10
+    assert all("Basketball" in e["event_name"] for e in events)
+
+
+def test_filter_statement_count_does_not_grow_with_events(client, count_queries):
+    client.get("/api/events/filter")
+    count_queries.clear()  # first call also fills the venue/category cache
+
+    client.get("/api/events/filter")
+
+    # one query for the events + one batched query for tickets
+    assert len(count_queries) == 2
+
+
+def test_cards_by_ids_are_fully_hydrated(client, count_queries):
+    client.get("/api/categories/")
+    client.get("/api/venues/")
+    count_queries.clear()
+
+    cards = client.get("/api/events/cards?ids=3,1").get_json()
+
+    assert [c["event_id"] for c in cards] == [3, 1]
+    card = cards[1]
+    assert card["venue"]["venue_name"] == "Grand Arena"
+    assert card["category"]["category_name"] == "Concert"
+    assert len(card["tickets"]) == 2
+    assert card["min_price"] == 75.0
+    assert card["remaining_seats"] == 1000
+    assert len(count_queries) == 2
+
+
+def test_cards_filter_is_capped(app, client):
+    app.config["EVENT_CARDS_MAX"] = 5
+
+    cards = client.get("/api/events/cards?category=Sports&limit=50").get_json()
+    assert len(cards) == 5
+    assert all(c["category"]["category_name"] == "Sports" for c in cards)
+
+    response = client.get("/api/events/cards?ids=1,2,3,4,5,6")
+    assert response.status_code == 400
+
+
+def test_cards_filter_is_paged_by_cursor(app, client):
+    app.config["EVENT_CARDS_MAX"] = 3
+
+    seen = []
+    url = "/api/events/cards?category=Sports"
+    while url:
+        response = client.get(url)
+        seen.extend(c["event_id"] for c in response.get_json())
+        cursor = response.headers.get("X-Next-Cursor")
+        url = f"/api/events/cards?category=Sports&cursor={cursor}" if cursor else None
+
+    assert seen == [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
+    assert client.get("/api/events/cards?cursor=nope").status_code == 400
+
+
+def test_events_list_is_paged_by_cursor(client):
+    seen = []
+    url = "/api/events/?limit=7"
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.get_json()
+        assert len(page) <= 7
+        seen.extend(e["event_id"] for e in page)
+
+        cursor = response.headers.get("X-Next-Cursor")
+        url = f"/api/events/?limit=7&cursor={cursor}" if cursor else None
+
+    assert sorted(seen) == list(range(1, 21))
+    assert len(seen) == len(set(seen))
+
+
+def test_events_list_projection_selects_only_requested_columns(client, count_queries):
+    events = client.get("/api/events/?fields=event_id,event_name").get_json()
+
+    assert set(events[0]) == {"event_id", "event_name"}
+    assert "description" not in count_queries[0]
+
+
+def test_events_list_rejects_bad_cursor_and_fields(client):
+    assert client.get("/api/events/?cursor=not-a-cursor").status_code == 400
+    assert client.get("/api/customers/?fields=password_hash").status_code == 400
+
+
+def test_search_uses_index_and_follows_admin_writes(app, client):
+    results = client.get("/api/events/search?q=basket").get_json()
+    assert len(results) == 10
+
+    # venue city and category name are indexed too
+    results = client.get("/api/events/search?q=oshawa+sports").get_json()
+    assert sorted(r["event_id"] for r in results) == [4, 8, 12, 16, 20]
+
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.post("/api/admin/events", headers=headers, json={
+        "event_name": "Jazz Evening",
+        "event_date": "2030-03-01T19:30:00",
+        "category_id": 1,
+        "venue_id": 2,
+        "total_tickets": 400,
+    })
+    assert response.status_code == 201
+
+    results = client.get("/api/events/search?q=jazz").get_json()
+    assert [r["event_name"] for r in results] == ["Jazz Evening"]
+
+    client.delete(f"/api/admin/events/{results[0]['event_id']}", headers=headers)
+    assert client.get("/api/events/search?q=jazz").get_json() == []
+
+
+def test_search_follows_edits_made_by_other_workers(app, client, other_worker):
+    app.config["CATALOG_POLL_SECONDS"] = 0
+    assert client.get("/api/events/search?q=zebra").get_json() == []
+
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    headers = {"Authorization": f"Bearer {token}"}
+    other = other_worker.test_client()
+    response = other.put("/api/admin/events/1", headers=headers, json={
+        "event_name": "Zebra Jam",
+        "event_date": "2030-01-01T00:00:00",
+        "category_id": 1,
+        "venue_id": 1,
+        "total_tickets": 1000,
+    })
+    assert response.status_code == 200
+    assert other.delete("/api/admin/events/3", headers=headers).status_code == 200
+
+    results = client.get("/api/events/search?q=zebra").get_json()
+    assert [r["event_id"] for r in results] == [1]
+    results = client.get("/api/events/search?q=rock").get_json()
+    assert 3 not in {r["event_id"] for r in results}
+
+
+def test_search_follows_venue_changes(app, client):
+    assert client.get("/api/events/search?q=whitby").get_json() == []
+    with app.app_context():
+        db.session.get(Venue, 2).city = "Whitby"
+        db.session.commit()
+        venue_changed.send(app, venue_id=2)
+
+    results = client.get("/api/events/search?q=whitby").get_json()
+    assert sorted(r["event_id"] for r in results) == [4, 8, 12, 16, 20]
+
+
+def test_search_filters_apply_before_the_result_cap(app, client, monkeypatch):
+    # "live" matches all 20 events; the cap keeps the 3 best of those that pass the filters
+    monkeypatch.setattr(search_index, "MAX_RESULTS", 3)
+
+    events = client.get("/api/events/filter?q=live&location=Oshawa").get_json()
+    assert [e["event_id"] for e in events] == [4, 8, 12]
+
+    cards = client.get("/api/events/cards?q=live&category=Concert").get_json()
+    assert sorted(c["event_id"] for c in cards) == [1, 3, 5]
+
+    with app.app_context():
+        index = search_index.get_search_index()
+        assert index.search("live", dates=(datetime(2030, 2, 1), None)) == [2, 4, 6]
+        assert index.search("live", dates=(None, datetime(2030, 1, 31))) == [1, 3, 5]
+
+
+def test_suggest_matches_word_starts_of_events_venues_and_cities(client):
+    suggestions = client.get("/api/events/suggest?prefix=toR").get_json()
+    assert {"text": "Toronto", "type": "city", "id": None} in suggestions
+
+    suggestions = client.get("/api/events/suggest?prefix=legends+live+1&limit=3").get_json()
+    assert len(suggestions) == 3
+    assert all(s["type"] == "event" and "Legends Live 1" in s["text"] for s in suggestions)
+
+    suggestions = client.get("/api/events/suggest?prefix=commun").get_json()
+    assert suggestions == [{"text": "Community Center", "type": "venue", "id": 2}]
+
+
+def test_suggest_requests_during_the_first_build_wait_for_it(app, monkeypatch):
+    building, release = threading.Event(), threading.Event()
+    load = suggest._load_suggestions
+
+    def slow_load():
+        building.set()
+        release.wait(5)
+        yield from load()
+
+    monkeypatch.setattr(suggest, "_load_suggestions", slow_load)
+    responses = {}
+
+    def get(name):
+        responses[name] = app.test_client().get("/api/events/suggest?prefix=toR")
+
+    first = threading.Thread(target=get, args=("first",))
+    first.start()
+    assert building.wait(5)
+    # arrives while the first request is still building the index
+    second = threading.Thread(target=get, args=("second",))
+    second.start()
+    second.join(0.2)
+    assert second.is_alive()
+
+    release.set()
+    first.join(5)
+    second.join(5)
+    for response in responses.values():
+        assert response.status_code == 200
+        assert {"text": "Toronto", "type": "city", "id": None} in response.get_json()
+
+
+def test_suggest_rebuilds_in_the_background_after_edits_elsewhere(app, client, other_worker,
+                                                                 monkeypatch):
+    app.config["CATALOG_POLL_SECONDS"] = 0
+    assert client.get("/api/events/suggest?prefix=zebra").get_json() == []
+
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    response = other_worker.test_client().put(
+        "/api/admin/events/1", headers={"Authorization": f"Bearer {token}"}, json={
+            "event_name": "Zebra Jam",
+            "event_date": "2030-01-01T00:00:00",
+            "category_id": 1,
+            "venue_id": 1,
+            "total_tickets": 1000,
+        })
+    assert response.status_code == 200
+
+    release = threading.Event()
+    load = suggest._load_suggestions
+
+    def slow_load():
+        release.wait(5)
+        yield from load()
+
+    monkeypatch.setattr(suggest, "_load_suggestions", slow_load)
+    # the request that notices the edit answers from the old snapshot
+    assert client.get("/api/events/suggest?prefix=zebra").get_json() == []
+
+    release.set()
+    app.extensions["event_suggest"].rebuild.join(5)
+    assert client.get("/api/events/suggest?prefix=zebra").get_json() == [
+        {"text": "Zebra Jam", "type": "event", "id": 1},
+    ]
+
+
+def test_reference_data_is_cached_until_invalidated(app, client, count_queries):
+    assert len(client.get("/api/categories/").get_json()) == 2
+    assert client.get("/api/venues/?fields=venue_id,city&limit=1").get_json() == [
+        {"venue_id": 1, "city": "Toronto"}
+    ]
+    count_queries.clear()
+
+    client.get("/api/categories/")
+    client.get("/api/venues/")
+    client.get("/api/events/1")
+    assert len(count_queries) == 1  # just the event row
+
+    with app.app_context():
+        db.session.add(Category(category_id=3, category_name="Theater"))
+        db.session.commit()
+        category_changed.send(app)
+
+    assert len(client.get("/api/categories/").get_json()) == 3
+
+
+def test_conditional_get_answers_304_without_touching_the_database(app, client, count_queries):
+    response = client.get("/api/events/3")
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "public, max-age=30"
+
+    count_queries.clear()
+    response = client.get("/api/events/3", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert count_queries == []
+
+    # a different page of the list is a different representation
+    first = client.get("/api/events/?limit=5").headers["ETag"]
+    assert client.get("/api/events/?limit=6").headers["ETag"] != first
+
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    response = client.put("/api/admin/events/3", headers={"Authorization": f"Bearer {token}"},
+                          json={"event_name": "Renamed", "event_date": "2030-01-01T19:00:00",
+                                "category_id": 1, "venue_id": 1, "total_tickets": 1000})
+    assert response.status_code == 200
+
+    response = client.get("/api/events/3", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["event_name"] == "Renamed"
+    assert client.get("/api/events/?limit=5", headers={"If-None-Match": first}).status_code == 200
+    # other events keep their ETag
+    assert client.get("/api/events/5").headers["ETag"] != response.headers["ETag"]
@@ -0,0 +1,135 @@
+"""
+Tests for the purchase export (flask export-purchases, /api/admin/exports/purchases)
+"""
+import csv
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from backend.db import db
+from backend.models import Purchase
+from backend.services import purchase_export
+from backend.services.purchase_export import HEADER
+
+
+@pytest.fixture(autouse=True)
+def no_commit_lag(app):
+    # the tests' purchases are committed before anything exports them
+    app.config["EXPORT_COMMIT_LAG_SECONDS"] = 0
+
+
+def _buy(app, client, *tickets):
+    with app.app_context():
+        token = create_access_token(identity="test@example.com")
+    response = client.post("/api/purchases/", headers={"Authorization": f"Bearer {token}"},
+                           json={"tickets": [{"ticket_id": t, "quantity": 1} for t in tickets]})
+    assert response.status_code == 201
+
+
+def test_export_command_is_incremental(app, client, tmp_path):
+    output = str(tmp_path / "purchases.csv")
+    runner = app.test_cli_runner()
+    _buy(app, client, 1, 2)
+
+    result = runner.invoke(args=["export-purchases", output])
+    assert "exported 2 rows" in result.output
+
+    _buy(app, client, 3)
+    result = runner.invoke(args=["export-purchases", output])
+    assert "exported 1 rows (purchases 2..2)" in result.output
+    result = runner.invoke(args=["export-purchases", output])
+    assert "exported 0 rows" in result.output
+
+    with open(output, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == HEADER
+    assert [(r[0], r[3], r[4], r[6], r[7]) for r in rows[1:]] == [
+        ("1", "Rock Legends Live 1", "General Admission", "75.0", "225.0"),
+        ("1", "Rock Legends Live 1", "VIP", "150.0", "225.0"),
+        ("2", "Basketball Night 2", "General Admission", "75.0", "75.0"),
+    ]
+
+
+def test_export_command_gzip_appends_members(app, client, tmp_path):
+    output = str(tmp_path / "purchases.csv.gz")
+    runner = app.test_cli_runner()
+    _buy(app, client, 1)
+    runner.invoke(args=["export-purchases", output, "--gzip"])
+    _buy(app, client, 2)
+    runner.invoke(args=["export-purchases", output, "--gzip"])
+
+    with gzip.open(output, "rt", newline="") as f:
+        rows = list(csv.reader(f))
+    assert [r[0] for r in rows] == ["Purchase ID", "1", "2"]
+
+
+def test_export_endpoint_streams_after_a_purchase_id(app, client):
+    _buy(app, client, 1)
+    _buy(app, client, 2)
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/api/admin/exports/purchases?after=1", headers=headers)
+    assert response.mimetype == "text/csv"
+    rows = list(csv.reader(response.get_data(as_text=True).splitlines()))
+    assert [r[0] for r in rows] == ["Purchase ID", "2"]
+
+    response = client.get("/api/admin/exports/purchases?gzip=1", headers=headers)
+    rows = gzip.decompress(response.data).decode().splitlines()
+    assert len(rows) == 3
+
+
+def test_export_waits_out_the_commit_lag(app, client, tmp_path):
+    output = str(tmp_path / "purchases.csv")
+    app.config["EXPORT_COMMIT_LAG_SECONDS"] = 60
+    runner = app.test_cli_runner()
+    _buy(app, client, 1)
+    _buy(app, client, 2)
+    with app.app_context():
+        # purchase 2 is a minute old; purchase 1 only now commits, late
+        db.session.get(Purchase, 2).purchase_date = datetime.now() - timedelta(minutes=1)
+        db.session.commit()
+
+    # everything below purchase 2 has had time to commit: 1 isn't skipped
+    result = runner.invoke(args=["export-purchases", output])
+    assert "exported 2 rows (purchases 1..2)" in result.output
+
+    _buy(app, client, 3)   # too recent: left for the next run
+    result = runner.invoke(args=["export-purchases", output])
+    assert "exported 0 rows" in result.output
+    with app.app_context():
+        db.session.get(Purchase, 3).purchase_date = datetime.now() - timedelta(minutes=1)
+        db.session.commit()
+    result = runner.invoke(args=["export-purchases", output])
+    assert "exported 1 rows (purchases 3..3)" in result.output
+
+
+def test_export_that_dies_before_its_watermark_is_redone_once(app, client, tmp_path, monkeypatch):
+    output = str(tmp_path / "purchases.csv")
+    runner = app.test_cli_runner()
+    _buy(app, client, 1)
+    runner.invoke(args=["export-purchases", output])
+
+    # the rows are appended, then the process dies before the watermark moves
+    _buy(app, client, 2)
+    write_watermark = purchase_export._write_watermark
+
+    def crash(*args):
+        raise SystemExit("killed")
+
+    monkeypatch.setattr(purchase_export, "_write_watermark", crash)
+    assert runner.invoke(args=["export-purchases", output]).exit_code != 0
+    with open(output) as f:
+        assert len(f.readlines()) == 3
+    with open(output + ".watermark") as f:
+        assert json.load(f)["purchase_id"] == 1
+
+    monkeypatch.setattr(purchase_export, "_write_watermark", write_watermark)
+    result = runner.invoke(args=["export-purchases", output])
+    assert "exported 1 rows (purchases 2..2)" in result.output
+    with open(output, newline="") as f:
+        assert [r[0] for r in csv.reader(f)] == ["Purchase ID", "1", "2"]
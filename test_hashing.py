@@ -0,0 +1,75 @@
+"""
+Tests for the password hashing service (services/hashing.py) and login
+"""
+from passlib.hash import pbkdf2_sha256
+
+from backend.db import db
+from backend.models import Customer
+from backend.services.hashing import PasswordHasher
+
+
+def test_login_rehashes_when_rounds_change(app, client):
+    with app.app_context():
+        customer = db.session.get(Customer, 2)
+        customer.password_hash = pbkdf2_sha256.using(rounds=500).hash("test123")
+        db.session.commit()
+
+    response = client.post("/api/auth/login",
+                           json={"email": "test@example.com", "password": "test123"})
+    assert response.status_code == 200
+
+    with app.app_context():
+        stored = db.session.get(Customer, 2).password_hash
+    assert pbkdf2_sha256.from_string(stored).rounds == 1000
+    assert pbkdf2_sha256.verify("test123", stored)
+
+
+def test_pool_hashes_and_verifies_in_worker_processes():
+    hasher = PasswordHasher(rounds=1000, workers=1)
+    try:
+        stored = hasher.hash("secret")
+        assert hasher.verify("secret", stored)
+        assert not hasher.verify("wrong", stored)
+        assert not hasher.needs_rehash(stored)
+        assert hasher.stats()["completed"] == 3
+        assert hasher.stats()["pending"] == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_hasher_answers_503_instead_of_queueing(app, client):
+    hasher = app.extensions["password_hasher"] = PasswordHasher(
+        rounds=1000, workers=0, max_pending=1, timeout=0.05
+    )
+    hasher._slots.acquire()  # someone else holds the only slot
+    try:
+        response = client.post("/api/auth/login",
+                               json={"email": "test@example.com", "password": "test123"})
+    finally:
+        hasher._slots.release()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_login_is_a_single_read_and_organizers_count_as_admins(app, client, count_queries):
+    with app.app_context():
+        customer = db.session.get(Customer, 1)
+        customer.role = "user"  # but still organizes the seeded events
+        db.session.commit()
+    count_queries.clear()
+
+    response = client.post("/api/auth/login",
+                           json={"email": "organizer@example.com", "password": "admin123"})
+    assert response.status_code == 200
+    assert response.get_json()["role"] == "admin"
+    assert len(count_queries) == 1
+    assert "EXISTS" in count_queries[0]
+
+    with app.app_context():
+        assert db.session.get(Customer, 1).role == "user"  # nothing written
+
+    response = client.post("/api/auth/login",
+                           json={"email": "test@example.com", "password": "test123"})
+    assert response.get_json()["role"] == "user"
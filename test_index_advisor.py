@@ -0,0 +1,78 @@
+"""
+Tests for the index pack (models + Database/migrations) and the index
+advisor (services/index_advisor.py)
+"""
+import json
+import re
+from pathlib import Path
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import inspect, text
+
+from backend.db import db
+from backend.services.index_advisor import advise
+
+MIGRATIONS = Path(__file__).parent / "Database" / "migrations"
+
+
+def _admin(app):
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_models_declare_the_migration_indexes(app):
+    added = {
+        name
+        for migration in MIGRATIONS.glob("*.sql")
+        if not migration.name.endswith(".down.sql")
+        for name in re.findall(r"ADD INDEX (\w+)", migration.read_text())
+    }
+    assert "idx_event_import_batch" in added
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+        declared = {
+            index["name"]
+            for table in inspector.get_table_names()
+            for index in inspector.get_indexes(table)
+        }
+    assert added <= declared
+    assert "idx_event_organizer_email" not in declared  # replaced by idx_event_organizer_date
+
+
+def test_live_shapes_use_the_indexes(app, client):
+    client.get("/api/events/filter?location=Toronto&date=year")
+
+    report = client.get("/api/admin/metrics/index-advice", headers=_admin(app)).get_json()
+
+    events = next(e for e in report if e["shape"].startswith("SELECT event.event_id"))
+    assert events["route"] == "GET /api/events/filter"
+    assert events["full_scans"] == []
+    assert any("idx_event_venue_date" in line for line in events["plan"])
+    # parameters stay in the process
+    assert "Toronto" not in json.dumps(report)
+
+
+def test_advisor_suggests_a_missing_index(app, client):
+    with app.app_context():
+        db.session.execute(text("DROP INDEX idx_event_venue_date"))
+        db.session.commit()
+    client.get("/api/events/filter?location=Toronto")
+
+    with app.app_context():
+        report = advise()
+
+    assert report[0]["full_scans"] == ["event"]
+    assert report[0]["suggestions"] == ["CREATE INDEX idx_event_venue_id ON event (venue_id)"]
+
+
+def test_index_advisor_command_replays_the_hot_reads(app):
+    result = app.test_cli_runner().invoke(args=["index-advisor", "--json"])
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    routes = {entry["route"] for entry in report}
+    assert {"GET /api/events/", "GET /api/admin/events", "GET /api/admin/stats"} <= routes
+    assert not any(s.startswith("CREATE INDEX") for e in report for s in e["suggestions"])
@@ -0,0 +1,153 @@
+"""
+Tests for the JSON provider (utils/json_provider.py) and the precompiled
+row encoders (utils/row_encoders.py)
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import select
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Purchase
+from backend.routes.categories import CATEGORY_FIELDS
+from backend.routes.customers import CUSTOMER_FIELDS
+from backend.routes.events import EVENT_FIELDS
+from backend.routes.purchases import PURCHASE_FIELDS
+from backend.routes.tickets import TICKET_FIELDS
+from backend.routes.venues import VENUE_FIELDS
+from backend.utils import json_provider, row_encoders
+from backend.utils.cache import TTLCache
+from backend.utils.row_encoders import RowEncoder, row_encoder, rows_json
+
+needs_orjson = pytest.mark.skipif(json_provider.orjson is None, reason="orjson not installed")
+
+SCHEMAS = [EVENT_FIELDS, TICKET_FIELDS, VENUE_FIELDS, CATEGORY_FIELDS, PURCHASE_FIELDS, CUSTOMER_FIELDS]
+
+
+def _as_dicts(rows, fields, names):
+    # what the list endpoints built for jsonify() before the row encoders
+    return [
+        {
+            name: fields[name][1](value) if fields[name][1] and value is not None else value
+            for name, value in zip(names, row)
+        }
+        for row in rows
+    ]
+
+
+def _add_purchase(app):
+    with app.app_context():
+        db.session.add(Purchase(
+            purchase_id=1, customer_id=2, purchase_date=datetime(2030, 1, 2, 3, 4, 5),
+            total_amount=Decimal("225.50"), payment_method="PayPal", payment_status="Completed",
+        ))
+        db.session.commit()
+
+
+@pytest.mark.parametrize("provider", ["stdlib", pytest.param("orjson", marks=needs_orjson)])
+def test_row_encoders_decode_like_jsonify_for_every_schema(app, provider):
+    _add_purchase(app)
+    with app.app_context():
+        # quotes, backslashes, control and non-ASCII characters, NULLs
+        db.session.execute(db.text(
+            "UPDATE event SET event_name = 'Café \"Live\" \\ night\n', description = NULL "
+            "WHERE event_id = 1"
+        ))
+        db.session.commit()
+
+        if provider == "stdlib":
+            app.json = DefaultJSONProvider(app)
+        for fields in SCHEMAS:
+            names = list(fields)
+            rows = db.session.execute(select(*[fields[n][0] for n in names])).all()
+            assert rows
+            expected = json.loads(app.json.dumps(_as_dicts(rows, fields, names)))
+            assert json.loads(rows_json(fields, names, rows)) == expected
+
+            lines = row_encoder(fields, names).lines(rows).splitlines()
+            assert [json.loads(line) for line in lines] == expected
+
+
+def test_stdlib_pages_keep_the_jsonify_format(app, client):
+    _add_purchase(app)
+    app.json = DefaultJSONProvider(app)
+
+    body = client.get("/api/purchases/").get_data(as_text=True)
+
+    assert body == (
+        '[{"customer_id":2,"payment_method":"PayPal","payment_status":"Completed",'
+        '"purchase_date":"Wed, 02 Jan 2030 03:04:05 GMT","purchase_id":1,'
+        '"total_amount":225.50}]\n'
+    )
+
+
+def test_projection_and_cursor_paging_use_the_encoders(client):
+    response = client.get("/api/events/?limit=3&fields=event_name,event_id")
+
+    assert response.mimetype == "application/json"
+    assert [sorted(e) for e in response.get_json()] == [["event_id", "event_name"]] * 3
+    following = client.get(f"/api/events/?limit=3&cursor={response.headers['X-Next-Cursor']}")
+    assert len(following.get_json()) == 3
+
+    assert client.get("/api/categories/").get_json() == [
+        {"category_id": 1, "category_name": "Concert", "description": "Live music"},
+        {"category_id": 2, "category_name": "Sports", "description": "Sporting events"},
+    ]
+
+
+def test_repeated_fields_are_sent_once(client):
+    response = client.get("/api/tickets/?limit=1&fields=ticket_id,price,ticket_id")
+
+    assert response.get_data(as_text=True).count('"ticket_id"') == 1
+    assert response.get_json() == [{"price": 75.0, "ticket_id": 1}]
+    with pytest.raises(ValueError):
+        RowEncoder(TICKET_FIELDS, ["ticket_id", "ticket_id"], dumps=json.dumps)
+
+
+def test_encoder_cache_is_bounded(client, monkeypatch):
+    monkeypatch.setattr(row_encoders, "_compiled", TTLCache(maxsize=4, ttl=float("inf")))
+    names = list(EVENT_FIELDS)
+    for n in range(len(names)):
+        for m in range(n + 1, len(names)):
+            fields = f"{names[n]},{names[m]}"
+            assert client.get(f"/api/events/?limit=1&fields={fields}").status_code == 200
+
+    assert len(row_encoders._compiled) == 4
+
+
+@needs_orjson
+def test_orjson_provider_keeps_flask_semantics(app):
+    provider = json_provider.OrjsonProvider(app)
+    stdlib = DefaultJSONProvider(app)
+    value = {
+        "b": Decimal("1.50"),
+        "a": [datetime(2030, 1, 1, 19, 0), date(2030, 1, 2)],
+        "c": "é",
+    }
+
+    assert json.loads(provider.dumps(value)) == json.loads(stdlib.dumps(value))
+    assert provider.dumps(value) == (
+        '{"a":["Tue, 01 Jan 2030 19:00:00 GMT","Wed, 02 Jan 2030 00:00:00 GMT"],'
+        '"b":"1.50","c":"é"}'
+    )
+    assert provider.dumps({2: "x", 1: "y"}) == '{"1":"y","2":"x"}'
+    # past orjson's 64 bits: the stdlib takes over
+    assert provider.dumps({"n": 2 ** 70}) == '{"n":1180591620717411303424}'
+    assert provider.loads(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+
+    with app.test_request_context():
+        response = provider.response({"b": 1, "a": Decimal("2")})
+    assert response.get_data() == b'{"a":"2","b":1}\n'
+    assert response.mimetype == "application/json"
+
+
+def test_json_provider_setting(tmp_path):
+    config = {"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}"}
+
+    assert type(create_app({**config, "JSON_PROVIDER": "stdlib"}).json) is DefaultJSONProvider
+    with pytest.raises(ValueError):
+        create_app({**config, "JSON_PROVIDER": "ujson"})
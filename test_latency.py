@@ -0,0 +1,71 @@
+"""
+Tests for the per-route latency histograms (utils/latency.py)
+"""
+from flask_jwt_extended import create_access_token
+
+from backend.utils.latency import LatencyHistogram
+
+
+def _admin(app):
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_histogram_percentiles_are_bucket_bounds_within_19_percent():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.observe(ms)
+
+    for pct, exact in ((50, 500), (90, 900), (99, 990)):
+        assert exact <= histogram.percentile(pct) < exact * 1.19
+
+
+def test_histograms_merge_by_adding_counts():
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for ms in (0.3, 2, 40):
+        a.observe(ms)
+        both.observe(ms)
+    for ms in (7, 7, 900):
+        b.observe(ms)
+        both.observe(ms)
+
+    merged = LatencyHistogram().merge(a).merge(b)
+    assert merged.buckets == both.buckets
+    assert merged.count == 6
+    assert merged.percentile(99) == both.percentile(99)
+
+
+def test_latency_summary_per_blueprint_and_route(app, client):
+    for _ in range(3):
+        client.get("/api/events/1")
+    client.get("/api/categories/")
+
+    summary = client.get("/api/admin/metrics/latency", headers=_admin(app)).get_json()
+
+    assert summary["routes"]["GET /api/events/<int:event_id>"]["requests"] == 3
+    assert summary["routes"]["GET /api/events/<int:event_id>"]["blueprint"] == "event_details"
+    assert summary["blueprints"]["categories"]["requests"] == 1
+    # registered but never hit: listed with no samples
+    assert summary["routes"]["POST /api/purchases/"]["requests"] == 0
+
+
+def test_prometheus_export(app, client):
+    client.get("/api/events/1")
+
+    response = client.get("/api/admin/metrics/prometheus", headers=_admin(app))
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+
+    text = response.get_data(as_text=True)
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    labels = 'blueprint="event_details",method="GET",route="/api/events/<int:event_id>"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"http_request_duration_seconds_count{{{labels}}} 1" in text
+    # cumulative buckets never decrease
+    counts = [int(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+              if line.startswith(f"http_request_duration_seconds_bucket{{{labels}")]
+    assert counts == sorted(counts)
+
+    assert client.get("/api/admin/metrics/prometheus").status_code == 401
@@ -0,0 +1,318 @@
+"""
+Tests for POST /api/purchases/ (the ticket buying write path)
+"""
+import threading
+from datetime import datetime, timedelta
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import func
+
+from backend.db import db
+from backend.models import Customer, Event, PurchaseTicket, SeatHold, Ticket
+from backend.services.purchasing import MAX_QUANTITY_PER_TIER
+from backend.signals import customer_changed
+
+
+def _auth(app, email="test@example.com"):
+    with app.app_context():
+        token = create_access_token(identity=email, additional_claims={"role": "user"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_purchase_creates_lines_and_takes_inventory(app, client):
+    response = client.post(
+        "/api/purchases/",
+        headers=_auth(app),
+        json={"payment_method": "PayPal", "tickets": [
+            {"ticket_id": 1, "quantity": 2},
+            {"ticket_id": 2, "quantity": 1},
+        ]},
+    )
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body["total_amount"] == 300.0
+    assert len(body["tickets"]) == 2
+
+    with app.app_context():
+        assert db.session.get(Ticket, 1).quantity_available == 798
+        assert db.session.get(Ticket, 2).quantity_available == 199
+        assert db.session.get(Event, 1).tickets_sold == 3
+
+
+def test_purchase_rejects_more_than_available(app, client):
+    response = client.post(
+        "/api/purchases/",
+        headers=_auth(app),
+        json={"tickets": [{"ticket_id": 1, "quantity": 1}, {"ticket_id": 2, "quantity": 51}]},
+    )
+    assert response.status_code == 400
+
+    with app.app_context():
+        db.session.get(Ticket, 2).quantity_available = 1
+        db.session.commit()
+
+    response = client.post(
+        "/api/purchases/",
+        headers=_auth(app),
+        json={"tickets": [{"ticket_id": 1, "quantity": 1}, {"ticket_id": 2, "quantity": 2}]},
+    )
+    assert response.status_code == 409
+
+    # all or nothing: the first tier was not touched either
+    with app.app_context():
+        assert db.session.get(Ticket, 1).quantity_available == 800
+        assert db.session.get(Event, 1).tickets_sold == 0
+
+
+def test_unknown_tiers_are_not_found(app, client):
+    response = client.post("/api/purchases/", headers=_auth(app),
+                           json={"tickets": [{"ticket_id": 1, "quantity": 1},
+                                             {"ticket_id": 9999, "quantity": 1}]})
+    assert response.status_code == 404
+    assert response.get_json() == {"error": "Ticket 9999 not found"}
+    with app.app_context():
+        assert db.session.get(Ticket, 1).quantity_available == 800
+
+
+def test_event_rows_are_written_last(app, client, count_queries):
+    client.post("/api/purchases/", headers=_auth(app),
+                json={"tickets": [{"ticket_id": 1, "quantity": 1}, {"ticket_id": 2, "quantity": 1}]})
+
+    writes = [" ".join(s.replace('"', "").split()[:3]) for s in count_queries
+              if s.startswith(("INSERT", "UPDATE"))]
+    # rows every tier of the event shares go last, the counter right before commit
+    assert writes[-3:] == [
+        "INSERT INTO EVENT_SALES", "INSERT INTO EVENT_SALES_HOURLY", "UPDATE event SET",
+    ]
+
+
+def test_concurrent_buyers_never_oversell(app):
+    stock = 40
+    with app.app_context():
+        db.session.get(Ticket, 2).quantity_available = stock
+        db.session.commit()
+
+    headers = _auth(app)
+    statuses = []
+    lock = threading.Lock()
+
+    def buyer():
+        client = app.test_client()
+        for _ in range(5):
+            response = client.post(
+                "/api/purchases/",
+                headers=headers,
+                json={"tickets": [{"ticket_id": 2, "quantity": 2}, {"ticket_id": 1, "quantity": 1}]},
+            )
+            with lock:
+                statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=buyer) for _ in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert set(statuses) <= {201, 409}
+    sold = statuses.count(201)
+    assert sold == stock // 2
+
+    with app.app_context():
+        assert db.session.get(Ticket, 2).quantity_available == 0
+        sold_lines = (
+            db.session.query(func.sum(PurchaseTicket.quantity))
+            .filter(PurchaseTicket.ticket_id == 2)
+            .scalar()
+        )
+        assert sold_lines == stock
+        assert db.session.get(Event, 1).tickets_sold == sold * 3
+
+
+def test_holds_block_other_buyers_until_checkout(app, client):
+    with app.app_context():
+        db.session.get(Ticket, 2).quantity_available = 3
+        db.session.commit()
+
+    holder = _auth(app, "organizer@example.com")
+    response = client.post("/api/holds/", headers=holder, json={"ticket_id": 2, "quantity": 2})
+    assert response.status_code == 201
+
+    # only one seat is left for everybody else
+    tiers = client.get("/api/event-tickets/1").get_json()
+    assert next(t for t in tiers if t["ticket_id"] == 2)["quantity_available"] == 1
+    response = client.post("/api/purchases/", headers=_auth(app),
+                           json={"tickets": [{"ticket_id": 2, "quantity": 2}]})
+    assert response.status_code == 409
+
+    response = client.post("/api/holds/checkout", headers=holder, json={})
+    assert response.status_code == 201
+    assert client.get("/api/holds/", headers=holder).get_json() == []
+
+    with app.app_context():
+        assert db.session.get(Ticket, 2).quantity_available == 1
+
+
+def test_holds_are_limited_to_what_checkout_accepts(app, client):
+    holder = _auth(app, "organizer@example.com")
+
+    response = client.post("/api/holds/", headers=holder,
+                           json={"ticket_id": 1, "quantity": MAX_QUANTITY_PER_TIER + 1})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": f"At most {MAX_QUANTITY_PER_TIER} tickets per tier"}
+
+    response = client.post("/api/holds/", headers=holder,
+                           json={"ticket_id": 1, "quantity": MAX_QUANTITY_PER_TIER})
+    assert response.status_code == 201
+    assert client.post("/api/holds/checkout", headers=holder, json={}).status_code == 201
+
+
+def test_customers_hold_a_limited_number_of_tiers(app, client):
+    app.extensions["seat_holds"].max_per_customer = 3
+    holder = _auth(app, "organizer@example.com")
+
+    for ticket_id in (1, 2, 3):
+        response = client.post("/api/holds/", headers=holder, json={"ticket_id": ticket_id})
+        assert response.status_code == 201
+    response = client.post("/api/holds/", headers=holder, json={"ticket_id": 4})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "At most 3 active holds at a time"}
+
+    # renewing a hold is fine, and releasing one frees a slot
+    response = client.post("/api/holds/", headers=holder, json={"ticket_id": 2, "quantity": 2})
+    assert response.status_code == 201
+    assert client.delete("/api/holds/1", headers=holder).status_code == 200
+    assert client.post("/api/holds/", headers=holder, json={"ticket_id": 4}).status_code == 201
+    # the limit is per customer
+    response = client.post("/api/holds/", headers=_auth(app), json={"ticket_id": 5})
+    assert response.status_code == 201
+
+
+def test_expired_holds_go_back_on_sale(app, client):
+    now = [datetime(2030, 1, 1, 12, 0)]
+    app.extensions["seat_holds"].clock = lambda: now[0]
+    with app.app_context():
+        db.session.get(Ticket, 5).quantity_available = 10
+        db.session.commit()
+
+    holder = _auth(app, "organizer@example.com")
+    assert client.post("/api/holds/", headers=holder,
+                       json={"ticket_id": 5, "quantity": 4}).status_code == 201
+    response = client.post("/api/holds/", headers=_auth(app), json={"ticket_id": 5, "quantity": 7})
+    assert response.status_code == 409
+
+    now[0] += timedelta(seconds=300)
+    response = client.post("/api/holds/", headers=holder, json={"ticket_id": 5, "quantity": 3})
+    assert response.get_json()["expires_in"] == 600   # renewed, one seat given back
+    with app.app_context():
+        assert db.session.get(Ticket, 5).quantity_available == 7
+
+    now[0] += timedelta(seconds=601)
+    assert client.get("/api/holds/", headers=holder).get_json() == []
+    result = app.test_cli_runner().invoke(args=["expire-holds"])
+    assert result.output == "expired 1 holds\n"
+    with app.app_context():
+        assert db.session.get(Ticket, 5).quantity_available == 10
+        assert SeatHold.query.count() == 0
+
+    # a second sweep finds nothing to give back
+    result = app.test_cli_runner().invoke(args=["expire-holds"])
+    assert result.output == "expired 0 holds\n"
+    with app.app_context():
+        assert db.session.get(Ticket, 5).quantity_available == 10
+
+
+def test_holds_are_shared_between_worker_processes(app, client, other_worker):
+    other_client = other_worker.test_client()
+    with app.app_context():
+        db.session.get(Ticket, 2).quantity_available = 3
+        db.session.commit()
+
+    holder = _auth(app, "organizer@example.com")
+    assert client.post("/api/holds/", headers=holder,
+                       json={"ticket_id": 2, "quantity": 2}).status_code == 201
+
+    mine = other_client.get("/api/holds/", headers=holder).get_json()
+    assert [(h["ticket_id"], h["quantity"]) for h in mine] == [(2, 2)]
+    response = other_client.post("/api/purchases/", headers=_auth(app),
+                                 json={"tickets": [{"ticket_id": 2, "quantity": 2}]})
+    assert response.status_code == 409
+    assert other_client.post("/api/holds/checkout", headers=holder, json={}).status_code == 201
+    assert client.get("/api/holds/", headers=holder).get_json() == []
+
+
+def test_concurrent_holds_and_purchases_never_oversell(app):
+    stock = 20
+    with app.app_context():
+        db.session.get(Ticket, 2).quantity_available = stock
+        for i in range(8):
+            db.session.add(Customer(email=f"holder{i}@example.com", password_hash="-",
+                                    registration_date=datetime(2030, 1, 1)))
+        db.session.commit()
+
+    def holder(i):
+        client = app.test_client()
+        client.post("/api/holds/", headers=_auth(app, f"holder{i}@example.com"),
+                    json={"ticket_id": 2, "quantity": 3})
+
+    def buyer():
+        client = app.test_client()
+        for _ in range(3):
+            client.post("/api/purchases/", headers=_auth(app),
+                        json={"tickets": [{"ticket_id": 2, "quantity": 1}]})
+
+    threads = [threading.Thread(target=holder, args=(i,)) for i in range(8)]
+    threads += [threading.Thread(target=buyer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with app.app_context():
+        left = db.session.get(Ticket, 2).quantity_available
+        held = db.session.query(func.sum(SeatHold.quantity)).scalar() or 0
+        sold = (
+            db.session.query(func.sum(PurchaseTicket.quantity))
+            .filter(PurchaseTicket.ticket_id == 2)
+            .scalar()
+        ) or 0
+    assert left >= 0
+    assert left + held + sold == stock
+
+
+def test_ticket_etag_changes_with_purchases_and_holds(app, client):
+    etag = client.get("/api/event-tickets/1").headers["ETag"]
+    assert client.get("/api/event-tickets/1",
+                      headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/api/purchases/", headers=_auth(app),
+                json={"tickets": [{"ticket_id": 1, "quantity": 1}]})
+    response = client.get("/api/event-tickets/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    client.post("/api/holds/", headers=_auth(app), json={"ticket_id": 2, "quantity": 1})
+    response = client.get("/api/event-tickets/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert next(t for t in response.get_json() if t["ticket_id"] == 2)["quantity_available"] == 199
+
+
+def test_identity_is_resolved_from_cache_and_follows_role_changes(app, client, count_queries):
+    admin = _auth(app, "organizer@example.com")
+    assert client.get("/api/admin/events", headers=admin).status_code == 200
+    assert client.get("/api/auth/me", headers=admin).status_code == 200
+
+    count_queries.clear()
+    client.get("/api/auth/me", headers=admin)
+    assert not any("FROM customer" in s for s in count_queries)
+
+    buyer = _auth(app)
+    assert client.get("/api/admin/events", headers=buyer).status_code == 403
+    with app.app_context():
+        db.session.get(Customer, 2).role = "admin"
+        db.session.commit()
+        customer_changed.send(app, email="test@example.com")
+    assert client.get("/api/admin/events", headers=buyer).status_code == 200
+
+    # unknown accounts aren't cached as missing
+    assert client.get("/api/holds/", headers=_auth(app, "new@example.com")).status_code == 404
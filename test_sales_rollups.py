@@ -0,0 +1,194 @@
+"""
+Tests for the sales rollups (/api/admin/stats, refunds, rebuild) and inventory reconciliation
+"""
+from datetime import datetime, timedelta
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event, select
+from sqlalchemy.dialects import mysql
+
+from backend.db import db
+from backend.models import Event, EventSales, Ticket, TicketSales
+from backend.services import sales_rollups
+
+
+def _auth(app, email):
+    with app.app_context():
+        token = create_access_token(identity=email)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _buy(app, client, *tickets):
+    response = client.post("/api/purchases/", headers=_auth(app, "test@example.com"),
+                           json={"tickets": [{"ticket_id": t, "quantity": q} for t, q in tickets]})
+    assert response.status_code == 201
+    return response.get_json()["purchase_id"]
+
+
+def test_stats_follow_purchases_and_refunds(app, client, count_queries):
+    first = _buy(app, client, (1, 2), (2, 1))   # event 1: 2 x 75 + 1 x 150
+    _buy(app, client, (1, 1), (3, 4))           # event 1: 75, event 2: 4 x 75
+
+    count_queries.clear()
+    stats = client.get("/api/admin/stats", headers=_auth(app, "organizer@example.com")).get_json()
+    assert len(count_queries) <= 4  # identity + three rollup reads, no PURCHASE_TICKET scan
+    assert not any("PURCHASE_TICKET" in s for s in count_queries)
+
+    assert stats["totals"] == {"events": 20, "tickets_sold": 8, "revenue": 675.0,
+                               "refunded_amount": 0.0}
+    event = stats["events"][0]
+    assert (event["event_id"], event["tickets_sold"], event["revenue"]) == (1, 4, 375.0)
+    assert event["purchases"] == 2
+    assert event["sell_through"] == 0.004
+    assert [(t["ticket_type"], t["tickets_sold"], t["revenue"]) for t in event["tiers"]] == [
+        ("General Admission", 3, 225.0), ("VIP", 1, 150.0),
+    ]
+    assert sum(h["tickets_sold"] for h in stats["hourly"]) == 8
+
+    response = client.post(f"/api/purchases/{first}/refund", headers=_auth(app, "test@example.com"))
+    assert response.get_json()["payment_status"] == "Refunded"
+    response = client.post(f"/api/purchases/{first}/refund", headers=_auth(app, "test@example.com"))
+    assert response.status_code == 409
+
+    stats = client.get("/api/admin/stats", headers=_auth(app, "organizer@example.com")).get_json()
+    event = stats["events"][0]
+    assert (event["tickets_sold"], event["revenue"], event["purchases"]) == (1, 75.0, 1)
+    assert (event["tickets_refunded"], event["refunded_amount"]) == (3, 300.0)
+
+    with app.app_context():
+        assert db.session.get(Ticket, 1).quantity_available == 799
+        assert db.session.get(Event, 1).tickets_sold == 1
+
+
+def test_rebuild_command_matches_incremental_rollups(app, client):
+    first = _buy(app, client, (1, 2), (2, 1))
+    _buy(app, client, (1, 1), (3, 4))
+    client.post(f"/api/purchases/{first}/refund", headers=_auth(app, "organizer@example.com"))
+
+    def snapshot():
+        with app.app_context():
+            return (
+                sorted((r.event_id, r.tickets_sold, r.revenue, r.purchases, r.tickets_refunded,
+                        r.refunded_amount) for r in EventSales.query),
+                sorted((r.ticket_id, r.tickets_sold, r.revenue, r.tickets_refunded)
+                       for r in TicketSales.query if r.tickets_sold or r.tickets_refunded),
+            )
+
+    incremental = snapshot()
+    result = app.test_cli_runner().invoke(args=["rebuild-sales-rollups"])
+    assert "from 4 purchase lines" in result.output
+    assert snapshot() == incremental
+
+
+def test_rebuild_locks_writers_out_before_reading(app):
+    statements = []
+
+    def record(conn, cursor, sql, *args):
+        statements.append(" ".join(sql.replace('"', "").split()))
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", record)
+        sales_rollups.rebuild_rollups()
+
+    # the ticket tiers are locked and the rollups cleared before PURCHASE_TICKET is read
+    assert statements[0] == "SELECT TICKET.ticket_id FROM TICKET ORDER BY TICKET.ticket_id"
+    assert [s.split()[2] for s in statements[1:4]] == [
+        "EVENT_SALES_HOURLY", "TICKET_SALES", "EVENT_SALES",
+    ]
+    assert "PURCHASE_TICKET" in statements[4]
+    locking = select(Ticket.ticket_id).with_for_update()
+    assert "FOR UPDATE" in str(locking.compile(dialect=mysql.dialect()))
+
+
+def test_only_the_buyer_or_an_admin_can_refund(app, client):
+    purchase_id = _buy(app, client, (1, 1))
+    with app.app_context():
+        db.session.execute(db.text(
+            "INSERT INTO customer (email, password_hash, role, registration_date) "
+            "VALUES ('other@example.com', '-', 'user', '2030-01-01')"
+        ))
+        db.session.commit()
+
+    response = client.post(f"/api/purchases/{purchase_id}/refund",
+                           headers=_auth(app, "other@example.com"))
+    assert response.status_code == 404
+
+
+def test_buyers_cannot_refund_once_the_event_is_over_or_close(app, client):
+    over = _buy(app, client, (1, 1))    # event 1
+    close = _buy(app, client, (3, 1))   # event 2
+    with app.app_context():
+        db.session.get(Event, 1).status = "Completed"
+        db.session.get(Event, 2).event_date = datetime.now() + timedelta(hours=3)
+        db.session.commit()
+
+    for purchase_id in (over, close):
+        response = client.post(f"/api/purchases/{purchase_id}/refund",
+                               headers=_auth(app, "test@example.com"))
+        assert response.status_code == 409
+        assert response.get_json() == {"error": "Refunds for this purchase have closed"}
+    with app.app_context():
+        assert db.session.get(Event, 1).tickets_sold == 1
+
+    # the organizer still can
+    response = client.post(f"/api/purchases/{over}/refund",
+                           headers=_auth(app, "organizer@example.com"))
+    assert response.status_code == 200
+
+
+def test_organizers_refund_only_their_own_events(app, client):
+    purchase_id = _buy(app, client, (1, 1))   # event 1: organizer@example.com
+    with app.app_context():
+        # organizing event 2 makes b@example.com an admin too
+        db.session.execute(db.text(
+            "INSERT INTO customer (email, password_hash, role, registration_date) "
+            "VALUES ('b@example.com', '-', 'user', '2030-01-01')"
+        ))
+        db.session.get(Event, 2).organizer_email = "b@example.com"
+        db.session.commit()
+
+    response = client.post(f"/api/purchases/{purchase_id}/refund",
+                           headers=_auth(app, "b@example.com"))
+    assert response.status_code == 404
+    assert response.get_json() == {"error": "Purchase not found"}
+    with app.app_context():
+        assert db.session.get(Event, 1).tickets_sold == 1
+        assert EventSales.query.filter_by(event_id=1).one().tickets_refunded == 0
+
+    response = client.post(f"/api/purchases/{purchase_id}/refund",
+                           headers=_auth(app, "organizer@example.com"))
+    assert response.status_code == 200
+
+
+def test_reconcile_reports_and_repairs_counter_drift(app, client, tmp_path):
+    _buy(app, client, (1, 2), (2, 1))
+    with app.app_context():
+        db.session.get(Event, 1).tickets_sold = 10   # drifted
+        db.session.get(Event, 7).tickets_sold = 4    # nothing was sold
+        db.session.get(Ticket, 3).quantity_available = 900  # tiers now offer 1100 seats
+        db.session.commit()
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["reconcile-inventory", "--chunk-size", "3", "--pause", "0"])
+    assert "event 1: tickets_sold is 10, expected 3\n" in result.output
+    assert "event 2: tier_capacity is 1100, expected 1000" in result.output
+    assert "checked 20 events after event 0: 3 problems, 0 repaired" in result.output
+
+    result = runner.invoke(args=["reconcile-inventory", "--repair", "--pause", "0"])
+    assert "expected 3 -> repaired" in result.output
+    with app.app_context():
+        assert db.session.get(Event, 1).tickets_sold == 3
+        assert db.session.get(Event, 7).tickets_sold == 0
+
+
+def test_reconcile_resumes_from_its_checkpoint(app, tmp_path):
+    from backend.services.reconcile import reconcile_inventory
+
+    checkpoint = str(tmp_path / "reconcile.json")
+    with open(checkpoint, "w") as f:
+        f.write('{"last_event_id": 15}')
+
+    with app.app_context():
+        result = reconcile_inventory(chunk_size=2, pause=0, checkpoint=checkpoint)
+    assert (result["resumed_from"], result["events"]) == (15, 5)
+    assert not (tmp_path / "reconcile.json").exists()
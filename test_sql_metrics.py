@@ -0,0 +1,82 @@
+"""
+Tests for the per-request SQL instrumentation (utils/sql_metrics.py)
+"""
+import pytest
+from flask_jwt_extended import create_access_token
+
+from backend.models import Event, Ticket
+from backend.utils.sql_metrics import NPlusOneDetected, fingerprint
+
+
+def _admin(app):
+    with app.app_context():
+        token = create_access_token(identity="organizer@example.com",
+                                    additional_claims={"role": "admin"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _add_loop_route(app):
+    # the classic N+1: one tickets query per event
+    @app.route("/tiers-per-event")
+    def tiers_per_event():
+        return {str(event.event_id): len(Ticket.query.filter_by(event_id=event.event_id).all())
+                for event in Event.query.all()}
+
+
+def test_fingerprint_folds_values_and_in_lists():
+    a = fingerprint("SELECT * FROM event WHERE event_id IN (?, ?, ?) AND status = 'Upcoming'")
+    b = fingerprint("SELECT *\n  FROM event WHERE event_id IN (?) AND status = 'Sold Out'")
+    assert a == b == "SELECT * FROM event WHERE event_id IN (?) AND status = ?"
+    assert fingerprint("SELECT 1 LIMIT %s") == fingerprint("SELECT 2 LIMIT %(limit)s")
+
+
+def test_server_timing_header(client):
+    response = client.get("/api/events/1")
+
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'queries", app;dur=' in timing
+
+
+def test_n_plus_one_fails_the_request_in_tests(app, client):
+    _add_loop_route(app)
+
+    with pytest.raises(NPlusOneDetected, match="GET /tiers-per-event"):
+        client.get("/tiers-per-event")
+
+
+def test_admin_metrics_aggregate_per_route(app, client):
+    app.config["SQL_N_PLUS_ONE_RAISE"] = False
+    _add_loop_route(app)
+
+    assert client.get("/tiers-per-event").status_code == 200
+    for _ in range(3):
+        client.get("/api/events/1")
+
+    assert client.get("/api/admin/metrics/sql").status_code == 401
+    stats = client.get("/api/admin/metrics/sql", headers=_admin(app)).get_json()
+    routes = stats["routes"]
+
+    details = routes["GET /api/events/<int:event_id>"]
+    assert details["requests"] == 3
+    assert details["n_plus_one_requests"] == 0
+
+    loop = routes["GET /tiers-per-event"]
+    assert loop["n_plus_one_requests"] == 1
+    assert loop["statements_max"] >= 3
+    assert 'FROM "TICKET"' in loop["n_plus_one_shapes"][0]["sql"]
+
+
+def test_slow_queries_keep_redacted_params_and_plan(app, client):
+    app.extensions["slow_queries"].threshold_ms = 0  # everything is slow
+    client.post("/api/auth/login", json={"email": "test@example.com", "password": "test123"})
+
+    response = client.get("/api/admin/metrics/slow-queries", headers=_admin(app))
+    queries = response.get_json()["queries"]
+
+    lookup = next(q for q in queries if q["request"] == "POST /api/auth/login")
+    assert "FROM customer" in lookup["sql"]
+    assert lookup["params"][0] == "<redacted str, 16>"
+    assert "test@example.com" not in response.get_data(as_text=True)
+    assert lookup["duration_ms"] >= 0
+    assert any("SEARCH customer" in row["detail"] for row in lookup["plan"])
@@ -0,0 +1,77 @@
+"""
+`flask generate-data` (services/synthetic_data.py): consistent, skewed,
+reproducible data, inserted or written as LOAD DATA files.
+"""
+import pytest
+from sqlalchemy import func
+
+from backend.app import create_app
+from backend.db import db
+from backend.models import Customer, Event, Purchase, PurchaseTicket, Ticket
+from backend.services.reconcile import reconcile_inventory
+from backend.services.synthetic_data import CsvSink, generate
+
+
+@pytest.fixture
+def empty_app(tmp_path):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'generated.db'}",
+        "HASHER_WORKERS": 0,
+        "PBKDF2_ROUNDS": 1000,
+    })
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_generated_data_is_consistent_and_skewed(empty_app):
+    result = empty_app.test_cli_runner().invoke(args=[
+        "generate-data", "--events", "300", "--customers", "2000", "--purchases", "8000",
+    ])
+    assert result.exit_code == 0, result.output
+
+    with empty_app.app_context():
+        assert db.session.query(func.count(Event.event_id)).scalar() == 300
+        assert db.session.query(func.count(Customer.customer_id)).scalar() == 2000
+        assert db.session.query(func.count(Purchase.purchase_id)).scalar() == 8000
+
+        # counters match the purchase lines exactly
+        report = reconcile_inventory(pause=0)
+        assert report["events"] == 300 and report["drift"] == []
+
+        # skewed: the busiest events sell out, most sell far less
+        sold_out = db.session.query(func.count()).filter(
+            Event.tickets_sold == Event.total_tickets).scalar()
+        assert sold_out > 0
+        lines_per_event = sorted(
+            (n for _, n in db.session.query(Ticket.event_id, func.count(PurchaseTicket.purchase_ticket_id))
+             .join(PurchaseTicket, PurchaseTicket.ticket_id == Ticket.ticket_id)
+             .group_by(Ticket.event_id)),
+            reverse=True,
+        )
+        assert sum(lines_per_event[:30]) > sum(lines_per_event) / 2
+
+        # generated customers can log in with the shared password
+        customer = db.session.get(Customer, 100)
+        assert customer.check_password("password123")
+
+
+def test_generate_refuses_a_database_with_data(app):
+    result = app.test_cli_runner().invoke(args=["generate-data", "--events", "10"])
+    assert result.exit_code != 0
+    assert "already has rows" in result.output
+
+
+def test_csv_output_is_reproducible(empty_app, tmp_path):
+    with empty_app.app_context():
+        for name in ("a", "b"):
+            generate(CsvSink(str(tmp_path / name)), events=50, customers=200, purchases=500, seed=7)
+
+    for table in ("EVENT", "TICKET", "PURCHASE", "PURCHASE_TICKET"):
+        assert (tmp_path / "a" / f"{table}.csv").read_bytes() == (tmp_path / "b" / f"{table}.csv").read_bytes()
+    load = (tmp_path / "a" / "load.sql").read_text()
+    assert "LOAD DATA LOCAL INFILE 'PURCHASE_TICKET.csv' INTO TABLE PURCHASE_TICKET" in load